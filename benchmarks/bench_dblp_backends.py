@@ -0,0 +1,71 @@
+"""
+HTML解析后端与dblp XML结构化数据后端的对比基准测试
+使用本地替身服务器提供的样本页面，比较两种后端的耗时、传输字节数，并校验结果一致
+
+用法:
+    python benchmarks/bench_dblp_backends.py [--entries 500] [--latency 0.0]
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from fixtures import build_site, serve_site
+
+from crawlers import web_crawler
+from crawlers.http_client import set_cache_options, get_client, reset_client
+from crawlers.rate_limiter import set_rate_limit
+
+
+def crawl(base_url, journals, conferences):
+    """按 main.process_venue_link 的主要路径抓取所有期刊和会议，返回 {页面: {配置名称: 论文列表}}"""
+    results = {}
+    for name in journals:
+        for year, volume_link in web_crawler.get_journal_volume_links(f"{base_url}/db/journals/{name}/"):
+            results[(year, volume_link)] = web_crawler.find_blockchain_papers(volume_link)
+    for name in conferences:
+        for year, contents_link in web_crawler.process_conference_page(f"{base_url}/db/conf/{name}/"):
+            results[(year, contents_link)] = web_crawler.find_blockchain_papers(contents_link)
+    return results
+
+def run_backend(backend, base_url, journals, conferences):
+    """使用指定后端完整抓取一次，返回 (结果, 耗时, 网络统计)"""
+    web_crawler.set_crawl_backend(backend)
+    web_crawler.get_frontier().clear()
+    reset_client()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = crawl(base_url, journals, conferences)
+    elapsed = time.perf_counter() - start
+    return results, elapsed, get_client().get_stats()
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML与XML后端对比基准测试')
+    parser.add_argument('--entries', type=int, default=500, help='每个目录页的论文条目数')
+    parser.add_argument('--latency', type=float, default=0.0, help='替身服务器为每个请求注入的延迟（秒）')
+    args = parser.parse_args()
+
+    journals = ("tocs", "tos")
+    conferences = ("fast", "dac")
+    set_cache_options(enabled=False)
+    set_rate_limit(0)
+
+    def site_factory(base_url):
+        return build_site(base_url, journals, conferences, entries_per_page=args.entries)
+
+    with serve_site(site_factory, latency=args.latency) as base_url:
+        html_results, html_time, html_stats = run_backend('html', base_url, journals, conferences)
+        xml_results, xml_time, xml_stats = run_backend('xml', base_url, journals, conferences)
+
+    pages = len(html_results)
+    papers = sum(len(p) for profile_papers in html_results.values() for p in profile_papers.values())
+    print(f"页面数: {pages}，每页条目数: {args.entries}，匹配论文数: {papers}")
+    print(f"{'后端':<6}{'耗时(秒)':>10}{'请求数':>8}{'传输字节':>14}")
+    print(f"{'html':<8}{html_time:>10.2f}{html_stats['requests']:>10}{html_stats['wire_bytes']:>14}")
+    print(f"{'xml':<8}{xml_time:>10.2f}{xml_stats['requests']:>10}{xml_stats['wire_bytes']:>14}")
+    if html_time:
+        print(f"XML后端耗时为HTML后端的 {xml_time / html_time:.0%}")
+    print("结果一致" if html_results == xml_results else "结果不一致！")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+论文条目提取基准测试
+在一个包含数千个条目的目录页上，比较原实现（统计条目数、写入论文库、每组关键词配置各自按标题查找并
+回到父元素重新提取DOI，备用方法再按条目逐个遍历）与单次遍历提取条目后统一匹配的耗时，
+分别测试只匹配标题和标题无结果时按条目全文匹配两种匹配范围，并校验两者找到的论文一致。
+原实现的备用方法会同时遍历 li.entry 和其中的 cite.data，同一论文被再次加入，链接为目录页自身的锚点；
+校验时去掉这些链接指向目录页自身的重复论文后再比较
+
+用法:
+    python benchmarks/bench_entry_extraction.py [--entries 5000] [--profiles 3]
+"""
+import argparse
+import contextlib
+import io
+import re
+import time
+
+from fixtures import make_toc_pages
+
+from crawlers import web_crawler
+from crawlers.keyword_matcher import KeywordProfile
+from utils.paper import Paper
+
+BASE_URL = "https://dblp.org"
+
+
+def legacy_extract_doi(parent):
+    """原 web_crawler.extract_doi 的实现：每次调用都重新查找下拉菜单、全部链接和条目文本"""
+    if not parent:
+        return None
+
+    dropdown = parent.select_one('.drop-down')
+    if dropdown:
+        head_div = dropdown.select_one('.head')
+        if head_div:
+            link = head_div.find('a')
+            if link and link.get('href'):
+                return link.get('href')
+
+    for link in parent.find_all('a'):
+        href = link.get('href', '')
+        if 'doi.org' in href:
+            return href
+        if href.startswith('https://') and ('conference' in href or 'conf' in href or 'proceedings' in href or 'paper' in href or 'presentation' in href):
+            return href
+        title = link.get('title', '')
+        if 'doi.org' in title or 'DOI' in title:
+            if 'doi.org' in title:
+                match = re.search(r'(https?://doi\.org/\S+)(?:\s|"|\'|$)', title)
+                if match:
+                    return match.group(1)
+            if href and ('doi' in href or 'DOI' in href):
+                return href
+
+    text = parent.get_text()
+    match = re.compile(r'(https?://doi\.org/\S+?)(?:\s|\)|$)').search(text)
+    if match:
+        return match.group(1)
+
+    for link in parent.find_all('a'):
+        href = link.get('href', '')
+        if href.startswith('https://'):
+            return href
+    return None
+
+def legacy_parse_blockchain_papers(soup, profile):
+    """原 web_crawler.parse_blockchain_papers 的实现（去掉日志输出）"""
+    papers = []
+    seen = set()
+    title_elements = soup.select('span.title')
+    if not title_elements:
+        title_elements = soup.select('li.entry .title, li.entry div.data cite, li.entry')
+
+    for element in title_elements:
+        title = element.get_text().strip()
+        if profile.match(title)[0] and 10 < len(title) < 300:
+            parent_entry = element.find_parent('li.entry') or element.find_parent('li') or element.find_parent('div.entry') or element.find_parent('div')
+            paper = Paper(re.sub(r'\s+', ' ', title).strip(), legacy_extract_doi(parent_entry))
+            if paper.key not in seen:
+                seen.add(paper.key)
+                papers.append(paper)
+
+    if not papers and profile.match_scope != 'title':
+        for entry in soup.select('li.entry, .data, .publ-list > *'):
+            if profile.match(entry.get_text())[0]:
+                title = (entry.select_one('.title') or entry).get_text().strip()
+                if 10 < len(title) < 300:
+                    paper = Paper(re.sub(r'\s+', ' ', title).strip(), legacy_extract_doi(entry))
+                    if paper.key not in seen:
+                        seen.add(paper.key)
+                        papers.append(paper)
+    return papers
+
+def legacy_match_page(soup, profiles):
+    """原 match_page_papers 的流程：统计条目数，提取条目写入论文库，再按每组配置分别查找论文"""
+    count = len(soup.select('li.entry'))
+    stored = []
+    for entry in soup.select('li.entry'):
+        title_element = entry.select_one('span.title')
+        if title_element is not None and title_element.get_text().strip():
+            stored.append((title_element.get_text().strip(), legacy_extract_doi(entry), entry.get_text()))
+    papers = {profile.name: legacy_parse_blockchain_papers(soup, profile) for profile in profiles}
+    return count, len(stored), papers
+
+def drop_self_links(papers, toc_url):
+    """去掉链接为目录页自身锚点的论文，返回 (去掉后的结果, 去掉的论文数)"""
+    result = {}
+    dropped = 0
+    for name, profile_papers in papers.items():
+        result[name] = [paper for paper in profile_papers if not (paper.link or '').startswith(toc_url + '#')]
+        dropped += len(profile_papers) - len(result[name])
+    return result, dropped
+
+def single_pass_match_page(soup, profiles):
+    """单次遍历提取条目，条目数、论文库和各组配置共用提取结果"""
+    entries = web_crawler.parse_page_entries(soup)
+    web_crawler.set_keyword_profiles(profiles)
+    with contextlib.redirect_stdout(io.StringIO()):
+        papers = web_crawler.select_profile_papers(entries)
+    return len(entries), len(entries), papers
+
+def make_profiles(count, match_scope):
+    """生成 count 组关键词配置；按条目全文匹配时关键词只出现在作者中，标题匹配无结果，会进入备用方法"""
+    if match_scope == 'title':
+        keywords = ["Systems", "Storage", "Memory", "Cache", "Network"]
+    else:
+        keywords = ["Alice Author", "Bob Writer", "Venue", "Alice", "Bob"]
+    return [KeywordProfile(f"p{index}", [keywords[index % len(keywords)]], 'AND', False, match_scope)
+            for index in range(count)]
+
+def main():
+    parser = argparse.ArgumentParser(description='论文条目提取基准测试')
+    parser.add_argument('--entries', type=int, default=5000, help='目录页的论文条目数')
+    parser.add_argument('--profiles', type=int, default=3, help='关键词配置组数')
+    args = parser.parse_args()
+
+    key = "conf/fast/fast2025"
+    html, _ = make_toc_pages(key, "2025", args.entries, seed=7, base_url=BASE_URL)
+    soup = web_crawler.parse_html(html, web_crawler.SUBTREE_ENTRIES)
+    print(f"条目数: {args.entries}，页面大小: {len(html) / (1024 * 1024):.1f} MB，关键词配置: {args.profiles} 组")
+    print(f"{'匹配范围':<10}{'原实现(秒)':>12}{'单次遍历(秒)':>14}{'加速比':>8}  结果")
+    for match_scope in ('title', 'entry'):
+        profiles = make_profiles(args.profiles, match_scope)
+
+        start = time.perf_counter()
+        expected = legacy_match_page(soup, profiles)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = single_pass_match_page(soup, profiles)
+        single_time = time.perf_counter() - start
+
+        expected_papers, dropped = drop_self_links(expected[2], f"{BASE_URL}/db/{key}.html")
+        same = expected[:2] == actual[:2] and expected_papers == actual[2]
+        found = sum(len(papers) for papers in actual[2].values())
+        speedup = legacy_time / single_time if single_time else float('inf')
+        note = f"，原实现另有 {dropped} 篇重复" if dropped else ""
+        print(f"{match_scope:<12}{legacy_time:>12.2f}{single_time:>16.2f}{speedup:>9.1f}x"
+              f"  {'一致' if same else '不一致！'}（{found} 篇{note}）")
+
+if __name__ == "__main__":
+    main()
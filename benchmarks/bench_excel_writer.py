@@ -0,0 +1,104 @@
+"""
+Excel写入基准测试
+比较普通工作簿写入后再遍历全部单元格设置列宽和样式的旧实现，
+与只写模式流式写入、增量计算列宽并使用命名样式的 TopicWorkbook 在 1万、10万行专题下的耗时和峰值内存，
+并校验两者生成的内容一致
+
+用法:
+    python benchmarks/bench_excel_writer.py [--rows 10000 100000]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from fixtures import make_titles
+
+import openpyxl
+from openpyxl.styles import Alignment, Font
+from openpyxl.utils import get_column_letter
+
+from utils.excel_handler import TopicWorkbook, OVERVIEW_SHEET, OVERVIEW_COLUMNS
+from utils.paper import Paper
+
+
+def make_papers(count):
+    """生成 count 条与累计结果格式相同的论文条目"""
+    papers = []
+    for index, title in enumerate(make_titles(count, seed=7)):
+        venue = "TOCS" if index % 2 else "FAST"
+        papers.append(Paper(title, f"https://doi.org/10.1000/x{index}", venue=venue, year=2024 + index % 2))
+    return papers
+
+def legacy_save(papers, output_file):
+    """原实现：普通工作簿写入全部行，再逐列计算列宽、逐个单元格设置对齐和字体"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = OVERVIEW_SHEET
+    ws.append(OVERVIEW_COLUMNS)
+    workbook = TopicWorkbook(output_file)
+    workbook.add_papers(papers)
+    for row in workbook.rows:
+        ws.append(row)
+
+    for column in ws.columns:
+        max_length = 0
+        column_letter = get_column_letter(column[0].column)
+        for cell in column:
+            if cell.value:
+                max_length = max(max_length, len(str(cell.value)))
+        ws.column_dimensions[column_letter].width = min(max(max_length + 2, 10), 50)
+    for cell in ws[1]:
+        cell.font = Font(bold=True)
+    for row in ws.iter_rows():
+        for cell in row:
+            cell.alignment = Alignment(horizontal='left', vertical='center')
+    wb.save(output_file)
+
+def streaming_save(papers, output_file):
+    """新实现：TopicWorkbook 累计行后以只写模式一次写入"""
+    workbook = TopicWorkbook(output_file)
+    workbook.add_papers(papers)
+    workbook.save()
+
+def measure(func, papers, output_file):
+    """返回 (耗时秒数, 峰值内存MB)；耗时与内存分两次测量，避免内存跟踪影响计时"""
+    start = time.perf_counter()
+    func(papers, output_file)
+    elapsed = time.perf_counter() - start
+
+    os.remove(output_file)
+    tracemalloc.start()
+    func(papers, output_file)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+def read_sheet(output_file):
+    """读取结果文件的内容、列宽和表头字体，用于校验两种实现的输出一致"""
+    wb = openpyxl.load_workbook(output_file)
+    ws = wb[OVERVIEW_SHEET]
+    values = [[cell.value for cell in row] for row in ws.iter_rows()]
+    widths = {key: dim.width for key, dim in ws.column_dimensions.items()}
+    return values, widths, ws['A1'].font.b, ws['B2'].alignment.horizontal
+
+def main():
+    parser = argparse.ArgumentParser(description='Excel写入基准测试')
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000], help='每个专题的行数')
+    args = parser.parse_args()
+
+    print(f"{'行数':<8}{'旧实现(秒)':>12}{'流式(秒)':>10}{'旧实现峰值(MB)':>16}{'流式峰值(MB)':>14}  结果")
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.rows:
+            papers = make_papers(rows)
+            legacy_file = os.path.join(directory, f"legacy_{rows}.xlsx")
+            streaming_file = os.path.join(directory, f"streaming_{rows}.xlsx")
+            legacy_time, legacy_peak = measure(legacy_save, papers, legacy_file)
+            streaming_time, streaming_peak = measure(streaming_save, papers, streaming_file)
+            same = read_sheet(legacy_file) == read_sheet(streaming_file)
+            print(f"{rows:<10}{legacy_time:>12.2f}{streaming_time:>12.2f}{legacy_peak:>16.1f}{streaming_peak:>16.1f}"
+                  f"  {'一致' if same else '不一致！'}")
+
+if __name__ == "__main__":
+    main()
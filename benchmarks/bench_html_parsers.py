@@ -0,0 +1,117 @@
+"""
+HTML解析器基准测试
+在样本页面（会议索引页、期刊索引页和卷期目录页）上比较各HTML解析器解析整个页面与只解析提取方式所需部分
+（论文条目 li.entry、链接 <a>，或年份标题和列表项）的耗时和峰值内存，并校验提取出的论文和卷期/目录链接一致。
+原实现为 html.parser 解析requests解码后的文本并构建整个页面的树
+
+峰值内存由 tracemalloc 统计，只包含Python对象（BeautifulSoup树），不包含lxml在C层的临时缓冲区
+
+用法:
+    python benchmarks/bench_html_parsers.py [--entries 500] [--pages 10]
+"""
+import argparse
+import contextlib
+import io
+import time
+import tracemalloc
+
+from fixtures import make_toc_pages, make_journal_index, make_conference_index
+
+from crawlers import web_crawler
+
+BASE_URL = "https://dblp.org"
+
+
+def make_pages(entries, pages):
+    """生成样本页面 [(页面类型, url, 原始字节)]"""
+    years = [str(year) for year in range(2025, 1999, -1)]
+    samples = [
+        ('conference', f"{BASE_URL}/db/conf/fast/", make_conference_index("fast", years, BASE_URL)[0]),
+        ('journal', f"{BASE_URL}/db/journals/tocs/",
+         make_journal_index("tocs", [(year - 1999, year) for year in range(2025, 1999, -1)], BASE_URL)[0]),
+    ]
+    for index in range(pages):
+        key = f"conf/fast/fast{2025 - index}"
+        html, _ = make_toc_pages(key, str(2025 - index), entries, seed=index, base_url=BASE_URL)
+        samples.append(('toc', f"{BASE_URL}/db/{key}.html", html))
+    return samples
+
+# 各类页面的提取方式需要的部分
+SUBTREES = {
+    'conference': web_crawler.SUBTREE_INDEX,
+    'journal': web_crawler.SUBTREE_LINKS,
+    'toc': web_crawler.SUBTREE_ENTRIES,
+}
+
+def parse_pages(samples, mode):
+    """按给定方式解析全部页面，返回解析结果列表"""
+    documents = []
+    for kind, url, html in samples:
+        if mode == 'legacy':
+            documents.append(web_crawler.parse_html(html.decode('utf-8')))
+        elif mode == 'full':
+            documents.append(web_crawler.parse_html(html))
+        else:
+            documents.append(web_crawler.parse_html(html, SUBTREES[kind]))
+    return documents
+
+def extract(samples, documents):
+    """从解析结果中提取论文、[contents]链接和卷期链接"""
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for (kind, url, _), soup in zip(samples, documents):
+            if kind == 'conference':
+                results.append(web_crawler.parse_conference_contents_links(soup, url))
+            elif kind == 'journal':
+                results.append(web_crawler.parse_journal_volume_links(soup, url))
+            else:
+                results.append(web_crawler.parse_profile_papers(soup))
+    return results
+
+def measure(samples, parser, mode):
+    """返回 (解析耗时秒数, 峰值内存MB, 提取结果)；耗时与内存分两次测量，避免内存跟踪影响计时"""
+    web_crawler.set_html_parser(parser)
+    start = time.perf_counter()
+    documents = parse_pages(samples, mode)
+    elapsed = time.perf_counter() - start
+    results = extract(samples, documents)
+    del documents
+
+    tracemalloc.start()
+    documents = parse_pages(samples, mode)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del documents
+    return elapsed, peak / (1024 * 1024), results
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML解析器基准测试')
+    parser.add_argument('--entries', type=int, default=500, help='每个目录页的论文条目数')
+    parser.add_argument('--pages', type=int, default=10, help='目录页数')
+    args = parser.parse_args()
+
+    samples = make_pages(args.entries, args.pages)
+    size = sum(len(html) for _, _, html in samples)
+    print(f"页面数: {len(samples)}，总大小: {size / (1024 * 1024):.1f} MB，每个目录页条目数: {args.entries}")
+    if not web_crawler.LXML_AVAILABLE:
+        print("未安装lxml，只测试 html.parser")
+
+    cases = [('html.parser', 'legacy'), ('html.parser', 'full'), ('html.parser', 'subtree')]
+    if web_crawler.LXML_AVAILABLE:
+        cases += [('lxml', 'full'), ('lxml', 'subtree')]
+
+    labels = {'legacy': '整页（文本，原实现）', 'full': '整页（字节）', 'subtree': '只解析所需部分'}
+    print(f"{'解析器':<14}{'方式':<20}{'耗时(秒)':>10}{'峰值(MB)':>10}  结果")
+    baseline = None
+    baseline_time = None
+    for parser_name, mode in cases:
+        elapsed, peak, results = measure(samples, parser_name, mode)
+        if baseline is None:
+            baseline, baseline_time = results, elapsed
+        same = results == baseline
+        speedup = baseline_time / elapsed if elapsed else 0
+        print(f"{parser_name:<14}{labels[mode]:<20}{elapsed:>10.2f}{peak:>10.1f}"
+              f"  {'一致' if same else '不一致！'}（{speedup:.1f}x）")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+关键词匹配基准测试
+比较逐个关键词构建正则的旧实现与预编译的 Aho-Corasick 匹配器在 1、10、100 个关键词下的耗时，
+并校验两者的匹配结果一致
+
+用法:
+    python benchmarks/bench_keyword_matcher.py [--titles 50000]
+"""
+import argparse
+import random
+import re
+import time
+
+from fixtures import make_titles
+
+from crawlers.keyword_matcher import KeywordMatcher
+
+
+def regex_match_keywords(text, keywords, mode='AND', word_boundary=False):
+    """原 web_crawler.match_keywords 的实现：每个标题对每个关键词重新构建正则"""
+    if not text or not keywords:
+        return False, []
+
+    matched = []
+    for k in keywords:
+        if not k:
+            continue
+        esc = re.escape(k).replace(r'\ ', r'\s+')
+        pattern = rf"\b{esc}\b" if word_boundary else esc
+        if re.search(pattern, text, re.IGNORECASE):
+            matched.append(k)
+
+    if mode == 'AND':
+        return (len(matched) == len([k for k in keywords if k])), matched
+    else:
+        return (len(matched) > 0), matched
+
+def make_keywords(count, seed=0):
+    """生成 count 个关键词，前两个为默认配置的关键词，其余为随机单词和短语"""
+    rng = random.Random(seed)
+    keywords = ["Fibonacci", "blockchain"][:count]
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    while len(keywords) < count:
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(4, 9)))
+        if rng.random() < 0.3:
+            word += " " + "".join(rng.choice(letters) for _ in range(rng.randint(3, 7)))
+        keywords.append(word)
+    return keywords
+
+def bench(titles, keywords, mode, word_boundary):
+    """返回 (旧实现耗时, 匹配器耗时, 结果是否一致)"""
+    start = time.perf_counter()
+    expected = [regex_match_keywords(t, keywords, mode, word_boundary)[0] for t in titles]
+    regex_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(keywords, mode, word_boundary)
+    actual = [matcher.match(t)[0] for t in titles]
+    matcher_time = time.perf_counter() - start
+    return regex_time, matcher_time, expected == actual
+
+def main():
+    parser = argparse.ArgumentParser(description='关键词匹配基准测试')
+    parser.add_argument('--titles', type=int, default=50000, help='参与匹配的标题数')
+    args = parser.parse_args()
+
+    titles = make_titles(args.titles, seed=42)
+    print(f"标题数: {len(titles)}")
+    print(f"{'关键词数':<6}{'模式':<6}{'词边界':<6}{'正则(秒)':>10}{'匹配器(秒)':>12}{'加速比':>8}  结果")
+    for count in (1, 10, 100):
+        keywords = make_keywords(count)
+        for mode in ('AND', 'OR'):
+            for word_boundary in (False, True):
+                regex_time, matcher_time, same = bench(titles, keywords, mode, word_boundary)
+                speedup = regex_time / matcher_time if matcher_time else float('inf')
+                print(f"{count:<10}{mode:<8}{str(word_boundary):<9}{regex_time:>10.3f}{matcher_time:>14.3f}"
+                      f"{speedup:>9.1f}x  {'一致' if same else '不一致！'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+dblp镜像调度与对冲请求的基准测试
+启动三个替身镜像，提供同一份样本站点：镜像A和B各自在不同的一小部分页面上长时间卡住（长尾延迟），
+镜像C始终返回503。依次抓取全部目录页，比较只使用镜像A与使用镜像池（熔断+对冲请求）的总耗时和P95延迟，
+并校验两次抓取的页面内容一致
+
+用法:
+    python benchmarks/bench_mirrors.py [--entries 50] [--stall 2.0] [--stall-ratio 0.05] [--latency 0.02]
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import time
+
+from fixtures import build_site, serve_site
+
+from crawlers.http_client import set_cache_options, get_client, reset_client
+from crawlers.mirror_pool import MirrorPool
+from crawlers.rate_limiter import set_rate_limit
+
+# 样本页面中的链接使用的主机，请求时由镜像池改写为各替身镜像
+SITE_BASE_URL = "https://dblp.org"
+
+
+def stall_latency(slot, stall, ratio, base_latency):
+    """返回按页面路径注入延迟的函数：哈希落在第 slot 段的页面卡住 stall 秒，其余页面延迟 base_latency 秒"""
+    buckets = max(1, round(1 / ratio))
+
+    def latency(path):
+        digest = int(hashlib.md5(path.encode('utf-8')).hexdigest(), 16)
+        return stall if digest % buckets == slot else base_latency
+    return latency
+
+def fetch_all(urls, pool):
+    """使用给定的镜像池依次抓取全部页面，返回 (页面内容, 总耗时, 每个页面耗时的P95, 实际发出的请求数, 镜像统计)"""
+    client = reset_client(mirrors=pool)
+    contents = {}
+    latencies = []
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for url in urls:
+            page_start = time.perf_counter()
+            contents[url] = client.get(url).content
+            latencies.append(time.perf_counter() - page_start)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    return contents, elapsed, p95, client.get_stats()["requests"], pool.get_stats()
+
+def main():
+    parser = argparse.ArgumentParser(description='dblp镜像调度与对冲请求基准测试')
+    parser.add_argument('--entries', type=int, default=50, help='每个目录页的论文条目数')
+    parser.add_argument('--stall', type=float, default=2.0, help='卡住的页面的延迟（秒）')
+    parser.add_argument('--stall-ratio', type=float, default=0.05, help='每个镜像上卡住的页面比例')
+    parser.add_argument('--latency', type=float, default=0.02, help='其余页面的延迟（秒）')
+    args = parser.parse_args()
+
+    site = build_site(SITE_BASE_URL, entries_per_page=args.entries)
+    urls = [SITE_BASE_URL + path for path in sorted(site) if path.endswith('.html')]
+    set_cache_options(enabled=False)
+    set_rate_limit(0)
+
+    def site_factory(base_url):
+        return site
+
+    with serve_site(site_factory, latency=stall_latency(0, args.stall, args.stall_ratio, args.latency)) as mirror_a, \
+            serve_site(site_factory, latency=stall_latency(1, args.stall, args.stall_ratio, args.latency)) as mirror_b, \
+            serve_site(site_factory, status=503) as mirror_c:
+        single_pool = MirrorPool([mirror_a], hedge=False)
+        single, single_time, single_p95, single_requests, _ = fetch_all(urls, single_pool)
+        # 对冲等待时间在样本不足时使用默认值，这里按替身服务器的正常延迟缩短，便于较快看到效果
+        pool = MirrorPool([mirror_a, mirror_b, mirror_c], hedge=True, hedge_default_delay=args.latency * 10)
+        pooled, pooled_time, pooled_p95, pooled_requests, mirror_stats = fetch_all(urls, pool)
+    get_client().close()
+
+    print(f"页面数: {len(urls)}，卡住的页面: 每个镜像约 {args.stall_ratio:.0%}（{args.stall:.1f} 秒），镜像C始终返回503")
+    print(f"{'方式':<10}{'耗时(秒)':>10}{'请求数':>8}{'页面P95(ms)':>10}")
+    print(f"{'单镜像':<9}{single_time:>12.2f}{single_requests:>10}{single_p95 * 1000:>10.0f}")
+    print(f"{'镜像池':<9}{pooled_time:>12.2f}{pooled_requests:>10}{pooled_p95 * 1000:>10.0f}")
+    print(f"对冲请求 {mirror_stats['hedged']} 次（对冲先返回 {mirror_stats['hedge_wins']} 次），"
+          f"熔断 {mirror_stats['breaker_opens']} 次")
+    if single_time:
+        print(f"镜像池耗时为单镜像的 {pooled_time / single_time:.0%}")
+    print("结果一致" if single == pooled else "结果不一致！")
+
+if __name__ == "__main__":
+    main()
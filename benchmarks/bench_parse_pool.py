@@ -0,0 +1,93 @@
+"""
+解析进程池基准测试
+由本地替身服务器提供一批卷期目录页，并发下载后分别在主进程的线程中解析和匹配、交给不同进程数的解析进程池，
+比较处理全部页面的耗时和吞吐量，并校验各种方式找到的论文一致。
+线程中解析受GIL限制，吞吐量不随线程数增加；进程池的吞吐量随CPU核数增加，核数不足时进程间传输反而带来额外开销
+
+用法:
+    python benchmarks/bench_parse_pool.py [--pages 40] [--entries 1000] [--workers 0 1 2 4] [--latency 0.01]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import time
+
+from fixtures import make_toc_pages, serve_site
+
+from crawlers import web_crawler, parse_pool
+from crawlers.async_crawler import async_find_blockchain_papers, reset_host_limits, set_max_concurrency_per_host
+from crawlers.http_client import set_cache_options, reset_client
+from crawlers.keyword_matcher import KeywordProfile
+from crawlers.rate_limiter import set_rate_limit
+
+
+def make_site(pages, entries):
+    """生成 pages 个目录页 {路径: 页面字节}"""
+    site = {}
+    for index in range(pages):
+        key = f"conf/fast/fast2025-{index}"
+        html, _ = make_toc_pages(key, "2025", entries, seed=index, base_url="https://dblp.org")
+        site[f"/db/{key}.html"] = html
+    return site
+
+async def crawl(urls):
+    """并发处理全部目录页，返回与 urls 顺序一致的结果"""
+    reset_host_limits()
+    return await asyncio.gather(*(async_find_blockchain_papers(url, "2025", reextract=True) for url in urls))
+
+def run(urls, workers):
+    """按给定解析进程数处理全部页面，返回 (耗时秒数, 结果)；进程池先预热，不计入启动子进程的时间"""
+    parse_pool.set_parse_workers(workers)
+    web_crawler.document_cache.clear()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if workers:
+            parse_pool.get_parse_pool().submit(os.getpid).result()
+        start = time.perf_counter()
+        results = asyncio.run(crawl(urls))
+        elapsed = time.perf_counter() - start
+    parse_pool.shutdown_parse_pool()
+    return elapsed, [{name: [(p.title, p.link, p.link_kind) for p in papers] for name, papers in result.items()}
+                     for result in results]
+
+def main():
+    parser = argparse.ArgumentParser(description='解析进程池基准测试')
+    parser.add_argument('--pages', type=int, default=40, help='目录页数')
+    parser.add_argument('--entries', type=int, default=1000, help='每个目录页的论文条目数')
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 1, 2, 4],
+                        help='解析进程数，0 表示在主进程的线程中解析')
+    parser.add_argument('--latency', type=float, default=0.01, help='每个请求注入的延迟（秒）')
+    args = parser.parse_args()
+
+    site = make_site(args.pages, args.entries)
+    set_cache_options(enabled=False)
+    set_rate_limit(0)
+    reset_client(mirrors=None)
+    set_max_concurrency_per_host(8)
+    web_crawler.set_keyword_profiles([
+        KeywordProfile("blockchain", ["Blockchain", "Ledger"], 'OR', False, 'title'),
+        KeywordProfile("author", ["Alice Author", "Sharding"], 'AND', False, 'entry'),
+    ])
+
+    size = sum(len(html) for html in site.values())
+    print(f"目录页数: {args.pages}，每页条目数: {args.entries}，总大小: {size / (1024 * 1024):.1f} MB，"
+          f"CPU核数: {os.cpu_count()}，HTML解析器: {web_crawler.html_parser}")
+    print(f"{'解析方式':<12}{'耗时(秒)':>10}{'页面/秒':>10}{'加速比':>8}  结果")
+    with serve_site(lambda base_url: site, latency=args.latency) as base_url:
+        urls = [base_url + path for path in sorted(site)]
+        baseline = None
+        baseline_time = None
+        for workers in args.workers:
+            elapsed, results = run(urls, workers)
+            if baseline is None:
+                baseline, baseline_time = results, elapsed
+            same = results == baseline
+            found = sum(len(papers) for result in results for papers in result.values())
+            label = f"进程池 x{workers}" if workers else "主进程线程"
+            print(f"{label:<12}{elapsed:>12.2f}{len(urls) / elapsed:>10.1f}{baseline_time / elapsed:>9.1f}x"
+                  f"  {'一致' if same else '不一致！'}（{found} 篇）")
+    reset_client()
+
+if __name__ == "__main__":
+    main()
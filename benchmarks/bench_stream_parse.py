@@ -0,0 +1,95 @@
+"""
+流式解析基准测试
+由本地替身服务器提供包含大量论文条目的卷期目录页，比较先下载完整页面再解析（只解析论文条目）
+与边下载边解析、逐个条目匹配后丢弃的流式解析在处理一个页面时的耗时和峰值内存，并校验两者找到的论文一致。
+同时设置本地论文库，校验两种方式写入库中的条目一致
+
+峰值内存由 tracemalloc 统计，包含响应内容、解析树、条目列表等Python对象，不包含lxml在C层的临时缓冲区
+
+用法:
+    python benchmarks/bench_stream_parse.py [--entries 1000 5000 20000] [--chunk-size 65536]
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from fixtures import make_toc_pages, serve_site
+
+from crawlers import web_crawler
+from crawlers.http_client import set_cache_options, reset_client
+from crawlers.keyword_matcher import KeywordProfile
+from crawlers.rate_limiter import set_rate_limit
+from utils.paper_store import PaperStore
+
+KEY = "conf/fast/fast2025"
+
+
+def find_papers(url, stream):
+    """按给定方式处理一个目录页，返回 {配置名称: Paper 列表}"""
+    web_crawler.set_stream_parse(stream)
+    web_crawler.document_cache.clear()
+    with contextlib.redirect_stdout(io.StringIO()):
+        return web_crawler.find_blockchain_papers(url, "2025", reextract=True)
+
+def measure(url, stream, store):
+    """返回 (耗时秒数, 峰值内存MB, 找到的论文, 写入论文库的条目)；耗时与内存分两次测量，避免内存跟踪影响计时"""
+    web_crawler.set_entry_store(store)
+    start = time.perf_counter()
+    papers = find_papers(url, stream)
+    elapsed = time.perf_counter() - start
+    entries = [entry for _, _, page in store.get_venue_entries("conf/fast", ["2025"]) for entry in page]
+    web_crawler.set_entry_store(None)
+
+    tracemalloc.start()
+    find_papers(url, stream)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024), papers, entries
+
+def main():
+    parser = argparse.ArgumentParser(description='流式解析基准测试')
+    parser.add_argument('--entries', type=int, nargs='+', default=[1000, 5000, 20000], help='目录页的论文条目数')
+    parser.add_argument('--chunk-size', type=int, default=web_crawler.stream_chunk_size, help='流式解析时每次读取的字节数')
+    args = parser.parse_args()
+
+    set_cache_options(enabled=False)
+    set_rate_limit(0)
+    reset_client(mirrors=None)
+    web_crawler.set_keyword_profiles([
+        KeywordProfile("blockchain", ["Blockchain"], 'AND', False, 'title'),
+        KeywordProfile("author", ["Alice Author"], 'AND', False, 'entry'),
+    ])
+    web_crawler.set_stream_parse(False, args.chunk_size)
+    print(f"HTML解析器: {web_crawler.html_parser}，流式读取块大小: {args.chunk_size} 字节")
+    print(f"{'条目数':<8}{'页面(MB)':>10}{'方式':>10}{'耗时(秒)':>10}{'峰值(MB)':>10}  结果")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.entries:
+            html, _ = make_toc_pages(KEY, "2025", count, seed=count, base_url="https://dblp.org")
+
+            def site_factory(base_url):
+                return {f"/db/{KEY}.html": html}
+
+            with serve_site(site_factory) as base_url:
+                url = f"{base_url}/db/{KEY}.html"
+                results = {}
+                for stream in (False, True):
+                    store = PaperStore(os.path.join(directory, f"corpus_{count}_{int(stream)}.db"))
+                    results[stream] = measure(url, stream, store)
+                    store.close()
+
+            tree, streamed = results[False], results[True]
+            same = tree[2] == streamed[2] and tree[3] == streamed[3]
+            found = sum(len(papers) for papers in streamed[2].values())
+            size = len(html) / (1024 * 1024)
+            print(f"{count:<10}{size:>10.1f}{'整页解析':>8}{tree[0]:>12.2f}{tree[1]:>10.1f}")
+            print(f"{'':<10}{'':>10}{'流式解析':>8}{streamed[0]:>12.2f}{streamed[1]:>10.1f}"
+                  f"  {'一致' if same else '不一致！'}（{found} 篇，库中 {len(streamed[3])} 条）")
+    reset_client()
+
+if __name__ == "__main__":
+    main()
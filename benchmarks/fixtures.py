@@ -0,0 +1,207 @@
+"""
+基准测试用的dblp页面样本及本地替身服务器
+按dblp网页与XML数据的实际结构生成确定性的样本页面（期刊索引页、会议索引页、卷期目录页），
+并通过本地HTTP服务器提供，基准测试不依赖外部网络
+"""
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from xml.sax.saxutils import escape
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+_WORDS = ["Efficient", "Scalable", "Blockchain", "Fibonacci", "Consensus", "Storage", "Cache", "Graph",
+          "Learning", "Smart Contract", "Distributed", "Ledger", "Heap", "Memory", "Byzantine", "Sharding"]
+
+
+def make_titles(count, seed):
+    """生成 count 个确定性的论文标题"""
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(_WORDS) for _ in range(6)) + " Systems." for _ in range(count)]
+
+def _entry_html(key, title, year, index, toc_url):
+    """单个论文条目，结构与dblp目录页的 li.entry 相同"""
+    if index % 7 == 0:
+        ee = f"https://www.usenix.org/conference/paper{index}"
+    else:
+        ee = f"https://doi.org/10.1000/{key.replace('/', '.')}.{index}"
+    return (
+        f'<li class="entry article toc" id="{key}/{index}" itemscope>'
+        f'<div class="box"><img alt="" title="Journal Articles" src="https://dblp.org/img/n.png"></div>'
+        f'<nav class="publ"><ul>'
+        f'<li class="drop-down"><div class="head"><a href="{ee}"><img alt="" class="icon"></a></div>'
+        f'<div class="body"><p><b>view</b></p><ul><li class="ee"><a href="{ee}" itemprop="url">'
+        f'electronic edition via DOI</a></li></ul></div></li>'
+        f'<li class="drop-down"><div class="head"><a href="https://dblp.org/rec/{key}/{index}.html?view=bibtex">'
+        f'<img alt="" class="icon"></a></div></li>'
+        f'</ul></nav>'
+        f'<cite class="data tts-content" itemprop="headline">'
+        f'<span itemprop="author"><a href="https://dblp.org/pid/{index}.html"><span itemprop="name">Alice Author</span></a></span>, '
+        f'<span itemprop="author"><a href="https://dblp.org/pid/{index + 1}.html"><span itemprop="name">Bob Writer</span></a></span>:<br> '
+        f'<span class="title" itemprop="name">{escape(title)}</span> '
+        f'<a href="{toc_url}#{index}"><span itemprop="isPartOf"><span itemprop="name">Venue</span></span> '
+        f'<span itemprop="pagination">{index}-{index + 10}</span> (<span itemprop="datePublished">{year}</span>)</a>'
+        f'</cite></li>'
+    )
+
+def _entry_xml(key, title, year, index):
+    """单个论文记录，结构与dblp bht XML中的记录相同"""
+    if index % 7 == 0:
+        ee = f"https://www.usenix.org/conference/paper{index}"
+    else:
+        ee = f"https://doi.org/10.1000/{key.replace('/', '.')}.{index}"
+    return (
+        f'<r><article key="{key}/{index}" mdate="2024-01-01">'
+        f'<author>Alice Author</author><author>Bob Writer</author>'
+        f'<title>{escape(title)}</title><pages>{index}-{index + 10}</pages><year>{year}</year>'
+        f'<ee>{ee}</ee><url>db/{key}.html#{index}</url></article></r>'
+    )
+
+def make_toc_pages(key, year, count, seed, base_url):
+    """生成同一卷期目录页的HTML和XML版本"""
+    toc_url = f"{base_url}/db/{key}.html"
+    titles = make_titles(count, seed)
+    html_entries = "".join(_entry_html(key, t, year, i, toc_url) for i, t in enumerate(titles))
+    xml_entries = "".join(_entry_xml(key, t, year, i) for i, t in enumerate(titles))
+    html = (
+        f'<!DOCTYPE html><html><head><title>dblp: {key}</title></head><body>'
+        f'<div id="main"><header class="headline"><h1>{key}</h1></header>'
+        f'<header class="h2"><h2>Volume {year}</h2></header>'
+        f'<ul class="publ-list">{html_entries}</ul></div>'
+        f'<div id="footer">' + '<p>dblp footer</p>' * 50 + '</div></body></html>'
+    )
+    xml = f'<?xml version="1.0" encoding="UTF-8"?><bht key="db/{key}.bht"><h1>{key}</h1>' \
+          f'<h2>Volume {year}</h2><dblpcites>{xml_entries}</dblpcites></bht>'
+    return html.encode('utf-8'), xml.encode('utf-8')
+
+def make_journal_index(name, volumes, base_url):
+    """生成期刊索引页的HTML和XML版本，volumes 为 [(卷号, 年份)]，按新到旧排列"""
+    html_items = "".join(
+        f'<li><a href="{base_url}/db/journals/{name}/{name}{vol}.html">Volume {vol}: {year}</a></li>'
+        for vol, year in volumes)
+    xml_items = "".join(
+        f'<li><ref href="db/journals/{name}/{name}{vol}.bht">Volume {vol}: {year}</ref></li>'
+        for vol, year in volumes)
+    html = (f'<!DOCTYPE html><html><body><div id="main"><header class="headline"><h1>{name}</h1></header>'
+            f'<ul>{html_items}</ul></div></body></html>')
+    xml = f'<?xml version="1.0" encoding="UTF-8"?><bht key="db/journals/{name}/index.bht"><h1>{name}</h1><ul>{xml_items}</ul></bht>'
+    return html.encode('utf-8'), xml.encode('utf-8')
+
+def make_conference_index(name, years, base_url):
+    """生成会议索引页的HTML和XML版本，years 按新到旧排列"""
+    html_items = []
+    xml_items = []
+    for year in years:
+        html_items.append(
+            f'<header class="h2" id="{year}"><h2>{name.upper()} {year}: Somewhere</h2></header>'
+            f'<ul class="publ-list"><li class="entry editor toc" id="conf/{name}/{year}">'
+            f'<nav class="publ"><ul><li class="drop-down"><div class="head">'
+            f'<a href="https://doi.org/10.1000/{name}{year}"><img alt=""></a></div></li></ul></nav>'
+            f'<cite class="data tts-content"><span itemprop="author">Editor</span>: '
+            f'<span class="title" itemprop="name">Proceedings of {name.upper()} {year}.</span> '
+            f'<span itemprop="publisher">ACM</span> <span itemprop="datePublished">{year}</span> '
+            f'<a href="{base_url}/db/conf/{name}/{name}{year}.html">[contents]</a></cite></li></ul>')
+        xml_items.append(
+            f'<h2>{name.upper()} {year}: Somewhere</h2><dblpcites><r><proceedings key="conf/{name}/{year}">'
+            f'<editor>Editor</editor><title>Proceedings of {name.upper()} {year}.</title><publisher>ACM</publisher>'
+            f'<year>{year}</year><ee>https://doi.org/10.1000/{name}{year}</ee>'
+            f'<url>db/conf/{name}/{name}{year}.html</url></proceedings></r></dblpcites>')
+    html = (f'<!DOCTYPE html><html><body><div id="main"><header class="headline"><h1>{name}</h1></header>'
+            f'{"".join(html_items)}</div></body></html>')
+    xml = f'<?xml version="1.0" encoding="UTF-8"?><bht key="db/conf/{name}/index.bht"><h1>{name}</h1>{"".join(xml_items)}</bht>'
+    return html.encode('utf-8'), xml.encode('utf-8')
+
+def build_site(base_url, journals=("tocs", "tos"), conferences=("fast", "dac"), entries_per_page=500,
+               first_year=2000, last_year=2025):
+    """
+    构造一个包含期刊和会议的dblp替身站点
+
+    Returns:
+        {路径: 页面字节}，同时包含HTML和XML版本
+    """
+    site = {}
+    years = list(range(last_year, first_year - 1, -1))
+    for j_index, name in enumerate(journals):
+        volumes = [(year - first_year + 1, year) for year in years]
+        html, xml = make_journal_index(name, volumes, base_url)
+        site[f"/db/journals/{name}/"] = html
+        site[f"/db/journals/{name}/index.xml"] = xml
+        for vol, year in volumes:
+            key = f"journals/{name}/{name}{vol}"
+            html, xml = make_toc_pages(key, str(year), entries_per_page, seed=j_index * 10000 + year,
+                                       base_url=base_url)
+            site[f"/db/{key}.html"] = html
+            site[f"/db/{key}.xml"] = xml
+    for c_index, name in enumerate(conferences):
+        html, xml = make_conference_index(name, [str(y) for y in years], base_url)
+        site[f"/db/conf/{name}/"] = html
+        site[f"/db/conf/{name}/index.xml"] = xml
+        for year in years:
+            key = f"conf/{name}/{name}{year}"
+            html, xml = make_toc_pages(key, str(year), entries_per_page, seed=100000 + c_index * 10000 + year,
+                                       base_url=base_url)
+            site[f"/db/{key}.html"] = html
+            site[f"/db/{key}.xml"] = xml
+    return site
+
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    """按路径返回样本页面，可注入延迟模拟网络耗时，或固定返回错误状态码模拟故障服务器"""
+    site = {}
+    latency = 0.0
+    status = None
+
+    def do_GET(self):
+        path = self.path.split('?')[0].split('#')[0]
+        if path.endswith('/index.html'):
+            path = path[:-len('index.html')]
+        body = self.site.get(path)
+        latency = self.latency(path) if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+        if body is None or self.status is not None:
+            self.send_response(404 if self.status is None else self.status)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        content_type = 'application/xml' if path.endswith('.xml') else 'text/html; charset=utf-8'
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_site(site_factory, latency=0.0, status=None):
+    """
+    在本地随机端口启动替身服务器
+
+    Args:
+        site_factory: 接收 base_url 返回站点字典的函数
+        latency: 每个请求注入的延迟（秒），或接收请求路径返回延迟的函数
+        status: 指定时所有请求都返回该状态码（例如 503），用于模拟故障服务器
+
+    Yields:
+        base_url，例如 http://127.0.0.1:8123
+    """
+    handler = type('SiteHandler', (_SiteHandler,), {
+        'site': {}, 'latency': staticmethod(latency) if callable(latency) else latency, 'status': status})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    handler.site = site_factory(base_url)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield base_url
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -10,8 +10,89 @@ ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 PROXIES = None
 # 例如: PROXIES = {'http': 'http://127.0.0.1:10809', 'https': 'http://127.0.0.1:10809'}
 
-# 请求超时时间设置为30秒
-TIMEOUT = 30
+# 连接超时与读取超时（秒），分别控制建立连接和等待响应数据的时间
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 30
+
+# HTTP连接池大小：缓存的主机连接池数量，以及每个主机保持的最大连接数
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 10
+
+# 遇到5xx、429或连接重置时的最大重试次数，以及指数退避的基数和上限（秒）
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 1.0
+HTTP_BACKOFF_MAX = 60
+
+# 请求限速：对每个主机使用令牌桶，RATE_LIMIT_PER_HOST 为每秒请求数（0 表示不限速），
+# RATE_LIMIT_BURST 为允许的最大突发请求数。只有实际发往网络的请求才会消耗令牌
+RATE_LIMIT_PER_HOST = 1.0
+RATE_LIMIT_BURST = 3
+
+# dblp的镜像主机，URL规范化时统一为第一个主机，不同镜像上的同一页面只处理一次
+DBLP_HOSTS = ["dblp.org", "www.dblp.org", "dblp.uni-trier.de", "dblp2.uni-trier.de", "dblp.dagstuhl.de"]
+
+# dblp镜像：发往dblp主机（DBLP_HOSTS 或下列镜像）的请求分散到各镜像，每个镜像按主机单独限速。
+# 为空列表时按原URL请求。连续失败或响应过慢的镜像会被熔断一段时间；
+# 请求耗时超过已观测到的P95延迟时，向另一个镜像发送对冲请求，先返回的结果生效
+DBLP_MIRRORS = ["https://dblp.org", "https://dblp.dagstuhl.de"]
+MIRROR_FAILURE_THRESHOLD = 3  # 连续失败（含超过 MIRROR_SLOW_SECONDS 的慢响应）多少次后熔断
+MIRROR_COOLDOWN = 60  # 熔断时长（秒），之后放行一个试探请求，成功则恢复
+MIRROR_SLOW_SECONDS = 10  # 响应耗时超过该值视为一次失败
+HEDGE_ENABLED = True
+HEDGE_MIN_SAMPLES = 20  # 观测到的请求数达到该值后才使用P95延迟作为对冲等待时间
+HEDGE_DEFAULT_DELAY = 3.0  # 样本不足时的对冲等待时间（秒）
+HEDGE_MIN_DELAY = 0.2  # 对冲等待时间的下限（秒）
+
+# HTTP响应磁盘缓存：重复运行时复用已下载的页面，过期后通过ETag/Last-Modified条件请求重新验证
+HTTP_CACHE_ENABLED = True
+CACHE_DIR = os.path.join(ROOT_DIR, "cache")  # 缓存目录，设置为根目录下的cache
+HTTP_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 缓存容量上限，超出后按最近最少使用淘汰
+
+# 缓存有效期（秒）：会议/期刊索引页会随新卷期更新，使用较短有效期；
+# 文件名带往年年份的卷期页视为永久有效；其他页面使用默认有效期
+CACHE_TTL_INDEX = 24 * 3600
+CACHE_TTL_DEFAULT = 7 * 24 * 3600
+
+# 重定向记录文件：请求被重定向时记录目标地址，之后请求前直接改写为最终地址，不再经过重定向链
+REDIRECT_MAP_FILE = os.path.join(CACHE_DIR, "redirects.json")
+
+# 本地论文库文件：导入dblp全量数据（--ingest）后，可通过 --offline 离线匹配关键词
+CORPUS_FILE = os.path.join(CACHE_DIR, "dblp_corpus.sqlite")
+
+# 爬取时是否将每个卷期/目录页的全部条目（不只是匹配的论文）写入本地论文库的全文索引，
+# 之后可通过 query 子命令更换关键词离线检索，不再访问网络
+ENTRY_INDEX_ENABLED = True
+
+# 页面获取与解析后端：'html' 解析dblp网页（默认），'xml' 使用dblp提供的XML/JSON结构化数据
+CRAWL_BACKEND = 'html'
+
+# HTML解析器：'lxml'（C实现，需安装lxml，速度明显快于 html.parser）、'html.parser'（Python标准库），
+# 'auto' 表示已安装lxml时使用lxml。各提取方式只解析自己需要的部分（论文条目或链接），不构建整个页面的树
+HTML_PARSER = 'auto'
+
+# 流式解析卷期目录页：响应体边下载边输入增量HTML解析器，每个论文条目解析完成后立即匹配并丢弃，
+# 内存占用不随页面大小增长，适合条目数以万计的超大卷期页（仅HTML后端，页面不放入解析后页面缓存）
+STREAM_PARSE_ENABLED = False
+
+# 流式下载时每次读取的字节数
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 解析后页面的内存缓存容量（页面数），同一页面在一次运行中只下载和解析一次，各种链接提取方式共用，超出后按最近最少使用淘汰
+DOCUMENT_CACHE_SIZE = 32
+
+# 是否使用asyncio并发爬取（同一专题下的所有会议/期刊并发处理）
+ASYNC_CRAWL = False
+
+# 并发爬取时对同一主机的最大并发请求数
+MAX_CONCURRENCY_PER_HOST = 4
+
+# 并行处理专题的进程数，1 表示按顺序处理。各进程平分每个主机的限速，适合CPU密集的解析和匹配，
+# 网络受限速约束时总请求速率不变
+TOPIC_WORKERS = 1
+
+# 并发爬取（--async）时解析卷期/目录页并匹配关键词的进程数，0 表示在主进程的线程中解析。
+# 下载仍在主进程中并发进行，解析、条目提取和匹配交给进程池，不再受GIL限制，只有匹配到的论文传回主进程
+PARSE_WORKERS = 0
 
 
 
@@ -37,6 +118,16 @@ TARGET_KEYWORDS_WORD_BOUNDARY = False
 # 匹配范围: 'title' 只匹配标题, 'entry' 只匹配条目整体, 'title_or_entry' 先尝试标题再条目（默认）
 MATCH_SCOPE = 'title'
 
+# 多组关键词配置：一次爬取同时按多组关键词匹配，每组结果写入输出目录下以名称命名的子目录。
+# 每组可单独设置 keywords、mode、word_boundary、match_scope，未设置的选项使用上面的全局配置。
+# 为空时只使用上面的 TARGET_KEYWORDS 等配置，结果直接写入输出目录。例如：
+#  KEYWORD_PROFILES = {
+#      "blockchain": {"keywords": ["blockchain"]},
+#      "consensus": {"keywords": ["consensus", "Byzantine"], "mode": "OR", "word_boundary": True},
+#      "smart_contract": {"keywords": ["smart contract"], "match_scope": "title_or_entry"},
+#  }
+KEYWORD_PROFILES = {}
+
 # 目标年份 TARGET_YEARS = ["2024", "2025"] 或者TARGET_YEARS = ["2024"]
 TARGET_YEARS = ["2024", "2025"]
 
@@ -51,6 +142,20 @@ OUTPUT_DIR = os.path.join(ROOT_DIR, "output")  # 结果输出目录，设置为
 # 多种格式之间用逗号分隔，例如："txt, xlsx"
 OUTPUT_FORMAT = "txt, xlsx"  # 默认为txt文本格式
 
+# Excel结果在内存中按专题累计，专题完成时一次性写入；每累计多少个卷期/目录页的结果额外写一次检查点，
+# 中断时已写入的结果不会丢失。0 表示只在专题完成时写入
+EXCEL_CHECKPOINT_INTERVAL = 20
+
+# 分布式爬取：协调节点（coordinator 子命令）将各专题的会议/期刊写入工作队列，
+# 工作节点（worker 子命令）领取并处理后写回结果。队列文件需放在各节点都能访问的共享存储上
+WORK_QUEUE_FILE = os.path.join(CACHE_DIR, "work_queue.sqlite")
+WORK_LEASE_SECONDS = 600  # 租约时长（秒），工作节点每处理完一个页面续约一次，过期未完成的单元会被重新领取
+WORK_MAX_ATTEMPTS = 3  # 每个单元最多领取的次数
+WORK_POLL_INTERVAL = 5  # 协调节点检查进度、工作节点等待其他节点的间隔（秒）
+
+# 爬取进度日志文件名，保存在输出目录中，中断后可通过 --resume 继续
+JOURNAL_FILENAME = ".crawl_journal.jsonl"
+
 # 输出文件名格式
 JOURNAL_OUTPUT_FORMAT = "学术期刊 类别A （{topic}）.txt"  # 期刊类输出文件格式
 CONFERENCE_OUTPUT_FORMAT = "学术会议 类别A （{topic}）.txt"  # 会议类输出文件格式 
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+异步爬取模块，基于asyncio并发下载页面，并按主机限制并发请求数
+"""
+import asyncio
+from urllib.parse import urlparse
+
+from core.config import MAX_CONCURRENCY_PER_HOST
+from crawlers.web_crawler import (
+    claim_link, fetch_document_text, parse_recent_volume_links, update_page_fingerprint,
+    match_page_papers, parse_conference_contents_links, parse_journal_volume_links, is_page_unchanged,
+    cache_document, get_cached_document, use_stream_parse, stream_page_papers, skipped_results,
+    SUBTREE_ENTRIES, SUBTREE_LINKS, SUBTREE_INDEX
+)
+from crawlers.parse_pool import use_parse_pool, submit_page, page_result
+
+# 每个主机对应一个信号量，用于限制同一主机的并发请求数
+_host_semaphores = {}
+# 每个主机允许的最大并发数，可在运行时修改
+max_concurrency_per_host = MAX_CONCURRENCY_PER_HOST
+
+
+def set_max_concurrency_per_host(limit):
+    """设置每个主机的最大并发请求数（需在事件循环启动前调用）"""
+    global max_concurrency_per_host
+    if limit and int(limit) > 0:
+        max_concurrency_per_host = int(limit)
+    reset_host_limits()
+    return max_concurrency_per_host
+
+def reset_host_limits():
+    """清空主机信号量，每次启动新的事件循环前调用"""
+    _host_semaphores.clear()
+
+def _get_host_semaphore(url):
+    """获取URL所属主机的信号量"""
+    host = urlparse(url).netloc.lower()
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrency_per_host)
+        _host_semaphores[host] = semaphore
+    return semaphore
+
+async def fetch_text(url):
+    """在线程中按当前后端下载页面原始内容，受主机并发数限制"""
+    async with _get_host_semaphore(url):
+        return await asyncio.to_thread(fetch_document_text, url)
+
+async def async_load_document(url, subtree=None):
+    """load_document 的异步版本，下载和解析都在线程中进行"""
+    # 从缓存的原始内容解析时同样在线程中进行，避免阻塞事件循环中的其他下载任务
+    soup = await asyncio.to_thread(get_cached_document, url, subtree)
+    if soup is not None:
+        return soup
+    content, kind = await fetch_text(url)
+    update_page_fingerprint(url, content)
+    return await asyncio.to_thread(cache_document, url, content, kind, subtree)
+
+async def async_get_recent_volume_links(url, reextract=False):
+    """get_recent_volume_links 的异步版本"""
+    try:
+        if reextract:
+            print(f"从已下载的页面重新提取卷期链接: {url}")
+            return parse_recent_volume_links(await async_load_document(url, SUBTREE_LINKS), url)
+
+        if not claim_link(url):
+            return []
+
+        print(f"正在处理页面: {url}")
+        soup = await async_load_document(url, SUBTREE_LINKS)
+        return parse_recent_volume_links(soup, url)
+    except Exception as e:
+        print(f"获取 {url} 的卷期链接时出错: {e}")
+        return []
+
+async def async_find_blockchain_papers(url, year=None, previous_hash=None, reextract=False):
+    """find_blockchain_papers 的异步版本，返回值相同"""
+    try:
+        if not reextract and not claim_link(url):
+            return skipped_results()
+
+        print(f"{'在已下载的页面中查找论文' if reextract else '处理链接'}: {url}")
+        soup = await asyncio.to_thread(get_cached_document, url, SUBTREE_ENTRIES)
+        if soup is None and use_stream_parse():
+            # 流式下载、解析和匹配交替进行，整个过程在线程中完成，同样受主机并发数限制
+            async with _get_host_semaphore(url):
+                return await asyncio.to_thread(stream_page_papers, url, year, previous_hash)
+        if soup is None:
+            content, kind = await fetch_text(url)
+            if update_page_fingerprint(url, content, previous_hash):
+                return None
+            if use_parse_pool():
+                # 解析和匹配交给进程池，不受GIL限制，事件循环继续下载其他页面
+                return page_result(url, await asyncio.wrap_future(submit_page(url, year, content, kind)))
+            # 解析在线程中进行，避免阻塞事件循环中的其他下载任务
+            soup = await asyncio.to_thread(cache_document, url, content, kind, SUBTREE_ENTRIES)
+        elif is_page_unchanged(url, previous_hash):
+            return None
+        # 关键词匹配和写入论文库同样在线程中进行；页面已解析过，不再交给进程池重新解析
+        return await asyncio.to_thread(match_page_papers, url, year, soup)
+    except Exception as e:
+        print(f"查找论文时出错 {url}: {e}")
+        return {}
+
+async def async_process_conference_page(url):
+    """process_conference_page 的异步版本，链接已查询过时返回None"""
+    try:
+        if not claim_link(url):
+            return None
+
+        print(f"正在处理会议页面: {url}")
+        soup = await async_load_document(url, SUBTREE_INDEX)
+        return parse_conference_contents_links(soup, url)
+    except Exception as e:
+        print(f"处理会议页面时出错 {url}: {e}")
+        return []
+
+async def async_get_journal_volume_links(url):
+    """get_journal_volume_links 的异步版本"""
+    try:
+        if not claim_link(url):
+            return []
+
+        print(f"正在处理期刊页面: {url}")
+        soup = await async_load_document(url, SUBTREE_LINKS)
+        return parse_journal_volume_links(soup, url)
+    except Exception as e:
+        print(f"获取期刊 {url} 的卷期链接时出错: {e}")
+        return []
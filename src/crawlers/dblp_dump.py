@@ -0,0 +1,121 @@
+"""
+dblp全量数据导入模块
+以流式方式增量解析官方的 dblp.xml.gz 数据文件，内存占用保持恒定，
+只保留输入文件中列出的会议/期刊和目标年份的论文，写入本地论文库
+"""
+import gzip
+import time
+import xml.etree.ElementTree as ET
+
+from crawlers.dblp_xml import create_xml_parser, record_title, record_link, record_entry_text
+from utils.paper_store import PaperStore
+
+# dblp全量数据中需要导入的论文记录类型
+DUMP_RECORD_TAGS = {'article', 'inproceedings'}
+
+# dblp站点根地址，记录中的 url 字段相对该地址
+DBLP_SITE_ROOT = "https://dblp.org/"
+
+# 每批写入数据库的条目数
+BATCH_SIZE = 5000
+
+
+def _open_dump(dump_path):
+    """打开数据文件，支持 .gz 压缩和未压缩的XML"""
+    if dump_path.endswith('.gz'):
+        return gzip.open(dump_path, 'rb')
+    return open(dump_path, 'rb')
+
+def _record_venue_key(record):
+    """记录key的前两段即会议/期刊标识，例如 journals/tocs/Smith23 -> journals/tocs"""
+    parts = (record.get('key') or '').split('/')
+    if len(parts) < 3:
+        return None
+    return f"{parts[0]}/{parts[1]}"
+
+def _record_toc_url(record):
+    """记录所在目录页的地址（去掉条目锚点）"""
+    url = (record.findtext('url') or '').split('#')[0].strip()
+    if not url:
+        return ""
+    return DBLP_SITE_ROOT + url.lstrip('/')
+
+def iter_dump_records(source, venue_keys, years):
+    """
+    流式遍历数据文件中属于指定会议/期刊和年份的论文记录
+
+    Args:
+        source: 文件路径或二进制文件对象
+        venue_keys: 需要保留的会议/期刊标识集合
+        years: 需要保留的年份集合
+
+    Yields:
+        (venue_key, year, title, link, entry_text, source_url)
+    """
+    context = ET.iterparse(source, events=('start', 'end'), parser=create_xml_parser())
+    root = None
+    depth = 0
+    for event, element in context:
+        if event == 'start':
+            if root is None:
+                root = element
+            depth += 1
+            continue
+
+        depth -= 1
+        # 只在顶层记录结束时处理；处理后清空根元素，避免已解析的记录累积在内存中
+        if depth != 1:
+            continue
+        if element.tag in DUMP_RECORD_TAGS:
+            venue_key = _record_venue_key(element)
+            year = (element.findtext('year') or '').strip()
+            if venue_key in venue_keys and year in years:
+                title = record_title(element)
+                if title:
+                    yield (venue_key, year, title, record_link(element), record_entry_text(element),
+                           _record_toc_url(element))
+        root.clear()
+
+def ingest_dump(dump_path, venue_keys, years, store=None):
+    """
+    将dblp全量数据中指定会议/期刊和年份的论文导入本地论文库
+
+    Args:
+        dump_path: dblp.xml.gz 文件路径
+        venue_keys: 会议/期刊标识集合，例如 {"journals/tocs", "conf/fast"}
+        years: 目标年份列表
+        store: PaperStore 实例，默认使用配置中的论文库文件
+
+    Returns:
+        导入的条目数
+    """
+    venue_keys = set(venue_keys)
+    years = set(years)
+    own_store = store is None
+    if own_store:
+        store = PaperStore()
+
+    print(f"开始导入 {dump_path}，共 {len(venue_keys)} 个会议/期刊，年份: {', '.join(sorted(years))}")
+    start = time.time()
+    store.clear_venues(venue_keys)
+
+    total = 0
+    batch = []
+    try:
+        with _open_dump(dump_path) as source:
+            for row in iter_dump_records(source, venue_keys, years):
+                batch.append(row)
+                if len(batch) >= BATCH_SIZE:
+                    store.add_entries(batch)
+                    total += len(batch)
+                    batch = []
+                    print(f"已导入 {total} 条论文记录...")
+        if batch:
+            store.add_entries(batch)
+            total += len(batch)
+    finally:
+        if own_store:
+            store.close()
+
+    print(f"导入完成，共 {total} 条论文记录，用时 {time.time() - start:.1f} 秒")
+    return total
@@ -0,0 +1,241 @@
+"""
+dblp结构化数据解析模块
+dblp为每个会议/期刊索引页和卷期目录页提供对应的XML版本（.xml，bht格式），
+并提供JSON格式的检索接口。本模块解析这些结构化数据，
+得到与HTML页面解析相同的 (年份, 链接) 和 (标题, DOI) 结果
+"""
+import html.entities
+import json
+import re
+import xml.etree.ElementTree as ET
+from urllib.parse import urljoin, urlsplit, urlunsplit, quote
+
+from core.config import TARGET_YEARS
+
+# dblp中表示论文记录的元素名
+RECORD_TAGS = ('article', 'inproceedings', 'proceedings', 'incollection', 'book', 'phdthesis', 'mastersthesis')
+
+# 期刊索引页中的卷期链接文本，例如 "Volume 41: 2023"
+_JOURNAL_VOLUME_PATTERN = re.compile(r'Volume\s+\d+:?\s*(\d{4})')
+# 通用的卷期链接文本
+_RECENT_VOLUME_PATTERN = re.compile(r'Volume\s+\d+.*?(\d{4})')
+# 独立的四位年份（前后不紧接数字），避免把页码、ISBN等数字中的片段当作年份
+_YEAR_PATTERN = re.compile(r'(?<!\d)((?:19|20)\d{2})(?!\d)')
+
+
+def find_years(text):
+    """文本中出现的全部四位年份，按出现顺序"""
+    return _YEAR_PATTERN.findall(text or "")
+
+
+class YearScan:
+    """
+    按年份扫描dblp索引页中的卷期/论文集条目
+
+    dblp的会议/期刊索引页按年份从新到旧排列，可以追溯到几十年前。条目年份开始递减，
+    且已早于最早的目标年份时，之后的条目都不在目标年份内，扫描可以停止；
+    按从旧到新排列的页面年份不会递减，仍会完整扫描
+
+    Args:
+        years: 目标年份列表
+    """
+
+    def __init__(self, years):
+        self.oldest = min(int(year) for year in years) if years else None
+        self.previous = None
+        self.stopped = False
+
+    def is_past(self, year):
+        """记录一个条目的年份，返回是否已扫描过全部目标年份（之后的条目无需再检查）"""
+        if self.oldest is None or not str(year or '').isdigit():
+            return False
+        year = int(year)
+        previous, self.previous = self.previous, year
+        if previous is not None and year < previous and year < self.oldest:
+            self.stopped = True
+        return self.stopped
+
+
+def create_xml_parser():
+    """
+    创建可识别HTML命名实体的XML解析器
+    dblp的XML数据使用 &uuml; 等在DTD中定义的实体，标准库解析器不会加载外部DTD，
+    因此需要预先注册这些实体
+    """
+    parser = ET.XMLParser()
+    parser.entity.update((name, chr(code)) for name, code in html.entities.name2codepoint.items())
+    return parser
+
+def to_xml_url(url):
+    """
+    将dblp的HTML页面地址转换为对应的XML地址
+
+    例如:
+        https://dblp.org/db/journals/tocs/            -> https://dblp.org/db/journals/tocs/index.xml
+        https://dblp.org/db/conf/fast/fast2024.html   -> https://dblp.org/db/conf/fast/fast2024.xml
+    """
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if path.endswith('/'):
+        path += 'index.xml'
+    elif path.endswith('.html'):
+        path = path[:-len('.html')] + '.xml'
+    elif not path.endswith('.xml'):
+        path += '/index.xml'
+    return urlunsplit((parts.scheme, parts.netloc, path, '', ''))
+
+def to_html_url(href, base_url):
+    """将XML中引用的 .bht/.xml 地址还原为HTML页面地址，去掉片段"""
+    full_url = urljoin(_site_root(base_url), href) if not re.match(r'https?://', href) else href
+    parts = urlsplit(full_url)
+    path = re.sub(r'\.(bht|xml)$', '.html', parts.path)
+    return urlunsplit((parts.scheme, parts.netloc, path, parts.query, ''))
+
+def to_search_url(url, max_hits=1000):
+    """
+    构造dblp检索接口地址，按目录（toc）查询某个卷期页面的所有论文
+
+    例如 https://dblp.org/db/conf/fast/fast2024.html 对应的查询为
+    toc:db/conf/fast/fast2024.bht:
+    """
+    parts = urlsplit(url)
+    key = re.sub(r'\.(html|xml)$', '.bht', parts.path.lstrip('/'))
+    query = quote(f"toc:{key}:")
+    return f"{parts.scheme}://{parts.netloc}/search/publ/api?q={query}&h={max_hits}&format=json"
+
+def _site_root(url):
+    """dblp XML中的 url 字段是相对站点根目录的路径"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/"
+
+def _text(element):
+    """获取元素内的全部文本（包括 <i>、<sub> 等子元素中的文本）"""
+    if element is None:
+        return ""
+    return re.sub(r'\s+', ' ', ''.join(element.itertext())).strip()
+
+def parse_xml(text):
+    """将XML文本解析为ElementTree根元素"""
+    if isinstance(text, str):
+        text = text.encode('utf-8')
+    parser = create_xml_parser()
+    parser.feed(text)
+    return parser.close()
+
+def parse_search_json(text):
+    """
+    将检索接口返回的JSON转换为与bht XML相同结构的元素树，
+    以便复用同一套论文解析逻辑
+    """
+    data = json.loads(text)
+    root = ET.Element('bht')
+    cites = ET.SubElement(root, 'dblpcites')
+    hits = data.get('result', {}).get('hits', {}).get('hit', []) or []
+    for hit in hits:
+        info = hit.get('info', {})
+        record = ET.SubElement(ET.SubElement(cites, 'r'), 'article')
+        authors = info.get('authors', {}).get('author', [])
+        if isinstance(authors, dict):
+            authors = [authors]
+        for author in authors:
+            ET.SubElement(record, 'author').text = author.get('text', '') if isinstance(author, dict) else str(author)
+        for field in ('title', 'venue', 'year'):
+            if info.get(field):
+                ET.SubElement(record, field).text = str(info[field])
+        if info.get('doi'):
+            ET.SubElement(record, 'ee').text = f"https://doi.org/{info['doi']}"
+        if info.get('ee') and info.get('ee') != f"https://doi.org/{info.get('doi')}":
+            ET.SubElement(record, 'ee').text = info['ee']
+    return root
+
+def iter_records(root):
+    """遍历页面中的所有论文记录元素"""
+    for element in root.iter():
+        if element.tag in RECORD_TAGS:
+            yield element
+
+def record_link(record):
+    """
+    获取论文记录的链接：使用第一个电子版链接（通常为DOI），
+    与HTML页面中条目第一个下拉菜单的链接一致
+    """
+    for ee in record.findall('ee'):
+        link = _text(ee)
+        if link:
+            return link
+    return None
+
+def parse_journal_volume_links(root, url):
+    """从期刊索引页的XML中提取目标年份的卷期链接"""
+    recent_volume_links = []
+    years = TARGET_YEARS
+    scan = YearScan(years)
+    for ref in root.iter('ref'):
+        match = _JOURNAL_VOLUME_PATTERN.search(_text(ref))
+        href = ref.get('href')
+        if match and scan.is_past(match.group(1)):
+            print(f"已扫描到 {match.group(1)} 年，早于目标年份，停止扫描")
+            break
+        if match and match.group(1) in years and href:
+            year = match.group(1)
+            full_url = to_html_url(href, url)
+            recent_volume_links.append((year, full_url))
+            print(f"找到期刊{year}年的卷期链接: {full_url}")
+    return recent_volume_links
+
+def parse_recent_volume_links(root, url):
+    """从索引页的XML中提取目标年份的卷期链接（通用方法）"""
+    recent_volume_links = []
+    years = TARGET_YEARS
+    refs = [(_text(ref), ref.get('href')) for ref in root.iter('ref') if ref.get('href')]
+
+    scan = YearScan(years)
+    for ref_text, href in refs:
+        match = _RECENT_VOLUME_PATTERN.search(ref_text)
+        if match and scan.is_past(match.group(1)):
+            print(f"已扫描到 {match.group(1)} 年，早于目标年份，停止扫描")
+            break
+        if match and match.group(1) in years:
+            full_url = to_html_url(href, url)
+            recent_volume_links.append((match.group(1), full_url))
+            print(f"找到 {match.group(1)} 年的卷期链接: {full_url}")
+
+    # 如果没有找到符合格式的链接，查找包含年份的其他链接
+    if not recent_volume_links:
+        for ref_text, href in refs:
+            found = find_years(ref_text)
+            for year in years:
+                if year in found:
+                    full_url = to_html_url(href, url)
+                    recent_volume_links.append((year, full_url))
+                    print(f"找到包含 {year} 年的链接: {full_url}")
+    return recent_volume_links
+
+def parse_conference_contents_links(root, url):
+    """从会议索引页的XML中提取目标年份论文集的目录页链接"""
+    contents_links = []
+    years = TARGET_YEARS
+    scan = YearScan(years)
+    for record in root.iter('proceedings'):
+        year = _text(record.find('year'))
+        if scan.is_past(year):
+            print(f"已扫描到 {year} 年，早于目标年份，停止扫描")
+            break
+        toc_url = _text(record.find('url'))
+        if year in years and toc_url:
+            contents_url = to_html_url(toc_url, url)
+            contents_links.append((year, contents_url))
+            print(f"找到{year}年的[contents]链接: {contents_url}")
+    return contents_links
+
+def record_entry_text(record):
+    """论文记录的完整文本（作者、标题、出处等），用于按条目匹配关键词"""
+    return ' '.join(_text(child) for child in record if child.tag not in ('ee', 'url'))
+
+def record_year(record):
+    """论文记录的出版年份，没有时返回None"""
+    return _text(record.find('year')) or None
+
+def record_title(record):
+    """论文记录的标题"""
+    return _text(record.find('title'))
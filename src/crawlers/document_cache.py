@@ -0,0 +1,90 @@
+"""
+解析后页面缓存模块
+在内存中按规范化URL保存本次运行中下载过的页面：原始内容，以及按各提取方式所需部分
+（论文条目、链接或整个页面）解析的结果（BeautifulSoup或XML/JSON解析结果）。
+期刊/会议索引页的各种链接提取方式和论文匹配共用同一次下载，需要页面的另一部分时直接从原始内容解析，
+同一页面在一次运行中只下载一次；超出容量时按最近最少使用（LRU）淘汰
+"""
+import threading
+from collections import OrderedDict
+
+from core.config import DOCUMENT_CACHE_SIZE
+from crawlers.url_frontier import canonicalize_url
+
+
+class DocumentCache:
+    """
+    解析后页面的LRU缓存，可在多线程间共享
+
+    Args:
+        max_entries: 最多保存的页面数，0 表示不缓存
+    """
+
+    def __init__(self, max_entries=DOCUMENT_CACHE_SIZE):
+        self.max_entries = max_entries
+        # {规范化URL: {"content": (原始内容, 类型), "documents": {解析部分: 解析结果}}}
+        self._pages = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_page(self, url, create=False):
+        """获取页面的缓存记录并标记为最近使用（调用方需持有锁）"""
+        key = canonicalize_url(url)
+        page = self._pages.get(key)
+        if page is None and create:
+            page = {"content": None, "documents": {}}
+            self._pages[key] = page
+        if page is not None:
+            self._pages.move_to_end(key)
+        while len(self._pages) > self.max_entries:
+            self._pages.popitem(last=False)
+        return page
+
+    def get(self, url, subtree=None):
+        """
+        获取已解析的页面，不在缓存中时返回None
+
+        Args:
+            subtree: 所需的页面部分；缓存中有整个页面的解析结果时同样可用
+        """
+        with self._lock:
+            page = self._get_page(url)
+            documents = page["documents"] if page is not None else {}
+            document = documents.get(subtree)
+            if document is None:
+                document = documents.get(None)
+            if document is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return document
+
+    def put(self, url, document, subtree=None):
+        """保存已解析的页面，返回该页面"""
+        if self.max_entries <= 0:
+            return document
+        with self._lock:
+            self._get_page(url, create=True)["documents"][subtree] = document
+        return document
+
+    def get_content(self, url):
+        """获取页面的原始内容 (content, kind)，不在缓存中时返回None"""
+        with self._lock:
+            page = self._get_page(url)
+            return page["content"] if page is not None else None
+
+    def put_content(self, url, content, kind):
+        """保存页面的原始内容，之后需要页面的其他部分时不必重新下载"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._get_page(url, create=True)["content"] = (content, kind)
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._pages.clear()
+
+    def __len__(self):
+        return len(self._pages)
@@ -0,0 +1,230 @@
+"""
+论文条目流式解析模块
+很大的卷期目录页（数万条目、数十MB）如果先下载完整内容再构建整个页面的树，
+完整的响应内容、解析树和全部条目会同时占用内存。本模块基于标准库的增量HTML分词器，
+边下载边分块输入，每个论文条目（li.entry）结束时立即产出，随后即可丢弃，内存占用不随页面大小增长。
+从每个条目中取出的内容与 web_crawler.extract_entry 在解析树上取出的内容相同
+"""
+import codecs
+import re
+from collections import deque
+from html.parser import HTMLParser
+
+# 没有结束标签的元素
+VOID_ELEMENTS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+                           'param', 'source', 'track', 'wbr'))
+# 文本不计入 get_text() 的元素
+_HIDDEN_TEXT_ELEMENTS = frozenset(('script', 'style', 'template'))
+
+# 判断编码时检查的页面开头字节数
+SNIFF_BYTES = 2048
+_META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+_BOMS = ((codecs.BOM_UTF8, 'utf-8'), (codecs.BOM_UTF16_LE, 'utf-16-le'), (codecs.BOM_UTF16_BE, 'utf-16-be'))
+
+
+def sniff_encoding(head):
+    """按字节顺序标记或页面中声明的字符集判断编码，都没有时使用UTF-8"""
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    match = _META_CHARSET_PATTERN.search(head)
+    if match:
+        encoding = match.group(1).decode('ascii', 'ignore')
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            pass
+    return 'utf-8'
+
+
+class _Element:
+    """条目内一个尚未结束的元素，以及它正在收集文本的字段"""
+
+    __slots__ = ('tag', 'fields')
+
+    def __init__(self, tag):
+        self.tag = tag
+        self.fields = ()
+
+
+class _EntryBuilder:
+    """
+    收集一个论文条目中的标题、下拉菜单链接、全部链接、出版年份和全文，
+    判断规则与 web_crawler.extract_entry 遍历解析树时相同
+    """
+
+    def __init__(self, tag):
+        # 条目本身只用于匹配结束标签，与遍历解析树时一样不参与标题和链接的判断
+        self.stack = [_Element(tag)]
+        self.texts = []
+        self.title = None  # 第一个 span.title 的文本片段，未出现时为None
+        self.fallback_title = None  # 第一个 .title 或 cite 的文本片段
+        self.year = None
+        self.year_parts = None  # 正在收集的出版年份文本
+        self.in_dropdown = False  # 是否在第一个下拉菜单内
+        self.dropdown_seen = False
+        self.in_head = False  # 是否在第一个下拉菜单的第一个 .head 内
+        self.head_seen = False
+        self.head_link = None
+        self.head_anchor_seen = False
+        self.anchors = []
+
+    def start(self, tag, attrs):
+        element = _Element(tag)
+        self.stack.append(element)
+        if tag == 'a':
+            self.anchors.append(attrs)
+            if self.in_head and not self.head_anchor_seen:
+                self.head_anchor_seen = True
+                self.head_link = attrs.get('href') or None
+            return
+
+        classes = attrs.get('class', '').split()
+        fields = []
+        if tag == 'span':
+            if self.title is None and 'title' in classes:
+                self.title = []
+                fields.append('title')
+            elif self.year is None and self.year_parts is None and attrs.get('itemprop') == 'datePublished':
+                self.year_parts = []
+                fields.append('year')
+        elif self.fallback_title is None and ('title' in classes or tag == 'cite'):
+            self.fallback_title = []
+            fields.append('fallback_title')
+        if not self.dropdown_seen and 'drop-down' in classes:
+            self.dropdown_seen = True
+            self.in_dropdown = True
+            fields.append('dropdown')
+        elif not self.head_seen and self.in_dropdown and 'head' in classes:
+            self.head_seen = True
+            self.in_head = True
+            fields.append('head')
+        element.fields = fields
+
+    def end(self, tag):
+        """处理结束标签，未结束的子元素一并结束；返回条目本身是否已结束"""
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index].tag == tag:
+                break
+        else:
+            return False
+        while len(self.stack) > index:
+            self._close(self.stack.pop())
+        return not self.stack
+
+    def _close(self, element):
+        for field in element.fields:
+            if field == 'year':
+                self.year = ''.join(self.year_parts).strip() or None
+                self.year_parts = None
+            elif field == 'dropdown':
+                self.in_dropdown = False
+            elif field == 'head':
+                self.in_head = False
+
+    def data(self, text):
+        if any(element.tag in _HIDDEN_TEXT_ELEMENTS for element in self.stack):
+            return
+        self.texts.append(text)
+        for element in self.stack:
+            for field in element.fields:
+                if field == 'title':
+                    self.title.append(text)
+                elif field == 'fallback_title':
+                    self.fallback_title.append(text)
+                elif field == 'year':
+                    self.year_parts.append(text)
+
+    def result(self):
+        """(title, head_link, anchors, year, entry_text)，没有标题元素时以条目全文作为标题"""
+        entry_text = ''.join(self.texts)
+        if self.title is not None:
+            title = ''.join(self.title).strip()
+        elif self.fallback_title is not None:
+            title = ''.join(self.fallback_title).strip()
+        else:
+            title = entry_text.strip()
+        return title, self.head_link, self.anchors, self.year, entry_text
+
+
+class EntryStreamParser(HTMLParser):
+    """
+    增量解析论文列表页面，逐个产出论文条目
+
+    用法::
+
+        parser = EntryStreamParser()
+        for chunk in chunks:
+            parser.feed_bytes(chunk)
+            for entry in parser.pop_entries():
+                ...
+        parser.close()
+        remaining = parser.pop_entries()
+
+    产出的条目为 (title, head_link, anchors, year, entry_text)：head_link 为第一个下拉菜单中第一个链接的地址，
+    anchors 为条目中按顺序出现的全部链接的属性字典
+
+    Args:
+        encoding: 页面编码，为None时按页面开头的字节顺序标记或 <meta charset> 判断
+    """
+
+    def __init__(self, encoding=None):
+        super().__init__(convert_charrefs=True)
+        self.encoding = encoding
+        self._decoder = None
+        self._head = b''
+        self._entry = None
+        self._entries = deque()
+
+    def feed_bytes(self, chunk):
+        """输入一块原始字节"""
+        if self._decoder is None:
+            self._head += chunk
+            if len(self._head) < SNIFF_BYTES:
+                return
+            chunk, self._head = self._head, b''
+            self._start_decoder(chunk)
+        self.feed(self._decoder.decode(chunk))
+
+    def _start_decoder(self, head):
+        encoding = self.encoding or sniff_encoding(head)
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+
+    def close(self):
+        """输入结束，处理剩余的内容"""
+        if self._decoder is None:
+            head, self._head = self._head, b''
+            self._start_decoder(head)
+            self.feed(self._decoder.decode(head))
+        self.feed(self._decoder.decode(b'', final=True))
+        super().close()
+
+    def pop_entries(self):
+        """取出已经完整解析的条目"""
+        entries = list(self._entries)
+        self._entries.clear()
+        return entries
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: value or '' for name, value in attrs}
+        if self._entry is None:
+            if tag == 'li' and 'entry' in attrs.get('class', '').split():
+                self._entry = _EntryBuilder(tag)
+            return
+        self._entry.start(tag, attrs)
+        if tag in VOID_ELEMENTS:
+            self._entry.end(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if self._entry is not None and tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if self._entry is not None and self._entry.end(tag):
+            self._entries.append(self._entry.result())
+            self._entry = None
+
+    def handle_data(self, data):
+        if self._entry is not None:
+            self._entry.data(data)
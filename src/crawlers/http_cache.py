@@ -0,0 +1,264 @@
+"""
+HTTP响应磁盘缓存模块
+按规范化后的URL缓存页面内容，保存ETag/Last-Modified用于条件请求重新验证，
+不同类型的页面使用不同的有效期，并在超出容量上限时按最近最少使用（LRU）淘汰
+"""
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from core.config import CACHE_DIR, HTTP_CACHE_MAX_BYTES
+from core.config import CACHE_TTL_INDEX, CACHE_TTL_DEFAULT
+
+# 页面文件名中的年份，例如 fast2024.html、conf/sc/2023.html
+_URL_YEAR_PATTERN = re.compile(r'(?<!\d)((?:19|20)\d{2})(?!\d)[^/]*$')
+
+
+def normalize_url(url):
+    """
+    规范化URL作为缓存键：协议和主机名小写、去掉默认端口和片段、
+    去掉末尾的index.html、查询参数排序
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    path = parts.path or '/'
+    if path.endswith('/index.html'):
+        path = path[:-len('index.html')]
+
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+def get_ttl(url):
+    """
+    根据URL类型返回缓存有效期（秒），None 表示永不过期
+
+    - 会议/期刊索引页（目录形式的URL）：会随新卷期发布而更新，使用较短有效期
+    - 文件名中带有往年年份的卷期/目录页：内容基本不再变化，视为永久有效
+    - 其他页面：使用默认有效期，过期后通过条件请求重新验证
+    """
+    path = urlsplit(url).path
+    if not path or path.endswith('/') or path.endswith('/index.html'):
+        return CACHE_TTL_INDEX
+
+    match = _URL_YEAR_PATTERN.search(path)
+    if match and int(match.group(1)) < time.localtime().tm_year:
+        return None
+
+    return CACHE_TTL_DEFAULT
+
+
+class HttpCache:
+    """基于SQLite索引和内容寻址文件存储的HTTP响应缓存，可在多线程和多进程间共享"""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=HTTP_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.body_dir = os.path.join(cache_dir, "bodies")
+        self.max_bytes = max_bytes
+        os.makedirs(self.body_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(cache_dir, "index.sqlite"),
+                                     timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, url TEXT, final_url TEXT, body_hash TEXT, size INTEGER,"
+            " etag TEXT, last_modified TEXT, content_type TEXT, encoding TEXT,"
+            " fetched_at REAL, last_access REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON entries(last_access)")
+        self._conn.commit()
+
+    def _body_path(self, body_hash):
+        """内容文件路径，按哈希前两位分目录存放"""
+        return os.path.join(self.body_dir, body_hash[:2], body_hash)
+
+    def lookup(self, url):
+        """
+        查找缓存条目
+
+        Returns:
+            条目字典或None，字典中的 fresh 字段表示是否仍在有效期内
+        """
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT final_url, body_hash, etag, last_modified, content_type, encoding, fetched_at"
+                " FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        final_url, body_hash, etag, last_modified, content_type, encoding, fetched_at = row
+        if not os.path.exists(self._body_path(body_hash)):
+            return None
+
+        ttl = get_ttl(url)
+        return {
+            "key": key,
+            "final_url": final_url,
+            "body_hash": body_hash,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_type": content_type,
+            "encoding": encoding,
+            "fresh": ttl is None or time.time() - fetched_at < ttl,
+        }
+
+    def conditional_headers(self, entry):
+        """根据缓存条目生成条件请求头"""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def build_response(self, entry, url, read_body=True):
+        """
+        用缓存内容构造 requests.Response 对象，调用方无需区分是否来自缓存
+
+        Args:
+            read_body: 为False时不读取内容，由调用方通过 iter_body 分块读取
+        """
+        if read_body:
+            with open(self._body_path(entry["body_hash"]), 'rb') as f:
+                body = f.read()
+
+        with self._lock:
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), entry["key"]))
+            self._conn.commit()
+
+        response = requests.Response()
+        response.status_code = 200
+        if read_body:
+            response._content = body
+        response.url = entry["final_url"] or url
+        response.encoding = entry["encoding"]
+        response.headers = CaseInsensitiveDict()
+        if entry["content_type"]:
+            response.headers["Content-Type"] = entry["content_type"]
+        response.from_cache = True
+        return response
+
+    def iter_body(self, entry, chunk_size):
+        """分块读取缓存的内容"""
+        with open(self._body_path(entry["body_hash"]), 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def mark_revalidated(self, entry):
+        """服务器返回304时刷新缓存条目的获取时间"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE entries SET fetched_at = ?, last_access = ? WHERE key = ?",
+                               (now, now, entry["key"]))
+            self._conn.commit()
+
+    def store(self, url, response):
+        """保存200响应到缓存"""
+        body = response.content
+        body_hash = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(body_hash)
+        if not os.path.exists(body_path):
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            # 先写临时文件再重命名，避免并发读取到不完整的内容
+            tmp_path = f"{body_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, body_path)
+        self._add_entry(url, response, body_hash, len(body))
+
+    def store_stream(self, url, response, chunks):
+        """
+        边产出流式响应的各块内容边写入缓存，全部读取完成后才登记到索引；
+        读取中途停止或出错时丢弃已写入的部分
+
+        Args:
+            chunks: 响应体各块内容的迭代器
+
+        Yields:
+            与 chunks 相同的各块内容
+        """
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.body_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+                    yield chunk
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        body_hash = digest.hexdigest()
+        body_path = self._body_path(body_hash)
+        if os.path.exists(body_path):
+            os.remove(tmp_path)
+        else:
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            os.replace(tmp_path, body_path)
+        self._add_entry(url, response, body_hash, size)
+
+    def _add_entry(self, url, response, body_hash, size):
+        """登记已写入的内容文件"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), url, response.url, body_hash, size,
+                 response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                 response.headers.get("Content-Type"), response.encoding, now, now)
+            )
+            self._conn.commit()
+        self.evict()
+
+    def evict(self):
+        """总大小超过上限时，按最近访问时间从旧到新淘汰条目"""
+        with self._lock:
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            removed_hashes = set()
+            for key, body_hash, size in self._conn.execute(
+                    "SELECT key, body_hash, size FROM entries ORDER BY last_access").fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                removed_hashes.add(body_hash)
+                total -= size
+            self._conn.commit()
+
+            # 只删除不再被其他条目引用的内容文件
+            for body_hash in removed_hashes:
+                still_used = self._conn.execute(
+                    "SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone()
+                if not still_used:
+                    try:
+                        os.remove(self._body_path(body_hash))
+                    except OSError:
+                        pass
+
+    def close(self):
+        """关闭索引数据库连接"""
+        with self._lock:
+            self._conn.close()
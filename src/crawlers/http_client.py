@@ -0,0 +1,428 @@
+"""
+HTTP传输模块，为整个爬虫提供共享的连接池会话
+支持长连接复用、gzip/brotli压缩协商、连接/读取超时分离以及指数退避重试，
+可选地通过磁盘缓存复用已下载的页面，并记录每个请求的耗时和流量，便于衡量优化效果
+"""
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.config import PROXIES, CONNECT_TIMEOUT, READ_TIMEOUT
+from core.config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, MAX_CONCURRENCY_PER_HOST
+from core.config import HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR, HTTP_BACKOFF_MAX
+from core.config import HTTP_CACHE_ENABLED, CACHE_DIR, DBLP_MIRRORS, HEDGE_ENABLED, STREAM_CHUNK_SIZE
+from crawlers.http_cache import HttpCache
+from crawlers.mirror_pool import MirrorPool
+from crawlers.rate_limiter import get_rate_limiter, parse_retry_after
+from crawlers.redirect_map import get_redirect_map
+
+# 检查是否安装了brotli解码库（urllib3 在安装 brotli 或 brotlicffi 后才能解码 br 压缩）
+try:
+    import brotli  # noqa: F401
+    BROTLI_SUPPORTED = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_SUPPORTED = True
+    except ImportError:
+        BROTLI_SUPPORTED = False
+
+# 需要重试的HTTP状态码
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 需要重试的网络异常（连接被重置、连接超时、响应体被截断等）
+RETRY_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError)
+
+
+class HttpClient:
+    """共享的HTTP客户端，线程安全，可被同步和异步爬取逻辑同时使用"""
+
+    def __init__(self, pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=None,
+                 connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT,
+                 max_retries=HTTP_MAX_RETRIES, backoff_factor=HTTP_BACKOFF_FACTOR,
+                 backoff_max=HTTP_BACKOFF_MAX, proxies=PROXIES, cache=None, rate_limiter=None, mirrors=None,
+                 redirects=None):
+        if pool_maxsize is None:
+            # 连接池至少要容纳每个主机的并发请求数，否则并发时连接会被反复丢弃重建
+            pool_maxsize = max(HTTP_POOL_MAXSIZE, MAX_CONCURRENCY_PER_HOST)
+
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.cache = cache
+        # 未指定限速器时使用全局限速器，以便命令行参数在运行时生效
+        self.rate_limiter = rate_limiter
+        # dblp镜像调度器（MirrorPool），为None时直接请求原始地址
+        self.mirrors = mirrors
+        # 未指定重定向记录时使用全局记录
+        self.redirects = redirects
+
+        self.session = requests.Session()
+        # 重试由本类自行处理，以便统计每次尝试的耗时
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate, br' if BROTLI_SUPPORTED else 'gzip, deflate'
+        if proxies:
+            self.session.proxies.update(proxies)
+
+        # 请求统计：每条记录为 (url, status, latency, wire_bytes, body_bytes)
+        self._lock = threading.Lock()
+        self.request_log = []
+        self.retry_count = 0
+        self.cache_hits = 0
+        self.cache_revalidated = 0
+
+    def _backoff_delay(self, attempt):
+        """计算第 attempt 次重试前的等待时间（指数退避）"""
+        return min(self.backoff_factor * (2 ** attempt), self.backoff_max)
+
+    def _record(self, url, status, latency, wire_bytes, body_bytes):
+        """记录单次请求的统计信息"""
+        with self._lock:
+            self.request_log.append((url, status, latency, wire_bytes, body_bytes))
+
+    def get(self, url, **kwargs):
+        """
+        获取页面：先按重定向记录将URL改写为最终地址；缓存未过期时直接返回缓存内容，
+        过期时发送条件请求重新验证，否则发送普通GET请求并写入缓存
+
+        Returns:
+            requests.Response 对象，来自缓存的响应带有 from_cache=True 属性
+        """
+        redirects = self.redirects or get_redirect_map()
+        url = redirects.resolve(url)
+        if self.cache is None:
+            response = self._get_with_retries(url, **kwargs)
+            self._learn_redirect(redirects, response)
+            return response
+
+        entry = self.cache.lookup(url)
+        if entry and entry["fresh"]:
+            with self._lock:
+                self.cache_hits += 1
+            return self.cache.build_response(entry, url)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        headers.update(self.cache.conditional_headers(entry))
+        response = self._get_with_retries(url, headers=headers, **kwargs)
+        self._learn_redirect(redirects, response)
+
+        if response.status_code == 304 and entry:
+            self.cache.mark_revalidated(entry)
+            with self._lock:
+                self.cache_revalidated += 1
+            return self.cache.build_response(entry, url)
+        if response.status_code == 200:
+            self.cache.store(url, response)
+        return response
+
+    def get_stream(self, url, chunk_size=STREAM_CHUNK_SIZE, **kwargs):
+        """
+        以流式方式获取页面，重定向记录和磁盘缓存的使用与 get 相同，但不在内存中保留完整的响应体：
+        缓存有效时分块读取缓存文件，否则发送流式请求，200响应边下载边写入缓存
+
+        Returns:
+            (response, chunks)：chunks 逐块产出已解压的响应体；非200响应的内容已完整读取，chunks 产出该内容
+        """
+        redirects = self.redirects or get_redirect_map()
+        url = redirects.resolve(url)
+        entry = self.cache.lookup(url) if self.cache is not None else None
+        if entry and entry["fresh"]:
+            with self._lock:
+                self.cache_hits += 1
+            return self.cache.build_response(entry, url, read_body=False), self.cache.iter_body(entry, chunk_size)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if self.cache is not None:
+            headers.update(self.cache.conditional_headers(entry))
+        response = self._get_with_retries(url, headers=headers, stream=True, **kwargs)
+        self._learn_redirect(redirects, response)
+
+        if response.status_code == 304 and entry:
+            response.close()
+            self.cache.mark_revalidated(entry)
+            with self._lock:
+                self.cache_revalidated += 1
+            return self.cache.build_response(entry, url, read_body=False), self.cache.iter_body(entry, chunk_size)
+        if response.status_code != 200:
+            return response, iter([response.content])
+        chunks = self._iter_response(url, response, chunk_size)
+        if self.cache is not None:
+            chunks = self.cache.store_stream(url, response, chunks)
+        return response, chunks
+
+    def _iter_response(self, url, response, chunk_size):
+        """逐块读取流式响应，读取完成后记录耗时（含下载响应体的时间）和流量，并释放连接"""
+        start = time.perf_counter()
+        body_bytes = 0
+        try:
+            for chunk in response.iter_content(chunk_size):
+                body_bytes += len(chunk)
+                yield chunk
+        except RETRY_EXCEPTIONS:
+            self._record(url, None, response.elapsed.total_seconds() + time.perf_counter() - start, 0, body_bytes)
+            raise
+        finally:
+            response.close()
+        try:
+            wire_bytes = response.raw.tell()
+        except Exception:
+            wire_bytes = body_bytes
+        self._record(url, response.status_code, response.elapsed.total_seconds() + time.perf_counter() - start,
+                     wire_bytes, body_bytes)
+
+    @staticmethod
+    def _learn_redirect(redirects, response):
+        """请求经过重定向时记录重定向链的起点和最终地址"""
+        if response.history:
+            redirects.learn(response.history[0].url, response.url)
+
+    def _send(self, url, rate_limiter, acquire=True, **kwargs):
+        """
+        发送单个GET请求：先从限速器获取令牌（acquire 为False时由调用方获取），记录耗时和流量，
+        服务器通过Retry-After要求暂停时，该主机的所有请求都需等待
+        """
+        if acquire:
+            rate_limiter.acquire(url)
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, **kwargs)
+        except RETRY_EXCEPTIONS:
+            self._record(url, None, time.perf_counter() - start, 0, 0)
+            raise
+        latency = time.perf_counter() - start
+        if kwargs.get('stream') and response.status_code == 200:
+            # 流式响应的内容由调用方逐块读取，读取完成后再记录
+            return response
+        body_bytes = len(response.content)
+        try:
+            # urllib3 记录的是解压前实际传输的字节数
+            wire_bytes = response.raw.tell()
+        except Exception:
+            wire_bytes = body_bytes
+        self._record(url, response.status_code, latency, wire_bytes, body_bytes)
+        if response.status_code in (429, 503):
+            rate_limiter.penalize(url, parse_retry_after(response.headers.get('Retry-After')))
+        return response
+
+    def _get_with_retries(self, url, **kwargs):
+        """
+        发送GET请求，遇到5xx、429或连接错误时按指数退避重试，
+        每次实际发出的请求都会先从限速器获取令牌；
+        配置了镜像时，dblp的请求由镜像调度器选择镜像并在需要时发送对冲请求
+
+        Returns:
+            requests.Response 对象（最后一次尝试的响应）
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        rate_limiter = self.rate_limiter or get_rate_limiter()
+        use_mirrors = self.mirrors is not None and self.mirrors.handles(url)
+        attempt = 0
+        while True:
+            try:
+                if use_mirrors:
+                    # 镜像调度器先获取令牌再计时，限速等待不计入延迟样本和对冲等待时间
+                    response = self.mirrors.fetch(
+                        url, lambda target: self._send(target, rate_limiter, acquire=False, **kwargs),
+                        rate_limiter, hedge=not kwargs.get('stream'))
+                else:
+                    response = self._send(url, rate_limiter, **kwargs)
+            except RETRY_EXCEPTIONS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                print(f"请求 {url} 出错（{e}），{delay:.1f} 秒后重试")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return response
+                retry_after = None
+                if response.status_code in (429, 503):
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                delay = self._backoff_delay(attempt)
+                if retry_after is not None:
+                    # 令牌桶已经会等待到Retry-After指定的时间，这里无需再额外休眠
+                    delay = 0
+                print(f"请求 {url} 返回 {response.status_code}，"
+                      f"{retry_after if retry_after is not None else delay:.1f} 秒后重试")
+
+            with self._lock:
+                self.retry_count += 1
+            attempt += 1
+            if delay > 0:
+                time.sleep(delay)
+
+    def get_stats(self):
+        """汇总请求统计信息"""
+        with self._lock:
+            log = list(self.request_log)
+            retries = self.retry_count
+            cache_hits = self.cache_hits
+            cache_revalidated = self.cache_revalidated
+
+        latencies = sorted(entry[2] for entry in log)
+        stats = {
+            "requests": len(log),
+            "retries": retries,
+            "cache_hits": cache_hits,
+            "cache_revalidated": cache_revalidated,
+            "errors": sum(1 for entry in log if entry[1] is None or entry[1] >= 400),
+            "wire_bytes": sum(entry[3] for entry in log),
+            "body_bytes": sum(entry[4] for entry in log),
+            "total_latency": sum(latencies),
+            "p50_latency": 0.0,
+            "p95_latency": 0.0,
+        }
+        if latencies:
+            stats["p50_latency"] = latencies[int(0.50 * (len(latencies) - 1))]
+            stats["p95_latency"] = latencies[int(0.95 * (len(latencies) - 1))]
+        return stats
+
+    def close(self):
+        """关闭会话，释放连接池"""
+        self.session.close()
+        if self.mirrors is not None:
+            self.mirrors.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+# 全局共享的客户端实例
+_client = None
+_client_lock = threading.Lock()
+
+# 磁盘缓存设置，可在运行时修改
+cache_enabled = HTTP_CACHE_ENABLED
+cache_directory = CACHE_DIR
+
+# dblp镜像设置，可在运行时修改
+mirror_urls = list(DBLP_MIRRORS)
+hedge_enabled = HEDGE_ENABLED
+
+
+def _create_client(**kwargs):
+    """按当前缓存和镜像设置创建客户端"""
+    if 'cache' not in kwargs and cache_enabled:
+        kwargs['cache'] = HttpCache(cache_directory)
+    if 'mirrors' not in kwargs and mirror_urls:
+        kwargs['mirrors'] = MirrorPool(mirror_urls, hedge=hedge_enabled)
+    return HttpClient(**kwargs)
+
+def get_client():
+    """获取全局共享的HTTP客户端，首次调用时创建"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _create_client()
+    return _client
+
+def reset_client(**kwargs):
+    """关闭现有客户端并按给定参数重新创建"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = _create_client(**kwargs)
+    return _client
+
+def set_cache_options(enabled=None, directory=None):
+    """设置是否启用磁盘缓存及缓存目录，已创建的客户端会在下次使用时按新设置重建"""
+    global cache_enabled, cache_directory, _client
+    if enabled is not None:
+        cache_enabled = enabled
+    if directory:
+        cache_directory = directory
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+    return cache_enabled, cache_directory
+
+def set_mirror_options(mirrors=None, hedge=None):
+    """
+    设置dblp镜像列表及是否发送对冲请求，已创建的客户端会在下次使用时按新设置重建
+
+    Args:
+        mirrors: 镜像地址列表，空列表表示不使用镜像、直接请求原始地址
+    """
+    global mirror_urls, hedge_enabled, _client
+    if mirrors is not None:
+        mirror_urls = list(mirrors)
+    if hedge is not None:
+        hedge_enabled = hedge
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+    return mirror_urls, hedge_enabled
+
+def take_stats():
+    """取出本进程的请求统计原始数据并清空，多进程运行时由子进程返回给主进程汇总"""
+    if _client is None:
+        return None
+    with _client._lock:
+        data = {
+            "request_log": _client.request_log,
+            "retry_count": _client.retry_count,
+            "cache_hits": _client.cache_hits,
+            "cache_revalidated": _client.cache_revalidated,
+        }
+        _client.request_log = []
+        _client.retry_count = _client.cache_hits = _client.cache_revalidated = 0
+    rate_limiter = _client.rate_limiter or get_rate_limiter()
+    data["rate_wait"] = rate_limiter.total_wait
+    rate_limiter.total_wait = 0.0
+    if _client.mirrors is not None:
+        data["mirrors"] = _client.mirrors.take_stats()
+    return data
+
+def merge_stats(data):
+    """将子进程返回的请求统计合并到本进程的客户端"""
+    if not data:
+        return
+    client = get_client()
+    with client._lock:
+        client.request_log.extend(data["request_log"])
+        client.retry_count += data["retry_count"]
+        client.cache_hits += data["cache_hits"]
+        client.cache_revalidated += data["cache_revalidated"]
+    (client.rate_limiter or get_rate_limiter()).total_wait += data["rate_wait"]
+    if client.mirrors is not None and data.get("mirrors"):
+        client.mirrors.merge_stats(data["mirrors"])
+
+def print_stats_summary():
+    """打印本次运行的网络请求统计"""
+    if _client is None:
+        return
+    stats = _client.get_stats()
+    if not stats["requests"] and not stats["cache_hits"]:
+        return
+
+    saved = stats["body_bytes"] - stats["wire_bytes"]
+    print("\n网络请求统计:")
+    print(f"- 请求次数: {stats['requests']}（重试 {stats['retries']} 次，失败 {stats['errors']} 次）")
+    print(f"- 缓存命中: {stats['cache_hits']}，条件请求验证未变化: {stats['cache_revalidated']}")
+    print(f"- 传输字节: {stats['wire_bytes']}，解压后字节: {stats['body_bytes']}，压缩节省: {saved}")
+    print(f"- 总耗时: {stats['total_latency']:.2f} 秒，"
+          f"P50: {stats['p50_latency'] * 1000:.0f} ms，P95: {stats['p95_latency'] * 1000:.0f} ms")
+    rate_limiter = _client.rate_limiter or get_rate_limiter()
+    if rate_limiter.enabled:
+        print(f"- 限速等待: {rate_limiter.total_wait:.2f} 秒")
+    if _client.mirrors is not None:
+        mirror_stats = _client.mirrors.get_stats()
+        with _client._lock:
+            log = list(_client.request_log)
+        hosts = {}
+        for url, *_ in log:
+            if _client.mirrors.handles(url):
+                host = urlsplit(url).netloc
+                hosts[host] = hosts.get(host, 0) + 1
+        if hosts or mirror_stats['hedged'] or mirror_stats['breaker_opens']:
+            per_host = "，".join(f"{host} {count} 次" for host, count in sorted(hosts.items()))
+            print(f"- 镜像: {per_host or '无'}；对冲请求 {mirror_stats['hedged']} 次"
+                  f"（对冲先返回 {mirror_stats['hedge_wins']} 次），熔断 {mirror_stats['breaker_opens']} 次")
@@ -0,0 +1,220 @@
+"""
+多关键词匹配模块
+基于 Aho-Corasick 自动机，一次线性扫描即可找出文本中出现的全部关键词，
+匹配规则与逐个关键词构建正则的方式一致：忽略大小写、短语中的空格可匹配任意空白、可选词边界
+"""
+import re
+from functools import lru_cache
+
+# 文本中连续的空白字符，归一化为单个空格后再匹配
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _normalize_keyword(keyword):
+    """关键词转小写，连续空格合并为一个（正则中每个空格都对应 \\s+）"""
+    return re.sub(r' +', ' ', keyword.lower())
+
+def _normalize_text(text):
+    """文本转小写，连续空白合并为一个空格"""
+    return _WHITESPACE_PATTERN.sub(' ', text.lower())
+
+def _is_word_char(ch):
+    """与正则 \\w 相同的单词字符判断"""
+    return ch.isalnum() or ch == '_'
+
+def _at_boundary(text, pos):
+    """判断 pos 位置是否为词边界（与正则 \\b 相同）"""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+class KeywordMatcher:
+    """
+    预编译的关键词匹配器，构建一次后可重复用于大量标题
+
+    Args:
+        keywords: 关键词列表
+        mode: 'AND' 要求全部关键词出现，'OR' 只需任一关键词出现
+        word_boundary: 是否要求关键词两侧为词边界
+    """
+
+    def __init__(self, keywords, mode='AND', word_boundary=False):
+        self.keywords = [k for k in keywords if k]
+        self.mode = 'AND' if mode and mode.upper() == 'AND' else 'OR'
+        self.word_boundary = word_boundary
+
+        # 相同的关键词（归一化后）只在自动机中出现一次，命中时对应所有原始关键词
+        self._patterns = []
+        self._keyword_patterns = []
+        pattern_index = {}
+        for k in self.keywords:
+            pattern = _normalize_keyword(k)
+            if pattern not in pattern_index:
+                pattern_index[pattern] = len(self._patterns)
+                self._patterns.append(pattern)
+            self._keyword_patterns.append(pattern_index[pattern])
+
+        # 预筛选：文本中不包含任何关键词时直接返回，由正则引擎在C层完成扫描
+        self._prefilter = re.compile('|'.join(re.escape(p) for p in self._patterns)) if self._patterns else None
+        # 只有一个关键词时直接使用预编译正则，比逐字符遍历自动机更快
+        self._single = None
+        if len(self._patterns) == 1:
+            esc = re.escape(self._patterns[0]).replace(r'\ ', r'\s+')
+            self._single = re.compile(rf"\b{esc}\b" if word_boundary else esc, re.IGNORECASE)
+        self._build_automaton()
+
+    def _build_automaton(self):
+        """构建 Aho-Corasick 自动机：转移表、失败指针和每个状态的输出"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for index, pattern in enumerate(self._patterns):
+            state = 0
+            for ch in pattern:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # 按层次遍历设置失败指针，并把失败状态的输出合并到当前状态
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _scan(self, text):
+        """
+        一次扫描找出命中的关键词，满足 AND/OR 条件后提前结束
+
+        Returns:
+            命中的关键词序号集合
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        word_boundary = self.word_boundary
+        needed = len(self._patterns) if self.mode == 'AND' else 1
+        found = set()
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in output[state]:
+                if index in found:
+                    continue
+                if word_boundary:
+                    end = pos + 1
+                    if not (_at_boundary(text, end - len(self._patterns[index])) and _at_boundary(text, end)):
+                        continue
+                found.add(index)
+                if len(found) >= needed:
+                    return found
+        return found
+
+    def match(self, text):
+        """
+        在文本中匹配关键词
+
+        Returns:
+            (matched: bool, matched_keywords: list)，matched_keywords 按关键词原有顺序排列；
+            由于提前结束扫描，OR 模式下只包含最先找到的关键词
+        """
+        if not text or not self._patterns:
+            return False, []
+
+        if self._single is not None:
+            if self._single.search(text):
+                return True, list(self.keywords)
+            return False, []
+
+        text = _normalize_text(text)
+        if not self._prefilter.search(text):
+            return False, []
+
+        found = self._scan(text)
+        matched = [k for k, index in zip(self.keywords, self._keyword_patterns) if index in found]
+        if self.mode == 'AND':
+            return len(found) == len(self._patterns), matched
+        return len(found) > 0, matched
+
+
+@lru_cache(maxsize=32)
+def get_keyword_matcher(keywords, mode='AND', word_boundary=False):
+    """按参数缓存匹配器，keywords 需为元组"""
+    return KeywordMatcher(keywords, mode, word_boundary)
+
+
+class KeywordProfile:
+    """
+    一组命名的关键词配置，包含关键词、匹配模式、词边界和匹配范围
+
+    Args:
+        name: 配置名称，同时作为输出子目录名；默认配置为空字符串，结果直接写入输出目录
+        keywords: 关键词列表
+        mode: 'AND' 或 'OR'
+        word_boundary: 是否使用词边界
+        match_scope: 'title' 只匹配标题，其他值在标题无结果时按条目全文匹配
+    """
+
+    def __init__(self, name, keywords, mode='AND', word_boundary=False, match_scope='title'):
+        self.name = name
+        self.keywords = [str(k).strip() for k in keywords if k]
+        self.mode = mode
+        self.word_boundary = word_boundary
+        self.match_scope = match_scope
+        self.matcher = KeywordMatcher(keywords, mode, word_boundary)
+
+    def match(self, text):
+        """在文本中匹配本组关键词，返回 (matched, matched_keywords)"""
+        return self.matcher.match(text)
+
+    def describe(self):
+        """返回用于日志的关键词描述字符串"""
+        joined = ', '.join(self.keywords) if self.keywords else '指定'
+        if self.mode and self.mode.upper() == 'AND':
+            desc = f"同时包含 {joined} 关键词"
+        else:
+            desc = f"包含任一关键词 ({joined})"
+        return f"[{self.name}] {desc}" if self.name else desc
+
+
+def build_keyword_profiles(profiles, keywords, mode='AND', word_boundary=False, match_scope='title'):
+    """
+    根据配置构建关键词配置列表
+
+    Args:
+        profiles: {名称: {"keywords": [...], "mode": ..., "word_boundary": ..., "match_scope": ...}}，
+                  未指定的选项使用全局默认值；为空时只使用默认配置
+        keywords, mode, word_boundary, match_scope: 全局默认的关键词配置
+
+    Returns:
+        KeywordProfile 列表，顺序与配置一致
+    """
+    if not profiles:
+        return [KeywordProfile("", keywords, mode, word_boundary, match_scope)]
+
+    result = []
+    for name, options in profiles.items():
+        profile_keywords = options.get("keywords", keywords)
+        if isinstance(profile_keywords, str):
+            profile_keywords = [profile_keywords]
+        result.append(KeywordProfile(
+            str(name),
+            profile_keywords,
+            options.get("mode", mode),
+            options.get("word_boundary", word_boundary),
+            options.get("match_scope", match_scope),
+        ))
+    return result
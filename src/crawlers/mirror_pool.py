@@ -0,0 +1,297 @@
+"""
+dblp镜像调度模块
+将发往dblp的请求分散到多个镜像：优先选择限速器中等待时间最短、最近没有失败的镜像；
+连续失败或响应过慢的镜像被熔断一段时间，冷却后放行一个试探请求决定是否恢复；
+请求耗时超过已观测到的P95延迟时，向另一个镜像发送对冲请求，先成功返回的结果生效，
+避免个别卡住的请求拖住整个顺序爬取
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlsplit, urlunsplit
+
+from core.config import DBLP_HOSTS, MIRROR_FAILURE_THRESHOLD, MIRROR_COOLDOWN, MIRROR_SLOW_SECONDS
+from core.config import HEDGE_ENABLED, HEDGE_MIN_SAMPLES, HEDGE_DEFAULT_DELAY, HEDGE_MIN_DELAY
+
+# 计算P95延迟时保留的最近请求数
+LATENCY_WINDOW = 200
+
+
+class Mirror:
+    """一个镜像及其熔断状态"""
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url.rstrip('/'))
+        self.scheme = parts.scheme.lower()
+        self.netloc = parts.netloc.lower()
+        self.failures = 0
+        self.open_until = 0.0
+        self.probing = False
+        self.in_flight = 0
+        self.requests = 0
+
+    @property
+    def name(self):
+        return self.netloc
+
+    def rewrite(self, url):
+        """将URL的协议和主机替换为本镜像"""
+        parts = urlsplit(url)
+        return urlunsplit((self.scheme, self.netloc, parts.path, parts.query, parts.fragment))
+
+    def is_open(self, now):
+        """熔断中（冷却时间未到，或冷却后的试探请求尚未返回）"""
+        return self.open_until > 0 and (now < self.open_until or self.probing)
+
+
+class MirrorPool:
+    """
+    镜像调度器，线程安全
+
+    Args:
+        mirrors: 镜像地址列表，例如 ["https://dblp.org", "https://dblp.dagstuhl.de"]
+        hedge: 是否发送对冲请求
+    """
+
+    def __init__(self, mirrors, failure_threshold=MIRROR_FAILURE_THRESHOLD, cooldown=MIRROR_COOLDOWN,
+                 slow_seconds=MIRROR_SLOW_SECONDS, hedge=HEDGE_ENABLED, hedge_min_samples=HEDGE_MIN_SAMPLES,
+                 hedge_default_delay=HEDGE_DEFAULT_DELAY, hedge_min_delay=HEDGE_MIN_DELAY):
+        self.mirrors = [Mirror(url) for url in mirrors]
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.slow_seconds = slow_seconds
+        self.hedge = hedge and len(self.mirrors) > 1
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_default_delay = hedge_default_delay
+        self.hedge_min_delay = hedge_min_delay
+        self._hosts = set(DBLP_HOSTS) | {mirror.netloc for mirror in self.mirrors}
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._executor_pid = None
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.breaker_opens = 0
+
+    def _get_executor(self):
+        """对冲请求使用的线程池，首次使用时创建；fork出的子进程中线程不存在，需要重新创建"""
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                # 被放弃的慢请求会继续占用线程直到超时，因此线程数要留有余量
+                self._executor = ThreadPoolExecutor(max_workers=max(8, 4 * len(self.mirrors)),
+                                                    thread_name_prefix="mirror")
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def handles(self, url):
+        """URL是否指向dblp（可由镜像提供）"""
+        return urlsplit(url).netloc.lower() in self._hosts
+
+    def hedge_delay(self):
+        """对冲等待时间：已观测到的P95延迟，样本不足时使用默认值"""
+        with self._lock:
+            if len(self._latencies) < self.hedge_min_samples:
+                return self.hedge_default_delay
+            latencies = sorted(self._latencies)
+        return max(self.hedge_min_delay, latencies[int(0.95 * (len(latencies) - 1))])
+
+    def choose(self, rate_limiter=None, exclude=()):
+        """
+        选择一个镜像：跳过熔断中的镜像，按限速等待时间、连续失败次数、进行中的请求数和已发请求数排序
+
+        Returns:
+            Mirror；所有候选镜像都在熔断中时选择最早恢复的一个，没有候选镜像时返回None
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [mirror for mirror in self.mirrors if mirror not in exclude]
+            if not candidates:
+                return None
+            available = [mirror for mirror in candidates if not mirror.is_open(now)]
+            if not available:
+                if exclude:
+                    return None
+                available = [min(candidates, key=lambda mirror: mirror.open_until)]
+
+        def sort_key(mirror):
+            wait_time = rate_limiter.estimate_wait(mirror.rewrite("http://x/")) if rate_limiter else 0.0
+            return round(wait_time, 3), mirror.failures, mirror.in_flight, mirror.requests
+
+        mirror = min(available, key=sort_key)
+        with self._lock:
+            if mirror.open_until and now >= mirror.open_until:
+                # 冷却结束，放行一个试探请求
+                mirror.probing = True
+            mirror.in_flight += 1
+            mirror.requests += 1
+        return mirror
+
+    def _record(self, mirror, ok, latency=None):
+        """记录请求结果，更新镜像的熔断状态和延迟样本"""
+        with self._lock:
+            mirror.in_flight -= 1
+            was_probing = mirror.probing
+            mirror.probing = False
+            if ok:
+                mirror.failures = 0
+                mirror.open_until = 0.0
+                self._latencies.append(latency)
+                return
+            mirror.failures += 1
+            if mirror.failures < self.failure_threshold and not was_probing:
+                return
+            mirror.open_until = time.monotonic() + self.cooldown
+            self.breaker_opens += 1
+        print(f"镜像 {mirror.name} 连续失败 {mirror.failures} 次，暂停使用 {self.cooldown} 秒")
+
+    @staticmethod
+    def _acquire(mirror, url, rate_limiter):
+        """从限速器获取发往镜像的令牌；本地等待令牌的时间不计入延迟、对冲等待和慢响应判断"""
+        if rate_limiter is not None:
+            rate_limiter.acquire(mirror.rewrite(url))
+
+    def _call(self, mirror, url, send):
+        """
+        向指定镜像发送请求并记录结果，5xx、429、连接错误和慢响应都计为失败；
+        调用前需已获取令牌，记录的延迟只包含网络请求的时间
+        """
+        start = time.perf_counter()
+        try:
+            response = send(mirror.rewrite(url))
+        except Exception:
+            self._record(mirror, False)
+            raise
+        latency = time.perf_counter() - start
+        ok = self._usable(response) and latency <= self.slow_seconds
+        self._record(mirror, ok, latency)
+        return response
+
+    def _acquired_call(self, mirror, url, send, rate_limiter):
+        """获取令牌后向指定镜像发送请求，用于对冲请求"""
+        try:
+            self._acquire(mirror, url, rate_limiter)
+        except Exception:
+            self._record(mirror, False)
+            raise
+        return self._call(mirror, url, send)
+
+    @staticmethod
+    def _usable(response):
+        return response.status_code < 500 and response.status_code != 429
+
+    def fetch(self, url, send, rate_limiter=None, hedge=True):
+        """
+        通过镜像获取页面：镜像返回5xx、429或连接出错时立即改用下一个可用镜像，
+        所有镜像都失败后再由调用方按退避策略重试
+
+        Args:
+            url: 原始URL，只使用其路径和查询参数
+            send: 发送单个请求的函数，参数为改写后的URL，返回 requests.Response；不从限速器获取令牌
+            rate_limiter: 限速器，用于比较各镜像的限速等待时间，并在发送每个请求前获取令牌
+            hedge: 是否允许发送对冲请求；流式请求不发送，被放弃的响应仍在下载，连接无法及时释放
+
+        Returns:
+            最先成功返回的响应；都失败时返回最后一个失败的响应或抛出最后一个异常
+        """
+        tried = []
+        fallback = None
+        error = None
+        while True:
+            mirror = self.choose(rate_limiter, exclude=tried)
+            if mirror is None:
+                break
+            if tried:
+                print(f"请求 {url} 在 {tried[-1].name} 上失败，改用 {mirror.name}")
+            tried.append(mirror)
+            try:
+                self._acquire(mirror, url, rate_limiter)
+            except Exception:
+                self._record(mirror, False)
+                raise
+            try:
+                response = self._hedged_call(mirror, url, send, rate_limiter, tried, hedge)
+            except Exception as e:
+                error = e
+                continue
+            if self._usable(response):
+                return response
+            fallback = response
+        if fallback is not None:
+            return fallback
+        raise error
+
+    def _hedged_call(self, primary, url, send, rate_limiter, tried, hedge=True):
+        """
+        向 primary 发送请求（调用前已获取令牌，对冲等待时间从请求发出时开始计算），
+        超过对冲等待时间仍未返回时向另一个镜像发送对冲请求（加入 tried），
+        返回先成功的响应；都失败时返回失败的响应或抛出异常
+        """
+        if not (self.hedge and hedge):
+            return self._call(primary, url, send)
+
+        delay = self.hedge_delay()
+        executor = self._get_executor()
+        first = executor.submit(self._call, primary, url, send)
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result()
+        secondary = self.choose(rate_limiter, exclude=tried)
+        if secondary is None:
+            return first.result()
+
+        print(f"请求 {url} 在 {primary.name} 上超过 {delay:.2f} 秒未返回，向 {secondary.name} 发送对冲请求")
+        tried.append(secondary)
+        with self._lock:
+            self.hedged += 1
+        hedge = executor.submit(self._acquired_call, secondary, url, send, rate_limiter)
+        pending = {first, hedge}
+        fallback = None
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    error = e
+                    continue
+                if self._usable(response):
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return response
+                fallback = response
+        if fallback is not None:
+            return fallback
+        raise error
+
+    def get_stats(self):
+        """对冲和熔断的统计"""
+        with self._lock:
+            return {
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "breaker_opens": self.breaker_opens,
+            }
+
+    def take_stats(self):
+        """取出统计并清空，多进程运行时由子进程返回给主进程汇总"""
+        with self._lock:
+            stats = {"hedged": self.hedged, "hedge_wins": self.hedge_wins, "breaker_opens": self.breaker_opens}
+            self.hedged = self.hedge_wins = self.breaker_opens = 0
+        return stats
+
+    def merge_stats(self, stats):
+        """合并子进程的统计"""
+        with self._lock:
+            self.hedged += stats.get("hedged", 0)
+            self.hedge_wins += stats.get("hedge_wins", 0)
+            self.breaker_opens += stats.get("breaker_opens", 0)
+
+    def close(self):
+        """关闭对冲请求使用的线程池，不等待被放弃的慢请求"""
+        if self._executor is not None and self._executor_pid == os.getpid():
+            self._executor.shutdown(wait=False)
+        self._executor = None
@@ -0,0 +1,122 @@
+"""
+解析进程池模块
+并发爬取时下载在主进程中进行，BeautifulSoup解析、条目提取和关键词匹配都是CPU密集的Python代码，
+在线程中执行时受GIL限制，页面多时成为瓶颈。本模块将已下载的卷期/目录页原始内容交给进程池解析和匹配，
+传给子进程的只有页面原始字节和少量参数，传回的只有匹配到的论文 (标题, 链接, 链接类型)、条目数和日志；
+全部条目由子进程直接写入本地论文库
+"""
+import contextlib
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from core.config import PARSE_WORKERS
+from crawlers import web_crawler
+from crawlers.keyword_matcher import KeywordProfile
+from utils.paper import Paper
+from utils.paper_store import PaperStore
+
+# 解析进程数，0 表示不使用进程池
+parse_workers = PARSE_WORKERS
+
+_pool = None
+# 创建进程池时使用的运行选项，选项变化后重建进程池
+_pool_options = None
+
+# 子进程中按文件路径打开的论文库
+_worker_stores = {}
+
+
+def set_parse_workers(workers):
+    """设置解析进程数，0 表示在主进程中解析；已创建的进程池会关闭，下次使用时按新设置重建"""
+    global parse_workers
+    parse_workers = max(0, int(workers or 0))
+    shutdown_parse_pool()
+    return parse_workers
+
+def use_parse_pool():
+    """当前是否将页面交给进程池解析；处理专题的子进程（守护进程）不能再创建子进程，在本进程中解析"""
+    return parse_workers > 0 and not multiprocessing.current_process().daemon
+
+def get_worker_options():
+    """子进程需要与主进程一致的运行选项：爬取后端、HTML解析器和关键词配置"""
+    profiles = tuple((p.name, tuple(p.keywords), p.mode, p.word_boundary, p.match_scope)
+                     for p in web_crawler.get_keyword_profiles())
+    return web_crawler.crawl_backend, web_crawler.html_parser, profiles
+
+def get_parse_pool():
+    """获取解析进程池，首次使用或运行选项变化时创建"""
+    global _pool, _pool_options
+    options = get_worker_options()
+    if _pool is not None and options != _pool_options:
+        shutdown_parse_pool()
+    if _pool is None:
+        context = multiprocessing.get_context()
+        _pool = ProcessPoolExecutor(parse_workers, mp_context=context,
+                                    initializer=init_parse_worker, initargs=options)
+        _pool_options = options
+    return _pool
+
+def shutdown_parse_pool():
+    """关闭解析进程池"""
+    global _pool, _pool_options
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+        _pool_options = None
+
+def init_parse_worker(backend, parser, profiles):
+    """解析子进程初始化：恢复主进程的运行选项"""
+    web_crawler.set_crawl_backend(backend)
+    web_crawler.set_html_parser(parser)
+    web_crawler.set_keyword_profiles([KeywordProfile(name, list(keywords), mode, word_boundary, match_scope)
+                                      for name, keywords, mode, word_boundary, match_scope in profiles])
+
+def _get_worker_store(db_path):
+    """子进程使用的论文库，同一文件只打开一次"""
+    if not db_path:
+        return None
+    store = _worker_stores.get(db_path)
+    if store is None:
+        store = PaperStore(db_path)
+        _worker_stores[db_path] = store
+    return store
+
+def match_page_content(url, year, content, kind, db_path=None):
+    """
+    在子进程中解析论文列表页面，按每组关键词配置匹配，并将全部条目写入 db_path 指定的论文库
+
+    Returns:
+        ({配置名称: [(标题, 链接, 链接类型)]}, 条目数, 日志)
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        web_crawler.set_entry_store(_get_worker_store(db_path))
+        page = web_crawler.PageMatch(url, year)
+        soup = web_crawler.parse_document(content, kind, web_crawler.SUBTREE_ENTRIES)
+        for entry in web_crawler.parse_page_entries(soup):
+            page.add(entry)
+        results = page.finish()
+    compact = {name: [(paper.title, paper.link, paper.link_kind) for paper in papers]
+               for name, papers in results.items()}
+    return compact, page.count, log.getvalue()
+
+def submit_page(url, year, content, kind):
+    """
+    将已下载的论文列表页面交给进程池解析和匹配，返回 concurrent.futures.Future，结果由 page_result 处理；
+    原始内容保存到页面缓存，之后需要该页面的其他部分时不必重新下载
+    """
+    web_crawler.document_cache.put_content(url, content, kind)
+    store = web_crawler.entry_store
+    db_path = store.db_path if store is not None else None
+    return get_parse_pool().submit(match_page_content, url, year, content, kind, db_path)
+
+def page_result(url, result):
+    """输出子进程的日志，记录条目数，返回 {配置名称: Paper 列表}"""
+    compact, count, log = result
+    if log:
+        print(log, end='')
+    if url in web_crawler.page_fingerprints:
+        web_crawler.page_fingerprints[url]["entries"] = count
+    return {name: [Paper(title, link, link_kind) for title, link, link_kind in papers]
+            for name, papers in compact.items()}
@@ -0,0 +1,146 @@
+"""
+请求限速模块，按主机使用令牌桶控制请求速率
+只有真正发往网络的请求才会消耗令牌（缓存命中、跳过的链接不计），
+并在服务器返回429/503的Retry-After时暂停对该主机的所有请求
+"""
+import email.utils
+import threading
+import time
+from urllib.parse import urlparse
+
+from core.config import RATE_LIMIT_PER_HOST, RATE_LIMIT_BURST
+
+
+def parse_retry_after(value):
+    """
+    解析Retry-After响应头
+
+    Args:
+        value: 响应头的值，可以是秒数或HTTP日期
+
+    Returns:
+        需要等待的秒数，无法解析时返回None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_time = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_time is None:
+        return None
+    return max(0.0, retry_time.timestamp() - time.time())
+
+
+class TokenBucket:
+    """令牌桶：以固定速率补充令牌，最多积累 capacity 个，允许短时突发"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = max(1.0, float(capacity))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        # 服务器要求暂停（Retry-After）时，在此时间点之前不发放令牌
+        self.blocked_until = 0.0
+
+    def reserve(self):
+        """预定一个令牌，返回获得令牌前需要等待的秒数（调用方需持有锁）"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        wait = max(0.0, self.blocked_until - now)
+        # 允许令牌数为负，表示已被预定的未来令牌，保证并发请求按顺序排队
+        self.tokens -= 1
+        if self.tokens < 0:
+            wait = max(wait, -self.tokens / self.rate)
+        return wait
+
+    def estimate(self):
+        """不预定令牌，估计现在请求需要等待的秒数（调用方需持有锁）"""
+        now = time.monotonic()
+        tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        wait = max(0.0, self.blocked_until - now)
+        if tokens < 1:
+            wait = max(wait, (1 - tokens) / self.rate)
+        return wait
+
+
+class RateLimiter:
+    """按主机划分的令牌桶限速器，线程安全"""
+
+    def __init__(self, rate=RATE_LIMIT_PER_HOST, burst=RATE_LIMIT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.total_wait = 0.0
+
+    @property
+    def enabled(self):
+        return bool(self.rate and self.rate > 0)
+
+    def _get_bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, url):
+        """为发往 url 所属主机的请求获取令牌，必要时阻塞等待"""
+        if not self.enabled:
+            return 0.0
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            wait = self._get_bucket(host).reserve()
+            self.total_wait += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def estimate_wait(self, url):
+        """估计现在向 url 所属主机发送请求需要等待的秒数，不消耗令牌"""
+        if not self.enabled:
+            return 0.0
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            return bucket.estimate() if bucket is not None else 0.0
+
+    def penalize(self, url, seconds):
+        """服务器要求暂停时，在 seconds 秒内不再向该主机发送请求"""
+        if not seconds or seconds <= 0:
+            return
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._get_bucket(host)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + seconds)
+
+
+# 全局共享的限速器实例
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter():
+    """获取全局共享的限速器"""
+    return _rate_limiter
+
+def set_rate_limit(rate=None, burst=None):
+    """
+    设置每个主机的请求速率
+
+    Args:
+        rate: 每秒请求数，0 或负数表示不限速
+        burst: 令牌桶容量，即允许的最大突发请求数
+    """
+    global _rate_limiter
+    if rate is None:
+        rate = _rate_limiter.rate
+    if burst is None:
+        burst = _rate_limiter.burst
+    _rate_limiter = RateLimiter(rate, burst)
+    return _rate_limiter
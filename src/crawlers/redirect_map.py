@@ -0,0 +1,165 @@
+"""
+重定向记录模块
+输入文件中的链接大多是 http://dblp.uni-trier.de/db/... 形式，首次请求都要先经过HTTP→HTTPS和镜像主机的重定向。
+请求被重定向时记录重定向的目标并保存到文件，之后（包括以后的运行）请求前先将URL改写为最终地址，
+不再重复经过重定向链；相对链接也以最终地址为基准拼接
+"""
+import json
+import os
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+from core.config import REDIRECT_MAP_FILE
+from crawlers.http_cache import normalize_url
+from crawlers.url_frontier import canonicalize_url
+
+# 改写URL时最多连续应用的重定向次数，防止记录中出现循环
+MAX_REDIRECT_HOPS = 5
+
+
+def _origin(url):
+    """URL的协议和主机部分，例如 http://dblp.uni-trier.de"""
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+class RedirectMap:
+    """
+    重定向记录，线程安全
+
+    记录分两类：整个主机的重定向（路径不变，只有协议或主机变化，例如 http://dblp.uni-trier.de → https://dblp.org），
+    以及单个页面的重定向（路径变化，例如 /db/conf/sosp → /db/conf/sosp/，以规范化后的URL为键）
+
+    Args:
+        path: 保存记录的JSON文件，为None时只保存在内存中
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._lock = threading.Lock()
+        self.origins = {}  # {原协议和主机: 目标协议和主机}
+        self.urls = {}  # {规范化URL: 目标URL}
+        self.load()
+
+    def _read_file(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}, {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get("origins", {}), data.get("urls", {})
+        except Exception as e:
+            print(f"读取重定向记录 {self.path} 时出错: {e}")
+            return {}, {}
+
+    def load(self):
+        """从文件加载重定向记录"""
+        origins, urls = self._read_file()
+        with self._lock:
+            self.origins.update(origins)
+            self.urls.update(urls)
+
+    def save(self):
+        """保存重定向记录，先合并文件中其他进程写入的记录，再写临时文件并重命名"""
+        if not self.path:
+            return
+        origins, urls = self._read_file()
+        with self._lock:
+            origins.update(self.origins)
+            urls.update(self.urls)
+            self.origins, self.urls = origins, urls
+            data = {"origins": dict(origins), "urls": dict(urls)}
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"保存重定向记录 {self.path} 时出错: {e}")
+
+    def resolve(self, url):
+        """
+        将URL改写为已记录的最终地址，没有记录时原样返回；保留原URL中的片段
+
+        Returns:
+            改写后的URL
+        """
+        fragment = urlsplit(url).fragment
+        with self._lock:
+            for _ in range(MAX_REDIRECT_HOPS):
+                target = self.urls.get(canonicalize_url(url))
+                if target is None:
+                    origin = self.origins.get(_origin(url))
+                    if origin is not None:
+                        parts = urlsplit(url)
+                        target = origin + urlunsplit(('', '', parts.path, parts.query, parts.fragment))
+                if target is None or target == url:
+                    break
+                url = target
+        if fragment and not urlsplit(url).fragment:
+            url = f"{url}#{fragment}"
+        return url
+
+    def learn(self, url, final_url):
+        """
+        记录一次重定向
+
+        Args:
+            url: 重定向链中的第一个请求地址
+            final_url: 重定向后的最终地址
+
+        Returns:
+            是否新增了记录
+        """
+        source = normalize_url(url)
+        target = normalize_url(final_url)
+        if source == target:
+            return False
+        source_parts = urlsplit(source)
+        target_parts = urlsplit(target)
+        with self._lock:
+            if (source_parts.path, source_parts.query) == (target_parts.path, target_parts.query):
+                key, value, table = _origin(source), _origin(target), self.origins
+            else:
+                key, value, table = canonicalize_url(source), canonicalize_url(target), self.urls
+            if key == value or table.get(key) == value:
+                return False
+            table[key] = value
+        print(f"记录重定向: {key} → {value}")
+        self.save()
+        return True
+
+    def clear(self):
+        """清空内存中的记录"""
+        with self._lock:
+            self.origins.clear()
+            self.urls.clear()
+
+
+# 全局共享的重定向记录
+_redirect_map = None
+_redirect_map_lock = threading.Lock()
+
+
+def get_redirect_map():
+    """获取全局重定向记录，首次调用时从 REDIRECT_MAP_FILE 加载"""
+    global _redirect_map
+    if _redirect_map is None:
+        with _redirect_map_lock:
+            if _redirect_map is None:
+                _redirect_map = RedirectMap(REDIRECT_MAP_FILE)
+    return _redirect_map
+
+def set_redirect_map(redirect_map):
+    """替换全局重定向记录，例如使用其他文件或只保存在内存中的记录"""
+    global _redirect_map
+    with _redirect_map_lock:
+        _redirect_map = redirect_map
+    return redirect_map
+
+def resolve_url(url):
+    """按全局重定向记录将URL改写为最终地址"""
+    return get_redirect_map().resolve(url)
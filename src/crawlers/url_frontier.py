@@ -0,0 +1,120 @@
+"""
+URL前沿模块
+登记本次运行中要处理的页面及其状态（待处理、已下载、失败及原因）。
+URL先规范化再登记：dblp镜像主机统一为同一主机、去掉片段和末尾的index.html，
+同一页面的不同写法只处理一次。未指定数据库文件时状态保存在内存中；
+指定SQLite文件时状态写入文件，可在多个进程间共享，运行结束后仍可查看
+"""
+import sqlite3
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+from core.config import DBLP_HOSTS
+from crawlers.http_cache import normalize_url
+
+# 页面状态
+STATE_PENDING = 'pending'
+STATE_FETCHED = 'fetched'
+STATE_FAILED = 'failed'
+
+
+def canonicalize_url(url):
+    """
+    规范化URL作为前沿中的键：在 normalize_url 的基础上，将dblp的镜像主机和协议统一为
+    https://dblp.org，例如 http://dblp.uni-trier.de/db/journals/tocs/index.html 与
+    https://dblp.org/db/journals/tocs/ 规范化后相同
+    """
+    parts = urlsplit(normalize_url(url))
+    if parts.netloc in DBLP_HOSTS:
+        parts = parts._replace(scheme='https', netloc=DBLP_HOSTS[0])
+    return urlunsplit(parts)
+
+
+class UrlFrontier:
+    """
+    页面登记表，可在多线程间共享；指定 db_path 时基于SQLite，可在多进程间共享
+
+    Args:
+        db_path: SQLite文件路径，为None时只保存在内存中
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._states = {}
+        self._conn = None
+        if db_path:
+            self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY, state TEXT NOT NULL, reason TEXT)")
+            self._conn.commit()
+
+    def claim(self, url):
+        """
+        登记页面
+
+        Returns:
+            True 表示页面首次登记（状态为待处理），False 表示本次运行中已登记过
+        """
+        key = canonicalize_url(url)
+        with self._lock:
+            if self._conn is None:
+                if key in self._states:
+                    return False
+                self._states[key] = (STATE_PENDING, None)
+                return True
+            cursor = self._conn.execute("INSERT OR IGNORE INTO urls (url, state) VALUES (?, ?)", (key, STATE_PENDING))
+            self._conn.commit()
+            return cursor.rowcount == 1
+
+    def _set_state(self, url, state, reason=None):
+        key = canonicalize_url(url)
+        with self._lock:
+            if self._conn is None:
+                self._states[key] = (state, reason)
+                return
+            self._conn.execute("INSERT OR REPLACE INTO urls (url, state, reason) VALUES (?, ?, ?)",
+                               (key, state, reason))
+            self._conn.commit()
+
+    def mark_fetched(self, url):
+        """记录页面已下载"""
+        self._set_state(url, STATE_FETCHED)
+
+    def mark_failed(self, url, reason):
+        """记录页面下载失败及原因"""
+        self._set_state(url, STATE_FAILED, str(reason))
+
+    def get_state(self, url):
+        """
+        Returns:
+            (状态, 失败原因)，未登记时返回None
+        """
+        key = canonicalize_url(url)
+        with self._lock:
+            if self._conn is None:
+                return self._states.get(key)
+            row = self._conn.execute("SELECT state, reason FROM urls WHERE url = ?", (key,)).fetchone()
+            return tuple(row) if row else None
+
+    def failures(self):
+        """下载失败的页面 {规范化URL: 失败原因}"""
+        with self._lock:
+            if self._conn is None:
+                return {url: reason for url, (state, reason) in self._states.items() if state == STATE_FAILED}
+            return dict(self._conn.execute("SELECT url, reason FROM urls WHERE state = ?", (STATE_FAILED,)))
+
+    def clear(self):
+        """清空登记的全部页面"""
+        with self._lock:
+            self._states.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM urls")
+                self._conn.commit()
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,34 +1,79 @@
 """
 网页爬取模块，用于从网页中爬取相关数据
 """
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import hashlib
 import re
 import time
 from urllib.parse import urljoin
-from core.config import PROXIES, TIMEOUT, TARGET_YEARS, TARGET_KEYWORDS
-from core.config import TARGET_KEYWORDS_MODE, TARGET_KEYWORDS_WORD_BOUNDARY, MATCH_SCOPE
-from core.config import TARGET_KEYWORDS as CONFIG_KEYWORDS
+from core.config import TARGET_YEARS, TARGET_KEYWORDS
+from core.config import TARGET_KEYWORDS_MODE, TARGET_KEYWORDS_WORD_BOUNDARY, MATCH_SCOPE, CRAWL_BACKEND
+from core.config import KEYWORD_PROFILES, HTML_PARSER, STREAM_PARSE_ENABLED, STREAM_CHUNK_SIZE
+from crawlers.http_client import get_client
+from crawlers.keyword_matcher import build_keyword_profiles, get_keyword_matcher
+from crawlers import dblp_xml
+from crawlers.url_frontier import UrlFrontier
+from crawlers.document_cache import DocumentCache
+from crawlers.entry_stream import EntryStreamParser, sniff_encoding, SNIFF_BYTES
+from crawlers.redirect_map import resolve_url
+from utils.paper_store import get_venue_key
+from utils.paper import Paper, classify_link
 
+# 检查是否安装了lxml（BeautifulSoup使用lxml解析器时需要）
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# 可用的HTML解析器
+HTML_PARSERS = ('lxml', 'html.parser')
+
+# 页面中各提取方式需要的部分，解析时只构建这部分的树
+SUBTREE_ENTRIES = 'entries'  # 论文条目 li.entry：论文匹配
+SUBTREE_LINKS = 'links'  # 全部链接 <a>：期刊/会议索引页中的卷期链接
+SUBTREE_INDEX = 'index'  # 年份标题 <h2> 和列表项 <li>：会议索引页中各年份论文集的[contents]链接
+
+def _has_entry_class(value):
+    """class属性中是否包含entry（解析时属性值可能是整个字符串，也可能已拆分为列表）"""
+    if not value:
+        return False
+    return 'entry' in (value.split() if isinstance(value, str) else value)
+
+_SUBTREE_STRAINERS = {
+    SUBTREE_ENTRIES: SoupStrainer('li', class_=_has_entry_class),
+    SUBTREE_LINKS: SoupStrainer('a'),
+    SUBTREE_INDEX: SoupStrainer(['h2', 'li']),
+}
+
+def _resolve_html_parser(parser):
+    """将配置的解析器名称转换为可用的解析器，'auto' 表示已安装lxml时使用lxml"""
+    if parser == 'auto':
+        return 'lxml' if LXML_AVAILABLE else 'html.parser'
+    if parser == 'lxml' and not LXML_AVAILABLE:
+        print("警告：未安装lxml，使用 html.parser 解析页面")
+        return 'html.parser'
+    if parser not in HTML_PARSERS:
+        print(f"警告：不支持的HTML解析器 '{parser}'，使用 html.parser")
+        return 'html.parser'
+    return parser
 
-def _kw_desc():
-    """返回用于日志的关键词描述字符串"""
-    try:
-        if isinstance(CONFIG_KEYWORDS, (list, tuple)):
-            kws = [str(k).strip() for k in CONFIG_KEYWORDS if k]
-        else:
-            kws = [str(CONFIG_KEYWORDS)] if CONFIG_KEYWORDS else []
-    except Exception:
-        kws = [str(CONFIG_KEYWORDS)]
-
-    joined = ', '.join(kws) if kws else '指定'
-    if TARGET_KEYWORDS_MODE and TARGET_KEYWORDS_MODE.upper() == 'AND':
-        return f"同时包含 {joined} 关键词"
-    else:
-        return f"包含任一关键词 ({joined})"
 
-# 存储已查询过的链接
-queried_links = set()
+# 本次运行中登记过的页面及其状态，多进程并行时替换为共享SQLite文件的前沿
+frontier = UrlFrontier()
+
+# 本次运行中解析过的页面，各种链接提取方式和论文匹配共用，同一页面只下载和解析一次
+document_cache = DocumentCache()
+
+# 页面获取与解析后端：'html' 解析dblp网页，'xml' 使用dblp提供的XML/JSON结构化数据
+crawl_backend = CRAWL_BACKEND
+
+# 当前使用的HTML解析器
+html_parser = _resolve_html_parser(HTML_PARSER)
+
+# 流式解析卷期目录页（仅HTML后端），以及流式下载时每次读取的字节数
+stream_parse = STREAM_PARSE_ENABLED
+stream_chunk_size = STREAM_CHUNK_SIZE
 
 # 关键词配置（支持在 core.config 中设置 TARGET_KEYWORDS 为字符串或列表）
 try:
@@ -39,8 +84,18 @@ try:
 except Exception:
     KEYWORDS = ["Graph"]
 
-# 预编译正则用于标题匹配（忽略大小写）
-KEYWORD_REGEX = re.compile('|'.join(re.escape(k) for k in KEYWORDS), re.IGNORECASE)
+# 关键词配置列表，每组包含预编译的匹配器；每个页面只下载和解析一次，再按各组分别匹配
+keyword_profiles = build_keyword_profiles(KEYWORD_PROFILES, KEYWORDS, TARGET_KEYWORDS_MODE,
+                                          TARGET_KEYWORDS_WORD_BOUNDARY, MATCH_SCOPE)
+
+# 本地论文库，设置后每个卷期/目录页的全部条目都会写入库中，供 query 子命令离线检索
+entry_store = None
+
+# 条目较多的页面每累积这么多条目写入一次论文库
+STORE_BATCH_SIZE = 1000
+
+# 本次运行下载过的页面指纹 {url: {"hash": 内容哈希, "entries": 条目数}}，增量模式据此判断页面是否变化
+page_fingerprints = {}
 
 
 def match_keywords(text, keywords, mode='AND', word_boundary=False):
@@ -59,314 +114,759 @@ def match_keywords(text, keywords, mode='AND', word_boundary=False):
     if not text or not keywords:
         return False, []
 
-    matched = []
-    for k in keywords:
-        if not k:
-            continue
-        # 为短语和特殊字符安全构建正则
-        esc = re.escape(k)
-        if word_boundary:
-            # 允许短语中间有任意空白
-            esc = esc.replace(r'\ ', r'\s+')
-            pattern = rf"\b{esc}\b"
-        else:
-            esc = esc.replace(r'\ ', r'\s+')
-            pattern = esc
-
-        if re.search(pattern, text, re.IGNORECASE):
-            matched.append(k)
-
-    if mode == 'AND':
-        return (len(matched) == len([k for k in keywords if k])), matched
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    return get_keyword_matcher(tuple(keywords), mode, word_boundary).match(text)
+
+def claim_link(url):
+    """
+    检查页面是否已在前沿中登记过，未登记过则登记；已记录重定向的链接按最终地址登记
+
+    Returns:
+        True 表示可以继续处理该链接，False 表示应跳过
+    """
+    if not frontier.claim(resolve_url(url)):
+        print(f"链接已查询过，跳过: {url}")
+        return False
+    return True
+
+def get_frontier():
+    """获取当前的URL前沿"""
+    return frontier
+
+def set_frontier(new_frontier):
+    """设置URL前沿，多进程并行时各进程使用共享同一SQLite文件的前沿"""
+    global frontier
+    frontier = new_frontier
+    return frontier
+
+def set_keyword_profiles(profiles):
+    """替换关键词配置列表"""
+    global keyword_profiles
+    keyword_profiles = list(profiles)
+    return keyword_profiles
+
+def get_keyword_profiles():
+    """获取当前的关键词配置列表"""
+    return keyword_profiles
+
+def set_entry_store(store):
+    """设置保存抓取条目的本地论文库，传入None时不保存"""
+    global entry_store
+    entry_store = store
+    return entry_store
+
+def set_crawl_backend(backend):
+    """设置页面获取与解析后端（'html' 或 'xml'）"""
+    global crawl_backend
+    if backend in ('html', 'xml'):
+        if backend != crawl_backend:
+            # 两种后端的解析结果不同，不能沿用另一种后端解析的页面
+            document_cache.clear()
+        crawl_backend = backend
     else:
-        return (len(matched) > 0), matched
+        print(f"警告：不支持的后端 '{backend}'，继续使用 {crawl_backend}")
+    return crawl_backend
+
+def set_html_parser(parser):
+    """
+    设置HTML解析器
+
+    Args:
+        parser: 'lxml'、'html.parser' 或 'auto'（已安装lxml时使用lxml）
+    """
+    global html_parser
+    parser = _resolve_html_parser(parser)
+    if parser != html_parser:
+        # 不同解析器对不规范HTML的处理可能不同，不沿用另一种解析器的结果
+        document_cache.clear()
+    html_parser = parser
+    return html_parser
+
+def set_stream_parse(enabled, chunk_size=None):
+    """设置是否流式解析卷期目录页，以及流式下载时每次读取的字节数"""
+    global stream_parse, stream_chunk_size
+    stream_parse = bool(enabled)
+    if chunk_size:
+        stream_chunk_size = chunk_size
+    return stream_parse
+
+def use_stream_parse():
+    """当前是否流式解析卷期目录页，XML后端的结构化数据较小，不使用流式解析"""
+    return stream_parse and crawl_backend != 'xml'
+
+def fetch_page(url):
+    """
+    通过共享的HTTP客户端下载页面并返回原始字节，HTTP错误时抛出异常；
+    编码由解析器根据页面声明判断，不使用requests猜测的编码解码
+    """
+    response = get_client().get(url)
+    response.raise_for_status()
+    return response.content
+
+def parse_html(html, subtree=None):
+    """
+    将HTML解析为BeautifulSoup对象
+
+    Args:
+        html: 页面原始字节或文本
+        subtree: 只解析页面的一部分（SUBTREE_ENTRIES、SUBTREE_LINKS 或 SUBTREE_INDEX），为None时解析整个页面；
+            页面中没有这部分内容（例如非dblp页面）时退回到解析整个页面
+    """
+    if html_parser == 'html.parser' and isinstance(html, bytes):
+        # html.parser 收到字节时由BeautifulSoup逐个尝试猜测编码，明显慢于直接解析文本；
+        # 按字节顺序标记或页面声明的字符集（dblp为UTF-8）先解码
+        html = html.decode(sniff_encoding(html[:SNIFF_BYTES]), 'replace')
+    strainer = _SUBTREE_STRAINERS.get(subtree)
+    if strainer is not None:
+        soup = BeautifulSoup(html, html_parser, parse_only=strainer)
+        if soup.find() is not None:
+            return soup
+    return BeautifulSoup(html, html_parser)
+
+def fetch_document_text(url):
+    """
+    按当前后端下载页面原始内容
+
+    Returns:
+        (content, kind): 页面文本及其类型（'html'、'xml' 或 'json'）；下载结果记录到URL前沿
+    """
+    try:
+        result = _fetch_document_text(url)
+    except Exception as e:
+        frontier.mark_failed(url, e)
+        raise
+    mark_fetched(url)
+    return result
+
+def mark_fetched(url):
+    """在URL前沿中登记页面已下载"""
+    frontier.mark_fetched(url)
+    final_url = resolve_url(url)
+    if final_url != url:
+        # 已记录重定向时，最终地址也登记为已下载，重定向到同一页面的其他链接不再重复处理
+        frontier.mark_fetched(final_url)
+
+def _fetch_document_text(url):
+    if crawl_backend != 'xml':
+        return fetch_page(url), 'html'
+
+    try:
+        return fetch_page(dblp_xml.to_xml_url(url)), 'xml'
+    except Exception as e:
+        # 索引页没有检索接口可用，只有卷期目录页可以退回到JSON检索接口
+        if url.endswith('/') or url.endswith('index.html'):
+            raise
+        print(f"获取 {url} 的XML数据失败（{e}），改用JSON检索接口")
+        return fetch_page(dblp_xml.to_search_url(url)), 'json'
+
+def parse_document(content, kind, subtree=None):
+    """按内容类型解析页面，HTML页面可只解析 subtree 指定的部分"""
+    if kind == 'xml':
+        return dblp_xml.parse_xml(content)
+    if kind == 'json':
+        return dblp_xml.parse_search_json(content)
+    return parse_html(content, subtree)
+
+def content_hash(content):
+    """页面内容的哈希，用于判断页面是否变化"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+def cache_document(url, content, kind, subtree=None):
+    """解析已下载的页面，原始内容和解析结果都保存到页面缓存，返回解析结果"""
+    document_cache.put_content(url, content, kind)
+    return document_cache.put(url, parse_document(content, kind, subtree), subtree)
 
-def get_recent_volume_links(url, force=False):
+def get_cached_document(url, subtree=None):
+    """
+    获取本次运行中已下载页面的解析结果：已解析过所需部分时直接返回，
+    只缓存了原始内容时重新解析所需部分；页面不在缓存中时返回None
+    """
+    soup = document_cache.get(url, subtree)
+    if soup is not None:
+        return soup
+    cached = document_cache.get_content(url)
+    if cached is None:
+        return None
+    content, kind = cached
+    return document_cache.put(url, parse_document(content, kind, subtree), subtree)
+
+def load_document(url, subtree=None):
+    """
+    获取页面的解析结果：本次运行中已下载过时直接使用缓存，
+    否则按当前后端下载并解析，同时记录页面内容哈希。不检查也不改变页面在前沿中的登记
+
+    Args:
+        subtree: 只解析页面的一部分（SUBTREE_ENTRIES、SUBTREE_LINKS 或 SUBTREE_INDEX），为None时解析整个页面
+    """
+    soup = get_cached_document(url, subtree)
+    if soup is not None:
+        return soup
+    content, kind = fetch_document_text(url)
+    update_page_fingerprint(url, content)
+    return cache_document(url, content, kind, subtree)
+
+def iter_elements(soup, names):
+    """按文档顺序逐个产出指定名称的元素，调用方提前停止时不再遍历页面的其余部分"""
+    for node in soup.descendants:
+        if getattr(node, 'name', None) in names:
+            yield node
+
+def parse_recent_volume_links(soup, url):
+    """从已解析的页面中提取目标年份的卷期链接"""
+    # 相对链接以重定向后的最终地址为基准拼接
+    url = resolve_url(url)
+    if crawl_backend == 'xml':
+        return dblp_xml.parse_recent_volume_links(soup, url)
+    
+    # 寻找卷期链接
+    recent_volume_links = []
+    years = TARGET_YEARS
+    
+    # DBLP页面上的卷期链接通常在列表项中
+    volume_pattern = re.compile(r'Volume\s+\d+.*?(\d{4})')
+    
+    # 按顺序检查链接，卷期已早于目标年份时停止
+    scan = dblp_xml.YearScan(years)
+    for link in iter_elements(soup, ('a',)):
+        link_text = link.get_text().strip()
+        match = volume_pattern.search(link_text)
+        if not match:
+            continue
+        year = match.group(1)
+        if scan.is_past(year):
+            print(f"已扫描到 {year} 年，早于目标年份，停止扫描")
+            break
+        
+        if year in years:
+            href = link.get('href')
+            if href:
+                full_url = urljoin(url, href)
+                recent_volume_links.append((year, full_url))
+                print(f"找到 {year} 年的卷期链接: {full_url}")
+    
+    # 如果没有找到符合格式的链接，尝试查找其他格式的年份链接
+    if not recent_volume_links:
+        for link in soup.find_all('a'):
+            href = link.get('href')
+            if not href:
+                continue
+            # 链接文本中独立出现的年份（仅为年份，或包含年份和其他文本）
+            found = dblp_xml.find_years(link.get_text())
+            for year in years:
+                if year in found:
+                    full_url = urljoin(url, href)
+                    recent_volume_links.append((year, full_url))
+                    print(f"找到包含 {year} 年的链接: {full_url}")
+    
+    return recent_volume_links
+
+def get_recent_volume_links(url, reextract=False):
     """获取指定URL页面上近三年的卷期链接
     
     Args:
         url: 要处理的URL
-        force: 是否强制处理已查询过的链接
+        reextract: 从已处理过的页面重新提取卷期链接（其他提取方式没有找到时使用），不重新登记和下载页面
     """
     try:
+        if reextract:
+            print(f"从已下载的页面重新提取卷期链接: {url}")
+            return parse_recent_volume_links(load_document(url, SUBTREE_LINKS), url)
+        
         # 检查链接是否已查询过
-        if not force and url in queried_links:
-            print(f"链接已查询过，跳过: {url}")
+        if not claim_link(url):
             return []
             
-        queried_links.add(url)  # 将链接添加到已查询集合
         print(f"正在处理页面: {url}")
-        response = requests.get(url, timeout=TIMEOUT, proxies=PROXIES)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 寻找卷期链接
-        recent_volume_links = []
-        years = TARGET_YEARS
-        
-        # DBLP页面上的卷期链接通常在列表项中
-        volume_pattern = re.compile(r'Volume\s+\d+.*?(\d{4})')
-        
-        # 查找所有链接
-        for link in soup.find_all('a'):
-            link_text = link.get_text().strip()
-            match = volume_pattern.search(link_text)
-            
-            if match and match.group(1) in years:
-                year = match.group(1)
-                href = link.get('href')
-                if href:
-                    full_url = urljoin(url, href)
-                    recent_volume_links.append((year, full_url))
-                    print(f"找到 {year} 年的卷期链接: {full_url}")
-        
-        # 如果没有找到符合格式的链接，尝试查找其他格式的年份链接
-        if not recent_volume_links:
-            for link in soup.find_all('a'):
-                link_text = link.get_text().strip()
-                # 检查链接文本是否仅包含年份
-                if link_text in years:
-                    href = link.get('href')
-                    if href:
-                        full_url = urljoin(url, href)
-                        recent_volume_links.append((link_text, full_url))
-                        print(f"找到 {link_text} 年的链接: {full_url}")
-                # 检查链接是否包含年份和其他文本
-                elif any(year in link_text for year in years):
-                    for year in years:
-                        if year in link_text:
-                            href = link.get('href')
-                            if href:
-                                full_url = urljoin(url, href)
-                                recent_volume_links.append((year, full_url))
-                                print(f"找到包含 {year} 年的链接: {full_url}")
-        
-        return recent_volume_links
+        soup = load_document(url, SUBTREE_LINKS)
+        return parse_recent_volume_links(soup, url)
     except Exception as e:
         print(f"获取 {url} 的卷期链接时出错: {e}")
         return []
 
-def extract_doi(parent):
+# 条目文本中直接写出的DOI链接（不截断DOI尾部）
+_TEXT_DOI_PATTERN = re.compile(r'(https?://doi\.org/\S+?)(?:\s|\)|$)')
+# 链接title属性中的DOI链接
+_TITLE_DOI_PATTERN = re.compile(r'(https?://doi\.org/\S+)(?:\s|"|\'|$)')
+
+def _anchor_link(anchor):
     """
-    从论文条目中提取DOI链接
-    
+    按单个链接判断是否可作为论文链接：DOI链接、会议/出版方的论文页面，
+    或title属性中带有DOI的链接；都不是时返回None
+    """
+    href = anchor.get('href', '')
+    if 'doi.org' in href:
+        return href
+    if href.startswith('https://') and ('conference' in href or 'conf' in href or 'proceedings' in href
+                                        or 'paper' in href or 'presentation' in href):
+        return href
+    # 有时DOI可能在链接的标题或属性中
+    title = anchor.get('title', '')
+    if 'doi.org' in title:
+        match = _TITLE_DOI_PATTERN.search(title)
+        if match:
+            return match.group(1)
+    if ('doi.org' in title or 'DOI' in title) and href and ('doi' in href or 'DOI' in href):
+        return href
+    return None
+
+def extract_entry(entry):
+    """
+    遍历一个论文条目，一次取出标题、论文链接、出版年份和条目全文
+
+    论文链接按以下优先级确定：第一个下拉菜单（电子版）中的链接；
+    依次检查各链接，第一个DOI链接、会议论文页面或title中带DOI的链接；条目文本中的DOI；第一个https链接
+
+    Returns:
+        (title, link, link_kind, year, entry_text)；条目中没有标题元素时以条目全文作为标题
+    """
+    title_element = None
+    fallback_title_element = None
+    dropdown = None
+    head = None
+    year = None
+    anchors = []
+    for node in entry.descendants:
+        name = getattr(node, 'name', None)
+        if name is None:
+            continue
+        if name == 'a':
+            anchors.append(node)
+            continue
+        classes = node.get('class') or ()
+        if name == 'span':
+            if title_element is None and 'title' in classes:
+                title_element = node
+            elif year is None and node.get('itemprop') == 'datePublished':
+                year = node.get_text().strip() or None
+        elif fallback_title_element is None and ('title' in classes or name == 'cite'):
+            fallback_title_element = node
+        if dropdown is None and 'drop-down' in classes:
+            dropdown = node
+        elif head is None and dropdown is not None and 'head' in classes and dropdown in node.parents:
+            head = node
+
+    entry_text = entry.get_text()
+    title_element = title_element or fallback_title_element
+    title = title_element.get_text().strip() if title_element is not None else entry_text.strip()
+
+    head_link = None
+    if head is not None:
+        anchor = head.find('a')
+        head_link = (anchor.get('href') if anchor else None) or None
+    return build_entry(title, head_link, anchors, year, entry_text)
+
+def build_entry(title, head_link, anchors, year, entry_text):
+    """
+    按 extract_entry 中的优先级确定论文链接，组成条目元组
+
     Args:
-        parent: 论文条目的父元素
-        
+        head_link: 第一个下拉菜单中第一个链接的地址
+        anchors: 条目中按顺序出现的全部链接（解析树中的元素或属性字典）
+    """
+    link = head_link
+    if link is None:
+        for anchor in anchors:
+            link = _anchor_link(anchor)
+            if link:
+                break
+    if link is None:
+        match = _TEXT_DOI_PATTERN.search(entry_text)
+        if match:
+            link = match.group(1)
+    if link is None:
+        for anchor in anchors:
+            href = anchor.get('href', '')
+            if href.startswith('https://'):
+                link = href
+                break
+    return title, link, classify_link(link), year, entry_text
+
+class PaperSelector:
+    """
+    按一组关键词配置逐个接收论文条目并筛选论文：先匹配标题，整个页面都没有标题匹配的论文时，
+    根据匹配范围决定是否改用按条目全文匹配的结果。条目处理后即可丢弃，流式解析时不必保留整个页面的条目
+
+    Args:
+        profile: 关键词配置
+    """
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.papers = []
+        self.seen = set()
+        # 还没有标题匹配的论文时，按条目全文匹配的备用结果
+        self.fallback_papers = []
+        self.fallback_seen = set()
+
+    def add(self, entry):
+        """处理一个 (title, link, link_kind, year, entry_text) 条目"""
+        profile = self.profile
+        title, doi_link, link_kind, _, entry_text = entry
+        title_matched, _ = profile.match(title)
+        if title_matched:
+            print(f"找到{profile.describe()}标题: {title}")
+            if len(title) > 10 and len(title) < 300:  # 过滤过短或过长的标题
+                paper = Paper(re.sub(r'\s+', ' ', title).strip(), doi_link, link_kind)
+                if paper.key not in self.seen:
+                    self.seen.add(paper.key)
+                    self.papers.append(paper)
+                    print(f"添加{profile.describe()}论文: {paper}")
+
+        # 已有标题匹配的论文时不会使用备用结果，不再按全文匹配
+        if self.papers or profile.match_scope == 'title':
+            return
+        entry_matched, _ = profile.match(entry_text)
+        if entry_matched and len(title) > 10 and len(title) < 300:
+            paper = Paper(re.sub(r'\s+', ' ', title).strip(), doi_link, link_kind)
+            if paper.key not in self.fallback_seen:
+                self.fallback_seen.add(paper.key)
+                self.fallback_papers.append(paper)
+
+    def result(self):
+        """全部条目处理完后的 Paper 列表"""
+        if self.papers or self.profile.match_scope == 'title':
+            return self.papers
+        print(f"使用备用方法查找{self.profile.describe()}论文...")
+        for paper in self.fallback_papers:
+            print(f"通过备用方法添加{self.profile.describe()}论文: {paper}")
+        return self.fallback_papers
+
+def select_matching_papers(entries, profile=None):
+    """
+    在结构化的论文条目中查找包含关键词的论文，匹配规则与网页解析相同：
+    先匹配标题，没有找到时根据匹配范围决定是否按条目全文匹配
+
+    Args:
+        entries: [(title, link, link_kind, year, entry_text)] 列表
+        profile: 关键词配置，默认使用第一组
+
     Returns:
-        DOI链接或None（如果未找到）
+        Paper 列表
     """
-    if not parent:
+    selector = PaperSelector(profile or keyword_profiles[0])
+    for entry in entries:
+        selector.add(entry)
+    return selector.result()
+
+def select_profile_papers(entries):
+    """按每组关键词配置分别匹配结构化的论文条目，返回 {配置名称: Paper 列表}"""
+    return {profile.name: select_matching_papers(entries, profile) for profile in keyword_profiles}
+
+def parse_xml_entries(root):
+    """从dblp结构化数据（XML或检索接口JSON）中提取 [(title, link, link_kind, year, entry_text)] 条目列表"""
+    entries = []
+    for record in dblp_xml.iter_records(root):
+        link = dblp_xml.record_link(record)
+        entries.append((dblp_xml.record_title(record), link, classify_link(link), dblp_xml.record_year(record),
+                        dblp_xml.record_entry_text(record)))
+    return entries
+
+def parse_html_entries(soup):
+    """从论文列表页面中提取全部论文条目，每个条目只遍历一次，返回 [(title, link, link_kind, year, entry_text)]"""
+    entries = []
+    for entry in soup.select('li.entry'):
+        extracted = extract_entry(entry)
+        if extracted[0]:
+            entries.append(extracted)
+    return entries
+
+def parse_page_entries(soup):
+    """按当前后端从已解析的论文列表页面中提取全部条目"""
+    if crawl_backend == 'xml':
+        return parse_xml_entries(soup)
+    return parse_html_entries(soup)
+
+class PageMatch:
+    """
+    逐个接收一个论文列表页面中的条目：按每组关键词配置筛选论文，统计条目数，
+    并写入本地论文库（未设置论文库或年份未知时跳过）。条目较多时分批写入，条目处理后即可丢弃
+
+    Args:
+        url: 页面地址
+        year: 页面对应的年份
+    """
+
+    def __init__(self, url, year):
+        self.url = url
+        self.year = str(year) if year else None
+        self.selectors = [PaperSelector(profile) for profile in keyword_profiles]
+        self.count = 0
+        self.store = entry_store
+        self.venue_key = get_venue_key(url) if entry_store is not None and year else None
+        self.rows = []
+        self.store_started = False
+
+    def add(self, entry):
+        """处理一个 (title, link, link_kind, year, entry_text) 条目"""
+        self.count += 1
+        for selector in self.selectors:
+            selector.add(entry)
+        if self.venue_key:
+            title, link, _, _, entry_text = entry
+            self.rows.append((self.venue_key, self.year, title, link, entry_text, self.url))
+            if len(self.rows) >= STORE_BATCH_SIZE:
+                self._flush()
+
+    def _flush(self, final=False):
+        """写入已缓存的条目：第一批写入前先删除库中该页面的旧条目，只有一批时与旧条目的替换在同一事务中完成"""
+        rows, self.rows = self.rows, []
+        try:
+            if not self.store_started and final:
+                self.store.replace_page(self.venue_key, self.year, self.url,
+                                        [(title, link, None, None, text) for _, _, title, link, text, _ in rows])
+                return
+            if not self.store_started:
+                self.store.delete_page(self.url)
+                self.store_started = True
+            self.store.add_entries(rows)
+        except Exception as e:
+            print(f"保存条目到论文库时出错 {self.url}: {e}")
+            self.venue_key = None
+
+    def finish(self):
+        """全部条目处理完后写入剩余的条目，记录条目数，返回 {配置名称: Paper 列表}"""
+        if self.venue_key:
+            self._flush(final=True)
+        if self.url in page_fingerprints:
+            page_fingerprints[self.url]["entries"] = self.count
+        return {selector.profile.name: selector.result() for selector in self.selectors}
+
+def update_page_fingerprint(url, content, previous_hash=None):
+    """
+    记录页面内容哈希
+
+    Returns:
+        页面内容是否与 previous_hash 相同（未变化）
+    """
+    page_fingerprints[url] = {"hash": content_hash(content), "entries": None}
+    return is_page_unchanged(url, previous_hash)
+
+def is_page_unchanged(url, previous_hash):
+    """本次记录的页面内容哈希是否与 previous_hash 相同"""
+    fingerprint = page_fingerprints.get(url)
+    if previous_hash is not None and fingerprint and fingerprint["hash"] == previous_hash:
+        print(f"页面内容与上次相同，沿用上次的结果: {url}")
+        return True
+    return False
+
+def match_page_papers(url, year, soup):
+    """
+    在已解析的论文列表页面中按每组关键词配置匹配，同时记录条目数并写入本地论文库；
+    页面中的条目只提取一次，各组关键词配置和论文库共用提取结果
+    """
+    page = PageMatch(url, year)
+    for entry in parse_page_entries(soup):
+        page.add(entry)
+    return page.finish()
+
+def iter_stream_entries(url, digest):
+    """
+    流式下载并解析论文列表页面：响应体边下载边分块输入增量解析器，每读取一块产出其中已解析完成的条目列表，
+    同时用 digest 计算页面内容哈希；下载结果记录到URL前沿
+    """
+    parser = EntryStreamParser()
+    try:
+        response, chunks = get_client().get_stream(url, chunk_size=stream_chunk_size)
+        response.raise_for_status()
+        for chunk in chunks:
+            digest.update(chunk)
+            parser.feed_bytes(chunk)
+            yield [entry for entry in (build_entry(*raw) for raw in parser.pop_entries()) if entry[0]]
+        parser.close()
+        yield [entry for entry in (build_entry(*raw) for raw in parser.pop_entries()) if entry[0]]
+    except Exception as e:
+        frontier.mark_failed(url, e)
+        raise
+    mark_fetched(url)
+
+def stream_page_papers(url, year=None, previous_hash=None):
+    """
+    以流式方式下载论文列表页面并按每组关键词配置匹配：每个条目解析完成后立即匹配并写入论文库，
+    不保留完整的页面内容、解析树和条目列表，内存占用不随页面大小增长；页面不放入页面缓存。
+    匹配结果与先下载再解析整个页面相同，但要读完整个页面才能得到内容哈希，页面未变化时也会重新匹配和写入论文库
+
+    Returns:
+        {配置名称: Paper 列表}；页面内容与 previous_hash 相同时返回None
+    """
+    page = PageMatch(url, year)
+    digest = hashlib.sha256()
+    for entries in iter_stream_entries(url, digest):
+        for entry in entries:
+            page.add(entry)
+    page_fingerprints[url] = {"hash": digest.hexdigest(), "entries": None}
+    results = page.finish()
+    if is_page_unchanged(url, previous_hash):
         return None
-    
-    # 首先优先查找class="drop-down"块中的head块内的链接（会议论文链接）
-    dropdown = parent.select_one('.drop-down')
-    if dropdown:
-        head_div = dropdown.select_one('.head')
-        if head_div:
-            link = head_div.find('a')
-            if link and link.get('href'):
-                return link.get('href')
-    
-    # 如果没找到，再查找其他可能的DOI链接
-    for link in parent.find_all('a'):
-        href = link.get('href', '')
-        # 先检查标准DOI链接
-        if 'doi.org' in href:
-            # 直接返回完整的DOI链接
-            return href
-            
-        # 保存可能的会议链接（以https开头）
-        if href.startswith('https://') and ('conference' in href or 'conf' in href or 'proceedings' in href or 'paper' in href or 'presentation' in href):
-            return href
-            
-        # 有时DOI可能在链接的标题或属性中
-        title = link.get('title', '')
-        if 'doi.org' in title or 'DOI' in title:
-            if 'doi.org' in title:
-                match = re.search(r'(https?://doi\.org/\S+)(?:\s|"|\'|$)', title)
-                if match:
-                    return match.group(1)
-            # 对于其他形式的DOI链接，检查href
-            if href and ('doi' in href or 'DOI' in href):
-                return href
-    
-    # 处理直接嵌在文本中的DOI - 修改为不截断DOI链接尾部
-    text = parent.get_text()
-    doi_pattern = re.compile(r'(https?://doi\.org/\S+?)(?:\s|\)|$)')
-    match = doi_pattern.search(text)
-    if match:
-        return match.group(1)
-    
-    # 最后尝试获取任何有效的https链接
-    for link in parent.find_all('a'):
-        href = link.get('href', '')
-        if href.startswith('https://'):
-            return href
-    
-    return None
+    return results
+
+def parse_page_papers(url, year, content, kind, previous_hash=None):
+    """
+    解析已下载的论文列表页面并按每组关键词配置匹配
+
+    Returns:
+        {配置名称: Paper 列表}；页面内容与 previous_hash 相同时返回None
+    """
+    if update_page_fingerprint(url, content, previous_hash):
+        return None
+    return match_page_papers(url, year, cache_document(url, content, kind, SUBTREE_ENTRIES))
 
-def find_blockchain_papers(url):
-    """在论文列表页面查找包含blockchain关键词的论文，并提取DOI链接"""
+def parse_profile_papers(soup):
+    """在已解析的论文列表页面中按每组关键词配置分别查找论文，返回 {配置名称: Paper 列表}"""
+    return select_profile_papers(parse_page_entries(soup))
+
+def skipped_results():
+    """
+    链接已查询过、跳过时的结果：每组关键词配置都没有论文。与出错时的空字典不同，
+    跳过的页面视为已处理完成，续爬时不再重新处理
+    """
+    return {profile.name: [] for profile in keyword_profiles}
+
+def find_blockchain_papers(url, year=None, previous_hash=None, reextract=False):
+    """
+    在论文列表页面查找包含关键词的论文，并提取DOI链接
+    页面只下载和解析一次，再按每组关键词配置分别匹配；
+    指定年份且设置了本地论文库时，页面中的全部条目同时写入论文库
+
+    Args:
+        previous_hash: 上次运行时该页面的内容哈希（增量模式），内容未变化时不再解析
+        reextract: 在已作为其他类型页面处理过的页面中查找论文（例如没有[contents]链接的会议卷期页），不重新登记
+
+    Returns:
+        {配置名称: Paper 列表}；页面内容与 previous_hash 相同时返回None；
+        链接已查询过时返回 skipped_results()，出错时返回空字典
+    """
     try:
         # 检查链接是否已查询过
-        if url in queried_links:
-            print(f"链接已查询过，跳过: {url}")
-            return []
+        if not reextract and not claim_link(url):
+            return skipped_results()
             
-        queried_links.add(url)  # 将链接添加到已查询集合
-        print(f"处理链接: {url}")
-        response = requests.get(url, timeout=TIMEOUT, proxies=PROXIES)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        blockchain_papers = []
-        
-        # DBLP内容页面通常有span.title元素
-        title_elements = soup.select('span.title')
-        if not title_elements:
-            # 如果没有找到span.title，尝试其他常见的标题元素
-            title_elements = soup.select('li.entry .title, li.entry div.data cite, li.entry')
-        
-        for element in title_elements:
-            title = element.get_text().strip()
-            # 关键词匹配（使用配置中的关键词）
-            title_matched, title_matched_keywords = match_keywords(title, TARGET_KEYWORDS, mode=TARGET_KEYWORDS_MODE, word_boundary=TARGET_KEYWORDS_WORD_BOUNDARY)
-            if title_matched:
-                print(f"找到{_kw_desc()}标题: {title}")
-                if len(title) > 10 and len(title) < 300:  # 过滤过短或过长的标题
-                    cleaned_title = re.sub(r'\s+', ' ', title).strip()
-                    
-                    # 找到整个论文条目元素
-                    parent_entry = element.find_parent('li.entry') or element.find_parent('li') or element.find_parent('div.entry') or element.find_parent('div')
-                    
-                    # 提取DOI链接
-                    doi_link = extract_doi(parent_entry)
-                    
-                    paper_entry = cleaned_title
-                    if doi_link:
-                        paper_entry = f"{cleaned_title} [DOI: {doi_link}]"
-                        print(f"找到DOI链接: {doi_link}")
-                    else:
-                        print(f"未找到DOI链接")
-                    
-                    if paper_entry not in blockchain_papers:
-                        blockchain_papers.append(paper_entry)
-                        print(f"添加{_kw_desc()}论文: {paper_entry}")
-        
-        # 如果没有找到论文，根据 MATCH_SCOPE 决定是否尝试在整个页面内容中搜索
-        if not blockchain_papers and MATCH_SCOPE != 'title':
-            print(f"使用备用方法查找{_kw_desc()}论文...")
-            # 尝试查找所有可能的文章条目
-            entries = soup.select('li.entry, .data, .publ-list > *')
-            for entry in entries:
-                entry_text = entry.get_text().lower()
-                # 关键词匹配（使用配置中的关键词，大小写不敏感）
-                entry_matched, entry_matched_keywords = match_keywords(entry.get_text(), TARGET_KEYWORDS, mode=TARGET_KEYWORDS_MODE, word_boundary=TARGET_KEYWORDS_WORD_BOUNDARY)
-                if entry_matched:
-                    # 从条目中提取标题
-                    title_element = entry.select_one('.title') or entry
-                    title = title_element.get_text().strip()
-                    if len(title) > 10 and len(title) < 300:
-                        cleaned_title = re.sub(r'\s+', ' ', title).strip()
-                        
-                        # 提取DOI链接
-                        doi_link = extract_doi(entry)
-                                
-                        paper_entry = cleaned_title
-                        if doi_link:
-                            paper_entry = f"{cleaned_title} [DOI: {doi_link}]"
-                            print(f"通过备用方法找到DOI链接: {doi_link}")
-                        else:
-                            print(f"通过备用方法未找到DOI链接")
-                            
-                        if paper_entry not in blockchain_papers:
-                            blockchain_papers.append(paper_entry)
-                            print(f"通过备用方法添加{_kw_desc()}论文: {paper_entry}")
-        
-        return blockchain_papers
+        print(f"{'在已下载的页面中查找论文' if reextract else '处理链接'}: {url}")
+        soup = get_cached_document(url, SUBTREE_ENTRIES)
+        if soup is None and use_stream_parse():
+            return stream_page_papers(url, year, previous_hash)
+        if soup is None:
+            content, kind = fetch_document_text(url)
+            return parse_page_papers(url, year, content, kind, previous_hash)
+        if is_page_unchanged(url, previous_hash):
+            return None
+        return match_page_papers(url, year, soup)
     except Exception as e:
         print(f"查找论文时出错 {url}: {e}")
-        return []
+        return {}
+
+def entry_year(entry, header_year=None):
+    """
+    论文集条目的年份，依次使用条目中的出版年份（datePublished）、所在的年份标题、
+    条目标题中独立出现的第一个年份；都没有时返回None
+    """
+    published = entry.find('span', itemprop='datePublished')
+    found = dblp_xml.find_years(published.get_text()) if published is not None else []
+    if found:
+        return found[0]
+    if header_year:
+        return header_year
+    title = entry.find(class_='title') or entry.find('cite')
+    found = dblp_xml.find_years(title.get_text()) if title is not None else []
+    return found[0] if found else None
+
+def parse_conference_contents_links(soup, url):
+    """从已解析的会议页面中提取目标年份的[contents]链接"""
+    # 相对链接以重定向后的最终地址为基准拼接
+    url = resolve_url(url)
+    if crawl_backend == 'xml':
+        return dblp_xml.parse_conference_contents_links(soup, url)
+    
+    contents_links = []
+    years = TARGET_YEARS
+    
+    # 按顺序遍历年份标题和论文集条目，条目已早于目标年份时停止
+    scan = dblp_xml.YearScan(years)
+    header_year = None
+    for element in iter_elements(soup, ('h2', 'li')):
+        if element.name == 'h2':
+            found = dblp_xml.find_years(element.get_text())
+            header_year = found[0] if found else None
+            continue
+        if not _has_entry_class(element.get('class')):
+            continue
+        year = entry_year(element, header_year)
+        if scan.is_past(year):
+            print(f"已扫描到 {year} 年，早于目标年份，停止扫描")
+            break
+        contents_element = element.find('a', string='[contents]')
+        if year in years and contents_element is not None and contents_element.get('href'):
+            contents_url = urljoin(url, contents_element.get('href'))
+            contents_links.append((year, contents_url))
+            print(f"找到{year}年的[contents]链接: {contents_url}")
+    
+    return contents_links
 
 def process_conference_page(url):
-    """处理会议页面，查找近三年会议条目右侧的[contents]链接"""
+    """
+    处理会议页面，查找近三年会议条目右侧的[contents]链接
+    
+    Returns:
+        [(year, contents_link)]；链接已查询过时返回None
+    """
     try:
         # 检查链接是否已查询过
-        if url in queried_links:
-            print(f"链接已查询过，跳过: {url}")
-            return []
+        if not claim_link(url):
+            return None
             
-        queried_links.add(url)  # 将链接添加到已查询集合
         print(f"正在处理会议页面: {url}")
-        response = requests.get(url, timeout=TIMEOUT, proxies=PROXIES)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        contents_links = []
-        years = TARGET_YEARS
-        
-        # 直接查找所有包含[contents]的链接
-        contents_elements = soup.find_all('a', string='[contents]')
-        
-        for contents_element in contents_elements:
-            # 查找链接所在行的上下文
-            parent_li = contents_element.find_parent('li')
-            if not parent_li:
-                continue
-                
-            # 获取该行的所有文本
-            line_text = parent_li.get_text()
-            
-            # 检查是否包含我们需要的年份
-            for year in years:
-                if year in line_text:
-                    contents_url = urljoin(url, contents_element.get('href'))
-                    contents_links.append((year, contents_url))
-                    print(f"找到{year}年的[contents]链接: {contents_url}")
-                    break
-        
-        return contents_links
+        soup = load_document(url, SUBTREE_INDEX)
+        return parse_conference_contents_links(soup, url)
     except Exception as e:
         print(f"处理会议页面时出错 {url}: {e}")
         return []
 
+def parse_journal_volume_links(soup, url):
+    """从已解析的期刊页面中提取目标年份的卷期链接"""
+    # 相对链接以重定向后的最终地址为基准拼接
+    url = resolve_url(url)
+    if crawl_backend == 'xml':
+        return dblp_xml.parse_journal_volume_links(soup, url)
+    
+    recent_volume_links = []
+    years = TARGET_YEARS
+    
+    # 期刊页面通常有"Volume X: YYYY"格式的链接
+    volume_pattern = re.compile(r'Volume\s+\d+:?\s*(\d{4})')
+    
+    # 按顺序检查链接，卷期已早于目标年份时停止
+    scan = dblp_xml.YearScan(years)
+    for link in iter_elements(soup, ('a',)):
+        link_text = link.get_text().strip()
+        match = volume_pattern.search(link_text)
+        if not match:
+            continue
+        year = match.group(1)
+        if scan.is_past(year):
+            print(f"已扫描到 {year} 年，早于目标年份，停止扫描")
+            break
+        
+        if year in years:
+            href = link.get('href')
+            if href:
+                full_url = urljoin(url, href)
+                recent_volume_links.append((year, full_url))
+                print(f"找到期刊{year}年的卷期链接: {full_url}")
+    
+    return recent_volume_links
+
 def get_journal_volume_links(url):
     """获取期刊页面上近三年的卷期链接"""
     try:
         # 检查链接是否已查询过
-        if url in queried_links:
-            print(f"链接已查询过，跳过: {url}")
+        if not claim_link(url):
             return []
             
-        queried_links.add(url)  # 将链接添加到已查询集合
         print(f"正在处理期刊页面: {url}")
-        response = requests.get(url, timeout=TIMEOUT, proxies=PROXIES)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        recent_volume_links = []
-        years = TARGET_YEARS
-        
-        # 查找所有链接
-        links = soup.find_all('a')
-        
-        # 期刊页面通常有"Volume X: YYYY"格式的链接
-        volume_pattern = re.compile(r'Volume\s+\d+:?\s*(\d{4})')
-        
-        for link in links:
-            link_text = link.get_text().strip()
-            match = volume_pattern.search(link_text)
-            
-            if match and match.group(1) in years:
-                year = match.group(1)
-                href = link.get('href')
-                if href:
-                    full_url = urljoin(url, href)
-                    recent_volume_links.append((year, full_url))
-                    print(f"找到期刊{year}年的卷期链接: {full_url}")
-        
-        return recent_volume_links
+        soup = load_document(url, SUBTREE_LINKS)
+        return parse_journal_volume_links(soup, url)
     except Exception as e:
         print(f"获取期刊 {url} 的卷期链接时出错: {e}")
         return [] 
\ No newline at end of file
@@ -2,47 +2,269 @@
 主入口文件，用于执行论文查找和分类任务
 """
 import os
-import time
 import re
 import argparse
+import asyncio
+import multiprocessing
+import signal
+import socket
+import tempfile
+import time
 
-from utils.data_extractor import extract_venue_info, read_links_from_file, get_topic_info_from_file
+from utils.data_extractor import extract_venue_info, read_links_from_file, get_topic_info_from_file, get_canonical_url
 from crawlers.web_crawler import get_recent_volume_links, find_blockchain_papers, process_conference_page, get_journal_volume_links
+from crawlers.web_crawler import set_crawl_backend, select_profile_papers, get_keyword_profiles, set_keyword_profiles
+from crawlers.web_crawler import set_entry_store, set_frontier, get_frontier, page_fingerprints, KEYWORDS
+from crawlers.web_crawler import set_html_parser, set_stream_parse, HTML_PARSERS
+from crawlers.url_frontier import UrlFrontier, canonicalize_url
+from crawlers.redirect_map import resolve_url
+from crawlers.http_cache import get_ttl
+from crawlers.keyword_matcher import build_keyword_profiles
+from crawlers.parse_pool import set_parse_workers, shutdown_parse_pool
+from crawlers.dblp_dump import ingest_dump
+from crawlers.async_crawler import (
+    async_get_recent_volume_links, async_find_blockchain_papers, async_process_conference_page,
+    async_get_journal_volume_links, reset_host_limits, set_max_concurrency_per_host
+)
+from crawlers.http_client import print_stats_summary, set_cache_options, set_mirror_options, take_stats, merge_stats
+from crawlers.rate_limiter import set_rate_limit, get_rate_limiter
+from utils.paper_store import PaperStore, get_venue_key, build_fts_query
 from utils.file_handler import save_topic_results, save_venue_result, set_output_directory, set_output_formats, reset_file_counters
+from utils.file_handler import set_output_profiles, get_file_counters, set_file_counters, remove_topic_files
+from utils.file_handler import assign_file_numbers
+from utils import file_handler
+from utils.crawl_journal import CrawlJournal, get_journal, set_journal
+from utils.work_queue import WorkQueue, STATUS_DONE
+from utils.paper import papers_to_json, papers_from_json
 from core.config import INPUT_FILE, OUTPUT_DIR, JOURNAL_OUTPUT_FORMAT, CONFERENCE_OUTPUT_FORMAT, INPUT_DIR
+from core.config import ASYNC_CRAWL, MAX_CONCURRENCY_PER_HOST, CACHE_DIR, CRAWL_BACKEND, HTML_PARSER
+from core.config import STREAM_PARSE_ENABLED, STREAM_CHUNK_SIZE, PARSE_WORKERS
+from core.config import RATE_LIMIT_PER_HOST, RATE_LIMIT_BURST, CORPUS_FILE, TARGET_YEARS, ENTRY_INDEX_ENABLED
+from core.config import KEYWORD_PROFILES, TARGET_KEYWORDS_MODE, TARGET_KEYWORDS_WORD_BOUNDARY, MATCH_SCOPE
+from core.config import JOURNAL_FILENAME, EXCEL_CHECKPOINT_INTERVAL, TOPIC_WORKERS
+from core.config import WORK_QUEUE_FILE, WORK_LEASE_SECONDS, WORK_MAX_ATTEMPTS, WORK_POLL_INTERVAL
+from core.config import DBLP_MIRRORS
 
-def process_venue_link(link, venue_info, current_results, current_papers, current_topic="", is_current_journal=True):
-    """处理单个会议/期刊链接"""
-    print(f"\n处理链接: {link}")
-    
-    # 判断是期刊还是会议
+def get_venue_names(link, venue_info):
+    """从链接中提取会议/期刊简称及全称"""
     is_journal = "journals/" in link
     is_conference = "conf/" in link
     
-    # 尝试从链接中提取期刊/会议名称及全称
     venue_name = "未知会议/期刊"
     venue_full_name = ""
     try:
+        canonical_link = get_canonical_url(link)
         if is_conference:
             abbr = link.split("conf/")[1].split("/")[0].upper()
             venue_name = abbr
-            for key, (full_name, url) in venue_info.items():
-                if key.upper() == abbr or url in link:
+            for key, (full_name, url, canonical_url) in venue_info.items():
+                if key.upper() == abbr or url in link or canonical_url == canonical_link:
                     venue_full_name = full_name
                     break
         elif is_journal:
             abbr = link.split("journals/")[1].split("/")[0].upper()
             venue_name = abbr
-            for key, (full_name, url) in venue_info.items():
-                if key.upper() == abbr or url in link:
+            for key, (full_name, url, canonical_url) in venue_info.items():
+                if key.upper() == abbr or url in link or canonical_url == canonical_link:
                     venue_full_name = full_name
                     break
     except:
         pass
     
-    venue_display = venue_name
-    if venue_full_name:
-        venue_display = f"{venue_name} ({venue_full_name})"
+    return venue_name, venue_full_name
+
+def new_profile_results():
+    """为每组关键词配置创建空的累计结果列表，返回 {配置名称: []}"""
+    return {profile.name: [] for profile in get_keyword_profiles()}
+
+def record_venue_papers(venue_name, venue_full_name, year, profile_papers, link, current_results, current_papers,
+                        current_topic="", is_journal=True, volume_link=None, contents_link=None, journal_unit=True):
+    """
+    保存单个卷期/目录页的论文结果，并追加到当前专题的累计结果中
+    
+    Args:
+        profile_papers: {配置名称: Paper 列表}，页面处理出错时为空字典，链接已查询过而跳过时各配置为空列表；
+            论文的会议/期刊、年份和页面在此填写
+        current_results, current_papers: {配置名称: 累计的结果文本 / Paper 列表}
+        journal_unit: 是否将该页面记录到进度日志（根据日志重新生成结果时为False）
+    
+    Returns:
+        页面是否处理成功
+    """
+    for profile in get_keyword_profiles():
+        papers = profile_papers.get(profile.name)
+        if not papers:
+            continue
+        for paper in papers:
+            paper.set_source(venue_name, year, volume_link, contents_link)
+        
+        # 立即保存当前会议/期刊的结果 - 根据实际链接类型保存
+        save_venue_result(
+            venue_name=venue_name,
+            venue_full_name=venue_full_name,
+            year=year,
+            papers=papers,
+            source_link=link,
+            volume_link=volume_link,
+            contents_link=contents_link,
+            topic_name=current_topic,
+            is_journal=is_journal,
+            profile=profile
+        )
+        
+        venue_display = venue_name
+        if venue_full_name:
+            venue_display = f"{venue_name} ({venue_full_name})"
+        
+        # 同时保存到累计结果中
+        result_entry = f"\n## {venue_display} {year}年\n"
+        result_entry += f"- 来源: {link}\n"
+        if volume_link:
+            result_entry += f"- 卷期: {volume_link}\n"
+        if contents_link:
+            result_entry += f"- Contents链接: {contents_link}\n"
+        result_entry += f"- 找到的论文:\n"
+        current_results[profile.name].append(result_entry)
+        
+        for paper in papers:
+            current_results[profile.name].append(f"  * {paper}")
+        current_papers[profile.name].extend(papers)
+    
+    # 页面处理出错时不记录，续爬时重新处理
+    if not profile_papers:
+        return False
+    journal = get_journal()
+    if journal is not None and journal_unit:
+        url = contents_link or volume_link
+        journal.record_unit(current_topic, link, url, year, is_journal, profile_papers,
+                            volume_link, contents_link, page_fingerprints.get(url))
+        journal.record_file_numbers(get_file_counters())
+    return True
+
+def lookup_unit_papers(url, link, topic):
+    """
+    在进度日志中查找页面的结果
+    续爬时已处理过的页面直接使用本次日志中的结果；增量模式下往年卷期不再变化，直接沿用上次的结果，
+    其他页面需要重新下载，内容哈希与上次相同时才沿用上次的结果
+    
+    Returns:
+        (papers, previous): papers 不为None时直接使用；否则需要下载页面，previous 为上次运行中该页面的记录
+    """
+    journal = get_journal()
+    if journal is None:
+        return None, None
+    
+    papers = journal.get_unit_papers(topic, link, url)
+    if papers is not None:
+        print(f"进度日志中已有该页面的结果，跳过: {url}")
+        claim_replayed_pages([url])
+        return papers, None
+    
+    previous = journal.get_previous_unit(topic, link, url)
+    if previous is not None and previous.get("fingerprint") and get_ttl(url) is None:
+        print(f"往年卷期上次已处理，沿用上次的结果: {url}")
+        page_fingerprints[url] = previous["fingerprint"]
+        claim_replayed_pages([url])
+        return previous["papers"], None
+    return None, previous
+
+def claim_replayed_pages(urls):
+    """
+    沿用进度日志结果、不再下载的页面在URL前沿中登记为已下载，与未中断的运行一致：
+    之后的专题再遇到这些页面时按已查询过跳过，不会重新下载并计入其他专题
+    """
+    frontier = get_frontier()
+    for url in urls:
+        final_url = resolve_url(url)
+        frontier.claim(final_url)
+        frontier.mark_fetched(final_url)
+
+def claim_venue_pages(link, topic):
+    """在URL前沿中登记进度日志中已处理完的会议/期刊的索引页及其全部卷期/目录页"""
+    pages = [link]
+    for unit in get_journal().get_venue_units(topic, link):
+        pages.extend(page for page in (unit["volume_link"], unit["contents_link"], unit["url"]) if page)
+    claim_replayed_pages(pages)
+
+def reuse_previous_papers(url, papers, previous):
+    """页面内容与上次相同时沿用上次的结果和条目数"""
+    if papers is not None:
+        return papers
+    page_fingerprints[url] = previous["fingerprint"]
+    return previous["papers"]
+
+def previous_hash(previous):
+    """上次运行时页面的内容哈希"""
+    if previous is None or not previous.get("fingerprint"):
+        return None
+    return previous["fingerprint"].get("hash")
+
+def find_unit_papers(url, year, link, topic, reextract=False):
+    """
+    查找单个卷期/目录页的论文，续爬或增量模式下优先使用进度日志中的结果
+    
+    Args:
+        reextract: 页面已作为会议卷期页处理过，直接在已下载的页面中查找论文
+    """
+    papers, previous = lookup_unit_papers(url, link, topic)
+    if papers is not None:
+        return papers
+    papers = find_blockchain_papers(url, year, previous_hash(previous), reextract)
+    return reuse_previous_papers(url, papers, previous)
+
+async def async_find_unit_papers(url, year, link, topic, reextract=False):
+    """find_unit_papers 的异步版本"""
+    papers, previous = lookup_unit_papers(url, link, topic)
+    if papers is not None:
+        return papers
+    papers = await async_find_blockchain_papers(url, year, previous_hash(previous), reextract)
+    return reuse_previous_papers(url, papers, previous)
+
+def record_venue_done(link, topic):
+    """记录会议/期刊已处理完，增量模式下提示索引页是否有变化"""
+    journal = get_journal()
+    index_fingerprint = page_fingerprints.get(link)
+    previous_index = journal.get_previous_venue_index(topic, link)
+    if index_fingerprint and previous_index and index_fingerprint["hash"] == previous_index.get("hash"):
+        print(f"索引页与上次相同: {link}")
+    journal.record_venue_done(topic, link, index_fingerprint)
+
+def replay_venue_units(link, venue_info, current_results, current_papers, current_topic=""):
+    """根据进度日志重新生成已处理完的会议/期刊的结果，不访问网络"""
+    print(f"\n进度日志中已有该会议/期刊的全部结果: {link}")
+    venue_name, venue_full_name = get_venue_names(link, venue_info)
+    for unit in get_journal().get_venue_units(current_topic, link):
+        record_venue_papers(venue_name, venue_full_name, unit["year"], unit["papers"], link, current_results,
+                            current_papers, current_topic, is_journal=unit["is_journal"],
+                            volume_link=unit["volume_link"], contents_link=unit["contents_link"], journal_unit=False)
+
+def process_venue_link(link, venue_info, current_results, current_papers, current_topic="", is_current_journal=True,
+                       record=None):
+    """
+    处理单个会议/期刊链接
+    
+    Args:
+        record: 处理完每个页面后调用，参数与 record_venue_papers 相同，默认为 record_venue_papers
+    
+    Returns:
+        所有页面是否都处理成功
+    """
+    if record is None:
+        record = record_venue_papers
+    journal = get_journal()
+    if journal is not None and journal.is_venue_done(current_topic, link):
+        claim_venue_pages(link, current_topic)
+        replay_venue_units(link, venue_info, current_results, current_papers, current_topic)
+        return True
+    
+    print(f"\n处理链接: {link}")
+    complete = True
+    
+    # 判断是期刊还是会议
+    is_journal = "journals/" in link
+    
+    # 尝试从链接中提取期刊/会议名称及全称
+    venue_name, venue_full_name = get_venue_names(link, venue_info)
     
     # 根据类型使用不同的处理方法
     if is_journal:
@@ -52,81 +274,16 @@ def process_venue_link(link, venue_info, current_results, current_papers, curren
         
         if journal_volumes:
             print(f"找到 {len(journal_volumes)} 个近三年的期刊卷期")
-            
-            for year, volume_link in journal_volumes:
-                print(f"处理 {year} 年的卷期: {volume_link}")
-                papers = find_blockchain_papers(volume_link)
-                
-                if papers:
-                    # 立即保存当前会议/期刊的结果 - 根据实际链接类型保存
-                    save_venue_result(
-                        venue_name=venue_name,
-                        venue_full_name=venue_full_name,
-                        year=year,
-                        papers=papers,
-                        source_link=link,
-                        volume_link=volume_link,
-                        topic_name=current_topic,
-                        is_journal=True  # 明确指定为期刊
-                    )
-                    
-                    # 同时保存到累计结果中
-                    result_entry = f"\n## {venue_display} {year}年\n"
-                    result_entry += f"- 来源: {link}\n"
-                    result_entry += f"- 卷期: {volume_link}\n"
-                    result_entry += f"- 找到的论文:\n"
-                    current_results.append(result_entry)
-                    
-                    for paper in papers:
-                        paper_title = paper
-                        # 如果有DOI链接，只在current_papers中添加标题+doi链接的形式
-                        doi_match = re.search(r'\[DOI: (https?://doi\.org/[^\]]+)\]', paper)
-                        if doi_match:
-                            doi_link = doi_match.group(1)
-                            paper_title = paper.replace(f" [DOI: {doi_link}]", "")
-                            current_results.append(f"  * {paper}")
-                            current_papers.append(f"[{venue_name} {year}] {paper}")
-                        else:
-                            current_results.append(f"  * {paper}")
-                            current_papers.append(f"[{venue_name} {year}] {paper}")
-                
-                # 避免请求过快
-                time.sleep(2)
         else:
             print(f"未在期刊页面找到近三年的卷期链接，尝试使用通用方法")
-            # 使用force=True强制处理已查询过的链接
-            recent_volumes = get_recent_volume_links(link, force=True)
-            
-            for year, volume_link in recent_volumes:
-                print(f"处理 {year} 年的卷期: {volume_link}")
-                papers = find_blockchain_papers(volume_link)
-                
-                if papers:
-                    # 立即保存当前会议/期刊的结果 - 根据实际链接类型保存
-                    save_venue_result(
-                        venue_name=venue_name,
-                        venue_full_name=venue_full_name,
-                        year=year,
-                        papers=papers,
-                        source_link=link,
-                        volume_link=volume_link,
-                        topic_name=current_topic,
-                        is_journal=True  # 明确指定为期刊
-                    )
-                    
-                    # 同时保存到累计结果中
-                    result_entry = f"\n## {venue_display} {year}年\n"
-                    result_entry += f"- 来源: {link}\n"
-                    result_entry += f"- 卷期: {volume_link}\n"
-                    result_entry += f"- 找到的论文:\n"
-                    current_results.append(result_entry)
-                    
-                    for paper in papers:
-                        current_results.append(f"  * {paper}")
-                        current_papers.append(f"[{venue_name} {year}] {paper}")
-                
-                # 避免请求过快
-                time.sleep(2)
+            # 从刚处理过的期刊页面按通用格式重新提取，不重新下载
+            journal_volumes = get_recent_volume_links(link, reextract=True)
+        
+        for year, volume_link in journal_volumes:
+            print(f"处理 {year} 年的卷期: {volume_link}")
+            papers = find_unit_papers(volume_link, year, link, current_topic)
+            complete &= record(venue_name, venue_full_name, year, papers, link, current_results,
+                                            current_papers, current_topic, is_journal=True, volume_link=volume_link)
     else:
         # 处理会议
         print(f"检测到会议链接，使用会议处理逻辑")
@@ -137,38 +294,14 @@ def process_venue_link(link, venue_info, current_results, current_papers, curren
             
             for year, contents_link in contents_links:
                 print(f"处理{year}年[contents]链接: {contents_link}")
-                papers = find_blockchain_papers(contents_link)
-                
-                if papers:
-                    # 立即保存当前会议/期刊的结果 - 根据实际链接类型保存
-                    save_venue_result(
-                        venue_name=venue_name,
-                        venue_full_name=venue_full_name,
-                        year=year,
-                        papers=papers,
-                        source_link=link,
-                        contents_link=contents_link,
-                        topic_name=current_topic,
-                        is_journal=False  # 明确指定为会议
-                    )
-                    
-                    # 同时保存到累计结果中
-                    result_entry = f"\n## {venue_display} {year}年\n"
-                    result_entry += f"- 来源: {link}\n"
-                    result_entry += f"- Contents链接: {contents_link}\n"
-                    result_entry += f"- 找到的论文:\n"
-                    current_results.append(result_entry)
-                    
-                    for paper in papers:
-                        current_results.append(f"  * {paper}")
-                        current_papers.append(f"[{venue_name} {year}] {paper}")
-                
-                # 避免请求过快
-                time.sleep(2)
+                papers = find_unit_papers(contents_link, year, link, current_topic)
+                complete &= record(venue_name, venue_full_name, year, papers, link, current_results,
+                                                current_papers, current_topic, is_journal=False,
+                                                contents_link=contents_link)
         else:
             print(f"未在会议页面直接找到[contents]链接，尝试获取卷期链接")
-            # 使用force=True强制处理已查询过的链接
-            recent_volumes = get_recent_volume_links(link, force=True)
+            # 从刚处理过的会议页面按通用格式重新提取，不重新下载
+            recent_volumes = get_recent_volume_links(link, reextract=True)
             print(f"找到 {len(recent_volumes)} 个近三年的卷期链接")
             
             for year, volume_link in recent_volumes:
@@ -181,66 +314,147 @@ def process_venue_link(link, venue_info, current_results, current_papers, curren
                     
                     for year_content, contents_link in contents_links:
                         print(f"处理{year_content}年[contents]链接: {contents_link}")
-                        papers = find_blockchain_papers(contents_link)
-                        
-                        if papers:
-                            # 立即保存当前会议/期刊的结果 - 根据实际链接类型保存
-                            save_venue_result(
-                                venue_name=venue_name,
-                                venue_full_name=venue_full_name,
-                                year=year_content,
-                                papers=papers,
-                                source_link=link,
-                                volume_link=volume_link,
-                                contents_link=contents_link,
-                                topic_name=current_topic,
-                                is_journal=False  # 明确指定为会议
-                            )
-                            
-                            # 同时保存到累计结果中
-                            result_entry = f"\n## {venue_display} {year_content}年\n"
-                            result_entry += f"- 来源: {link}\n"
-                            result_entry += f"- 卷期: {volume_link}\n"
-                            result_entry += f"- Contents链接: {contents_link}\n"
-                            result_entry += f"- 找到的论文:\n"
-                            current_results.append(result_entry)
-                            
-                            for paper in papers:
-                                current_results.append(f"  * {paper}")
-                                current_papers.append(f"[{venue_name} {year_content}] {paper}")
-                        
-                        # 避免请求过快
-                        time.sleep(2)
+                        papers = find_unit_papers(contents_link, year_content, link, current_topic)
+                        complete &= record(venue_name, venue_full_name, year_content, papers, link,
+                                                        current_results, current_papers, current_topic,
+                                                        is_journal=False, volume_link=volume_link,
+                                                        contents_link=contents_link)
                 else:
                     print(f"在卷期页面未找到[contents]链接，直接查找区块链论文")
-                    papers = find_blockchain_papers(volume_link)
-                    
-                    if papers:
-                        # 立即保存当前会议/期刊的结果 - 根据实际链接类型保存
-                        save_venue_result(
-                            venue_name=venue_name,
-                            venue_full_name=venue_full_name,
-                            year=year,
-                            papers=papers,
-                            source_link=link,
-                            volume_link=volume_link,
-                            topic_name=current_topic,
-                            is_journal=False  # 明确指定为会议
-                        )
-                        
-                        # 同时保存到累计结果中
-                        result_entry = f"\n## {venue_display} {year}年\n"
-                        result_entry += f"- 来源: {link}\n"
-                        result_entry += f"- 卷期: {volume_link}\n"
-                        result_entry += f"- 找到的论文:\n"
-                        current_results.append(result_entry)
-                        
-                        for paper in papers:
-                            current_results.append(f"  * {paper}")
-                            current_papers.append(f"[{venue_name} {year}] {paper}")
-                
-                # 避免请求过快
-                time.sleep(2)
+                    # 卷期页刚作为会议页面下载过，直接在其中查找；已在其他地方处理过的卷期页不再重复
+                    papers = find_unit_papers(volume_link, year, link, current_topic,
+                                              reextract=contents_links is not None)
+                    complete &= record(venue_name, venue_full_name, year, papers, link, current_results,
+                                                    current_papers, current_topic, is_journal=False,
+                                                    volume_link=volume_link)
+    
+    # 所有页面都处理成功后才标记完成，否则续爬时重新检查该会议/期刊
+    if journal is not None and complete:
+        record_venue_done(link, current_topic)
+    return complete
+
+async def async_process_venue_link(link, topic=""):
+    """
+    异步处理单个会议/期刊链接，逻辑与 process_venue_link 相同，
+    但只收集结果，不写文件，以便调用方按原始顺序输出
+    
+    Returns:
+        [(year, papers, volume_link, contents_link, is_journal)] 列表，顺序与串行处理一致，
+        papers 为 {配置名称: Paper 列表}
+    """
+    print(f"\n处理链接: {link}")
+    is_journal = "journals/" in link
+    
+    if is_journal:
+        journal_volumes = await async_get_journal_volume_links(link)
+        if not journal_volumes:
+            print(f"未在期刊页面找到近三年的卷期链接，尝试使用通用方法")
+            journal_volumes = await async_get_recent_volume_links(link, reextract=True)
+        
+        papers_list = await asyncio.gather(*(async_find_unit_papers(v, year, link, topic) for year, v in journal_volumes))
+        return [(year, papers, volume_link, None, True)
+                for (year, volume_link), papers in zip(journal_volumes, papers_list)]
+    
+    contents_links = await async_process_conference_page(link)
+    if contents_links:
+        papers_list = await asyncio.gather(*(async_find_unit_papers(c, year, link, topic) for year, c in contents_links))
+        return [(year, papers, None, contents_link, False)
+                for (year, contents_link), papers in zip(contents_links, papers_list)]
+    
+    print(f"未在会议页面直接找到[contents]链接，尝试获取卷期链接")
+    recent_volumes = await async_get_recent_volume_links(link, reextract=True)
+    
+    async def process_volume(year, volume_link):
+        volume_contents = await async_process_conference_page(volume_link)
+        if volume_contents:
+            papers_list = await asyncio.gather(*(async_find_unit_papers(c, year_content, link, topic)
+                                               for year_content, c in volume_contents))
+            return [(year_content, papers, volume_link, contents_link, False)
+                    for (year_content, contents_link), papers in zip(volume_contents, papers_list)]
+        papers = await async_find_unit_papers(volume_link, year, link, topic, reextract=volume_contents is not None)
+        return [(year, papers, volume_link, None, False)]
+    
+    volume_results = await asyncio.gather(*(process_volume(year, v) for year, v in recent_volumes))
+    return [entry for entries in volume_results for entry in entries]
+
+async def crawl_topic_async(links, topic=""):
+    """并发处理一个专题下的所有链接，返回与 links 顺序一致的结果列表"""
+    reset_host_limits()
+    return await asyncio.gather(*(async_process_venue_link(link, topic) for link in links))
+
+def process_venue_offline(link, venue_info, store, current_results, current_papers, current_topic="", fts_query=None):
+    """
+    使用本地论文库处理单个会议/期刊链接，匹配和输出逻辑与在线爬取相同
+    
+    Args:
+        fts_query: FTS5查询（可选），先用全文索引筛选候选条目，再按关键词配置精确匹配
+    """
+    print(f"\n离线处理链接: {link}")
+    
+    venue_key = get_venue_key(link)
+    if not venue_key:
+        print(f"无法从链接中识别dblp会议/期刊，跳过: {link}")
+        return
+    
+    is_journal = "journals/" in link
+    venue_name, venue_full_name = get_venue_names(link, venue_info)
+    
+    for year, source_url, entries in store.get_venue_entries(venue_key, TARGET_YEARS, fts_query):
+        print(f"处理 {year} 年的卷期: {source_url}（{len(entries)} 条记录）")
+        papers = select_profile_papers(entries)
+        if is_journal:
+            record_venue_papers(venue_name, venue_full_name, year, papers, link, current_results, current_papers,
+                                current_topic, is_journal=True, volume_link=source_url)
+        else:
+            record_venue_papers(venue_name, venue_full_name, year, papers, link, current_results, current_papers,
+                                current_topic, is_journal=False, contents_link=source_url)
+
+def print_failed_pages():
+    """汇总本次运行中下载失败的页面"""
+    failures = get_frontier().failures()
+    if not failures:
+        return
+    print(f"\n下载失败的页面（{len(failures)} 个）:")
+    for url, reason in failures.items():
+        print(f"- {url}: {reason}")
+
+def get_match_info():
+    """目标年份和关键词配置的摘要，这些配置不同时页面的匹配结果不能复用"""
+    return {
+        "years": list(TARGET_YEARS),
+        "profiles": [[p.name, p.keywords, p.mode, p.word_boundary, p.match_scope] for p in get_keyword_profiles()],
+    }
+
+def start_journal(output_dir, template_file, resume=False, incremental=False):
+    """
+    打开输出目录中的进度日志并设为当前日志
+    续爬时读取已有日志并恢复文件编号；增量爬取时将已有日志作为上次运行的结果，恢复文件编号后开始新的日志；
+    配置与上次不同或两者都不是时清空日志重新开始
+    """
+    journal = CrawlJournal(os.path.join(output_dir, JOURNAL_FILENAME))
+    run_info = {
+        "input": os.path.abspath(template_file),
+        "formats": list(file_handler.output_formats),
+        **get_match_info(),
+    }
+    previous = None
+    if resume or incremental:
+        journal.load()
+        if journal.run_info == run_info:
+            set_file_counters(journal.file_numbers)
+            if resume:
+                print(f"从进度日志继续上次的爬取: {journal.path}")
+                return set_journal(journal)
+            print(f"增量爬取: 只处理上次运行后新增或变化的页面（{journal.path}）")
+            previous = journal
+            journal = CrawlJournal(previous.path)
+        elif journal.run_info is None:
+            print(f"未找到可用的进度日志，重新开始爬取: {journal.path}")
+        else:
+            print(f"警告：输入文件或关键词配置与上次运行不同，无法使用上次的进度，重新开始爬取")
+    journal.start(run_info)
+    journal.previous = previous
+    return set_journal(journal)
 
 def extract_topic_name(line):
     """从文本行中提取专题名称，并格式化处理"""
@@ -275,9 +489,469 @@ def parse_arguments():
                         help='会议类输出文件名格式，使用{topic}作为专题名称占位符')
     parser.add_argument('--output-format', dest='output_format', choices=['txt', 'xlsx'],
                         help='输出文件格式，可选txt或xlsx，默认为txt')
+    parser.add_argument('--excel-checkpoint', dest='excel_checkpoint', type=int,
+                        help=f'Excel结果每累计多少个卷期/目录页写一次检查点，0 表示只在专题完成时写入，默认为 {EXCEL_CHECKPOINT_INTERVAL}')
+    
+    # 爬取后端
+    parser.add_argument('--backend', dest='backend', choices=['html', 'xml'],
+                        help=f'页面获取与解析后端：html 解析dblp网页，xml 使用dblp的XML/JSON结构化数据，默认为 {CRAWL_BACKEND}')
+    parser.add_argument('--html-parser', dest='html_parser', choices=['auto'] + list(HTML_PARSERS),
+                        help=f'HTML解析器：lxml（需安装lxml）或 html.parser，auto 表示已安装lxml时使用lxml，默认为 {HTML_PARSER}')
+    parser.add_argument('--stream-parse', dest='stream_parse', action='store_true', default=STREAM_PARSE_ENABLED,
+                        help='边下载边解析卷期/目录页，逐个条目匹配后丢弃，内存占用不随页面大小增长（仅html后端）')
+    parser.add_argument('--stream-chunk-size', dest='stream_chunk_size', type=int,
+                        help=f'流式解析时每次读取的字节数，默认为 {STREAM_CHUNK_SIZE}')
+    
+    # 并发相关参数
+    parser.add_argument('--async', dest='async_crawl', action='store_true', default=ASYNC_CRAWL,
+                        help='使用asyncio并发处理同一专题下的所有会议/期刊')
+    parser.add_argument('--concurrency', dest='concurrency', type=int,
+                        help=f'并发模式下每个主机的最大并发请求数，默认为 {MAX_CONCURRENCY_PER_HOST}')
+    parser.add_argument('--topic-workers', dest='topic_workers', type=int, default=TOPIC_WORKERS,
+                        help=f'并行处理专题的进程数，各进程平分限速设置，默认为 {TOPIC_WORKERS}（按顺序处理）')
+    parser.add_argument('--parse-workers', dest='parse_workers', type=int,
+                        help=f'并发模式下解析卷期/目录页并匹配关键词的进程数，0 表示在主进程中解析，默认为 {PARSE_WORKERS}')
+    
+    # 缓存相关参数
+    parser.add_argument('--no-cache', dest='no_cache', action='store_true',
+                        help='禁用HTTP响应磁盘缓存，所有页面都重新下载')
+    parser.add_argument('--cache-dir', dest='cache_dir',
+                        help=f'HTTP响应缓存目录，默认为 {CACHE_DIR}')
+    
+    # 限速相关参数
+    parser.add_argument('--rate', dest='rate', type=float,
+                        help=f'每个主机每秒允许的请求数，0 表示不限速，默认为 {RATE_LIMIT_PER_HOST}')
+    parser.add_argument('--burst', dest='burst', type=int,
+                        help=f'每个主机允许的最大突发请求数，默认为 {RATE_LIMIT_BURST}')
+    
+    # dblp镜像参数
+    parser.add_argument('--mirrors', dest='mirrors',
+                        help=f'dblp镜像地址，以逗号分隔，空字符串表示不使用镜像，默认为 {",".join(DBLP_MIRRORS)}')
+    parser.add_argument('--no-hedge', dest='no_hedge', action='store_true',
+                        help='不向其他镜像发送对冲请求')
+    
+    # 离线论文库相关参数
+    parser.add_argument('--ingest', dest='ingest', metavar='DBLP_XML_GZ',
+                        help='流式导入dblp全量数据文件（dblp.xml.gz），只保留输入文件中的会议/期刊和目标年份')
+    parser.add_argument('--offline', dest='offline', action='store_true',
+                        help='离线模式：从本地论文库匹配关键词，不访问网络')
+    parser.add_argument('--corpus', dest='corpus',
+                        help=f'本地论文库文件路径，默认为 {CORPUS_FILE}')
+    parser.add_argument('--no-index', dest='no_index', action='store_true', default=not ENTRY_INDEX_ENABLED,
+                        help='爬取时不将页面中的全部条目写入本地论文库的全文索引')
+    
+    # 断点续爬与增量爬取
+    journal_group = parser.add_mutually_exclusive_group()
+    journal_group.add_argument('--resume', dest='resume', action='store_true',
+                               help=f'根据输出目录中的进度日志（{JOURNAL_FILENAME}）继续上次中断的爬取，跳过已完成的页面')
+    journal_group.add_argument('--incremental', dest='incremental', action='store_true',
+                               help='增量爬取：只处理上次运行后新增或内容变化的卷期/目录页，并与上次的结果合并生成结果文件')
+    
+    # 子命令
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    query_parser = subparsers.add_parser('query', help='使用本地论文库的全文索引按关键词检索并生成结果文件，不访问网络')
+    query_parser.add_argument('--keywords', dest='keywords', nargs='+',
+                              help='检索的关键词，指定后替换配置中的 TARGET_KEYWORDS 和 KEYWORD_PROFILES')
+    query_parser.add_argument('--mode', dest='mode', choices=['AND', 'OR'],
+                              help=f'关键词匹配模式，默认为 {TARGET_KEYWORDS_MODE}')
+    query_parser.add_argument('--scope', dest='scope', choices=['title', 'entry', 'title_or_entry'],
+                              help=f'匹配范围，默认为 {MATCH_SCOPE}')
+    query_parser.add_argument('--word-boundary', dest='word_boundary', action='store_true', default=None,
+                              help='关键词匹配时使用词边界')
+    
+    coordinator_parser = subparsers.add_parser('coordinator', help='分布式爬取的协调节点：将各专题的会议/期刊写入工作队列，'
+                                                                   '等待工作节点处理完后生成结果文件')
+    coordinator_parser.add_argument('--queue', dest='queue', help=f'工作队列文件，需放在各节点共享的存储上，默认为 {WORK_QUEUE_FILE}')
+    coordinator_parser.add_argument('--lease', dest='lease', type=int,
+                                    help=f'租约时长（秒），默认为 {WORK_LEASE_SECONDS}')
+    coordinator_parser.add_argument('--max-attempts', dest='max_attempts', type=int,
+                                    help=f'每个单元最多领取的次数，默认为 {WORK_MAX_ATTEMPTS}')
+    worker_parser = subparsers.add_parser('worker', help='分布式爬取的工作节点：从工作队列领取会议/期刊并处理')
+    worker_parser.add_argument('--queue', dest='queue', help=f'工作队列文件，默认为 {WORK_QUEUE_FILE}')
+    worker_parser.add_argument('--worker-id', dest='worker_id', help='工作节点名称，默认为主机名和进程号')
     
     return parser.parse_args()
 
+def apply_runtime_options(args):
+    """根据命令行参数设置输出、关键词配置、爬取后端、限速和缓存等运行选项，主进程和处理专题的子进程共用"""
+    # 设置输出目录
+    if args.output_dir:
+        set_output_directory(args.output_dir)
+    
+    # 设置输出文件名格式
+    set_output_formats(args.journal_format, args.conference_format)
+    
+    # query 子命令可在命令行中替换关键词配置
+    if args.command == 'query' and (args.keywords or args.mode or args.scope or args.word_boundary is not None):
+        set_keyword_profiles(build_keyword_profiles(
+            {} if args.keywords else KEYWORD_PROFILES,
+            args.keywords or KEYWORDS,
+            args.mode or TARGET_KEYWORDS_MODE,
+            TARGET_KEYWORDS_WORD_BOUNDARY if args.word_boundary is None else args.word_boundary,
+            args.scope or MATCH_SCOPE,
+        ))
+    set_output_profiles([profile.name for profile in get_keyword_profiles()])
+    
+    # 设置输出文件格式（txt或xlsx）
+    if args.output_format:
+        from utils.file_handler import set_output_format
+        set_output_format(args.output_format)
+    if args.excel_checkpoint is not None:
+        from utils.excel_handler import set_checkpoint_interval
+        set_checkpoint_interval(args.excel_checkpoint)
+    
+    # 设置爬取后端
+    if args.backend:
+        set_crawl_backend(args.backend)
+    if args.html_parser:
+        set_html_parser(args.html_parser)
+    if args.stream_parse or args.stream_chunk_size:
+        set_stream_parse(args.stream_parse, args.stream_chunk_size)
+    
+    if args.concurrency:
+        set_max_concurrency_per_host(args.concurrency)
+    if args.parse_workers is not None:
+        set_parse_workers(args.parse_workers)
+    
+    # 设置请求限速
+    if args.rate is not None or args.burst is not None:
+        set_rate_limit(args.rate, args.burst)
+    
+    # 设置HTTP响应缓存
+    if args.no_cache or args.cache_dir:
+        set_cache_options(enabled=not args.no_cache, directory=args.cache_dir)
+    
+    # 设置dblp镜像
+    if args.mirrors is not None or args.no_hedge:
+        mirrors = None
+        if args.mirrors is not None:
+            mirrors = [mirror.strip() for mirror in args.mirrors.split(',') if mirror.strip()]
+        set_mirror_options(mirrors, hedge=False if args.no_hedge else None)
+
+def crawl_topic(topic_name, journal_links, conference_links, venue_info, args, store=None, fts_query=None):
+    """
+    处理一个专题：爬取（或从本地论文库匹配）其全部会议/期刊，并保存专题结果文件
+    
+    Args:
+        journal_links, conference_links: 专题下的期刊和会议链接
+        store: 离线模式使用的本地论文库，为None时在线爬取
+        fts_query: 离线模式的全文索引检索语句
+    """
+    journal = get_journal()
+    if journal is not None and journal.is_topic_done(topic_name):
+        # 已完成的专题不再处理，但按专题顺序登记其页面，之后的专题跳过这些页面
+        print(f"\n\n专题 '{topic_name}' 已在上次运行中完成，跳过")
+        for link in list(journal_links) + list(conference_links):
+            claim_venue_pages(link, topic_name)
+        return
+    print(f"\n\n处理专题: {topic_name}")
+    
+    # 续爬或增量爬取时删除未完成专题的结果文件，再根据进度日志重新生成，避免重复追加
+    if journal is not None and (args.resume or args.incremental):
+        for profile in get_keyword_profiles():
+            remove_topic_files(topic_name, is_journal=True, profile=profile)
+            remove_topic_files(topic_name, is_journal=False, profile=profile)
+    
+    # 跟踪当前专题的所有结果，按关键词配置分别累计
+    current_journal_results = new_profile_results()
+    current_journal_papers = new_profile_results()
+    current_conference_results = new_profile_results()
+    current_conference_papers = new_profile_results()
+    # 所有会议/期刊都处理成功时才记录专题完成，否则续爬时重新处理失败的页面
+    complete = True
+    
+    if store is not None:
+        # 离线模式：从本地论文库读取条目，不访问网络
+        for link in journal_links:
+            process_venue_offline(link, venue_info, store, current_journal_results, current_journal_papers,
+                                  topic_name, fts_query)
+        for link in conference_links:
+            process_venue_offline(link, venue_info, store, current_conference_results, current_conference_papers,
+                                  topic_name, fts_query)
+    elif args.async_crawl:
+        # 并发抓取整个专题，再按原始链接顺序输出，保证结果顺序确定
+        all_links = list(journal_links) + list(conference_links)
+        pending_links = [link for link in all_links
+                         if journal is None or not journal.is_venue_done(topic_name, link)]
+        for link in all_links:
+            if link not in pending_links:
+                claim_venue_pages(link, topic_name)
+        venue_results = dict(zip(pending_links, asyncio.run(crawl_topic_async(pending_links, topic_name))))
+        
+        for index, link in enumerate(all_links):
+            if index < len(journal_links):
+                results, papers_acc = current_journal_results, current_journal_papers
+            else:
+                results, papers_acc = current_conference_results, current_conference_papers
+            if link not in venue_results:
+                replay_venue_units(link, venue_info, results, papers_acc, topic_name)
+                continue
+            venue_name, venue_full_name = get_venue_names(link, venue_info)
+            venue_complete = True
+            for year, papers, volume_link, contents_link, is_journal in venue_results[link]:
+                venue_complete &= record_venue_papers(venue_name, venue_full_name, year, papers, link, results,
+                                                      papers_acc, topic_name, is_journal=is_journal,
+                                                      volume_link=volume_link, contents_link=contents_link)
+            if journal is not None and venue_complete:
+                record_venue_done(link, topic_name)
+            complete &= venue_complete
+    else:
+        # 处理期刊链接
+        print(f"\n处理专题 '{topic_name}' 的期刊链接:")
+        for link in journal_links:
+            complete &= process_venue_link(link, venue_info, current_journal_results, current_journal_papers,
+                                           topic_name, is_current_journal=True)
+            
+        # 处理会议链接
+        print(f"\n处理专题 '{topic_name}' 的会议链接:")
+        for link in conference_links:
+            complete &= process_venue_link(link, venue_info, current_conference_results, current_conference_papers,
+                                           topic_name, is_current_journal=False)
+        
+    # 保存当前专题的期刊和会议结果，每组关键词配置各写一套文件
+    for profile in get_keyword_profiles():
+        save_topic_results(current_journal_results[profile.name], current_journal_papers[profile.name],
+                           topic_name, is_journal=True, profile=profile)
+        save_topic_results(current_conference_results[profile.name], current_conference_papers[profile.name],
+                           topic_name, is_journal=False, profile=profile)
+    if journal is not None:
+        journal.record_file_numbers(get_file_counters())
+        if complete:
+            journal.record_topic_done(topic_name)
+        else:
+            print(f"专题 '{topic_name}' 有页面处理失败，续爬时重新处理")
+
+# 并行处理专题时，子进程在离线模式下使用的本地论文库
+_worker_store = None
+
+def init_topic_worker(args, file_counters, previous_journal, frontier_path, journal_lock, workers):
+    """并行处理专题的子进程初始化：按命令行参数恢复运行选项，打开本进程使用的论文库、进度日志和URL前沿"""
+    global _worker_store
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    apply_runtime_options(args)
+    # 各进程的限速器相互独立，按进程数平分每个主机的速率和突发数，总请求速率不超过限速设置
+    rate_limiter = get_rate_limiter()
+    set_rate_limit(rate_limiter.rate / workers, max(1, rate_limiter.burst // workers))
+    set_file_counters(file_counters)
+    set_frontier(UrlFrontier(frontier_path))
+    
+    if args.offline or args.command == 'query':
+        _worker_store = PaperStore(args.corpus or CORPUS_FILE)
+        return
+    if not args.no_index:
+        set_entry_store(PaperStore(args.corpus or CORPUS_FILE))
+    journal = CrawlJournal(os.path.join(args.output_dir or OUTPUT_DIR, JOURNAL_FILENAME), journal_lock).load()
+    journal.previous = previous_journal
+    set_journal(journal)
+
+def crawl_topics_in_worker(topics, venue_info, args, fts_query=None):
+    """在子进程中按顺序处理一组专题，返回请求统计，由主进程汇总"""
+    for topic_name, (journal_links, conference_links) in topics:
+        crawl_topic(topic_name, journal_links, conference_links, venue_info, args, _worker_store, fts_query)
+    return take_stats()
+
+def group_topics(topics):
+    """
+    将包含相同会议/期刊链接的专题分到同一组，组内和组间都保持专题原有顺序
+    同一组的专题在一个子进程中按顺序处理，重复页面由排在前面的专题处理，结果与顺序处理相同。
+    链接按URL前沿登记页面时的键比较，同一页面的不同写法（镜像主机、末尾的index.html等）视为相同
+    
+    Returns:
+        [[(专题名称, (期刊链接, 会议链接))]]
+    """
+    def topic_keys(topic):
+        journal_links, conference_links = topic[1]
+        return {canonicalize_url(resolve_url(link)) for link in list(journal_links) + list(conference_links)}
+    
+    groups = []
+    link_group = {}
+    for topic in topics:
+        merged = sorted({link_group[key] for key in topic_keys(topic) if key in link_group})
+        group = merged[0] if merged else len(groups)
+        if not merged:
+            groups.append([])
+        for other in merged[1:]:
+            groups[group].extend(groups[other])
+            groups[other] = []
+        groups[group].append(topic)
+        for member in groups[group]:
+            for key in topic_keys(member):
+                link_group[key] = group
+    return [sorted(group, key=topics.index) for group in groups if group]
+
+def crawl_topics_parallel(topics, venue_info, args, workers, fts_query=None):
+    """
+    使用进程池并行处理多个专题，每个专题在一个子进程中完整处理并写入自己的结果文件
+    
+    包含相同会议/期刊的专题分为一组，在同一子进程中按顺序处理；文件编号需预先分配。
+    页面通过临时SQLite文件中的URL前沿在进程间去重，HTTP缓存本身可在进程间共享，
+    进度日志由各进程加锁追加写入同一文件
+    
+    Args:
+        topics: [(专题名称, (期刊链接, 会议链接))]
+        workers: 进程数
+    """
+    journal = get_journal()
+    # 已完成的专题只需在前沿中登记页面，与其他专题没有共同页面时整组不必处理
+    done = {topic_name for topic_name, _ in topics if journal is not None and journal.is_topic_done(topic_name)}
+    groups = [group for group in group_topics(topics) if any(topic_name not in done for topic_name, _ in group)]
+    workers = min(workers, len(groups))
+    print(f"使用 {workers} 个进程并行处理 {len(topics) - len(done)} 个专题（{len(groups)} 组）")
+    
+    frontier_fd, frontier_path = tempfile.mkstemp(prefix="url_frontier_", suffix=".sqlite")
+    os.close(frontier_fd)
+    shared_frontier = UrlFrontier(frontier_path)
+    context = multiprocessing.get_context()
+    initargs = (args, get_file_counters(), journal.previous if journal is not None else None,
+                frontier_path, context.Lock(), workers)
+    pool = context.Pool(workers, initializer=init_topic_worker, initargs=initargs)
+    try:
+        pending = [(group, pool.apply_async(crawl_topics_in_worker, (group, venue_info, args, fts_query)))
+                   for group in groups]
+        pool.close()
+        for group, result in pending:
+            try:
+                merge_stats(result.get())
+            except Exception as e:
+                print(f"处理专题 '{', '.join(topic_name for topic_name, _ in group)}' 时出错: {e}")
+        pool.join()
+    except KeyboardInterrupt:
+        # 子进程忽略Ctrl-C，由主进程统一终止；已写入的进度日志可用于 --resume 继续
+        pool.terminate()
+        pool.join()
+        raise
+    finally:
+        # 将子进程中下载失败的页面合并到主进程的前沿，供运行结束时汇总
+        for url, reason in shared_frontier.failures().items():
+            get_frontier().mark_failed(url, reason)
+        shared_frontier.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(frontier_path + suffix):
+                os.remove(frontier_path + suffix)
+
+def run_coordinator(args, topic_info, venue_info):
+    """
+    分布式爬取的协调节点：将各专题的会议/期刊写入工作队列，等待工作节点全部处理完后生成结果文件
+    
+    队列中已有相同配置和单元的任务时继续等待（失败的单元重新入队），否则清空队列重新开始。
+    结果按专题和链接的原始顺序生成，排在后面的单元中重复出现的页面跳过，与按顺序处理相同
+    """
+    queue = WorkQueue(args.queue or WORK_QUEUE_FILE)
+    units = [(topic_name, link) for topic_name, (journal_links, conference_links) in topic_info.items()
+             for link in list(journal_links) + list(conference_links)]
+    run_info = get_match_info()
+    if queue.get_run_info() == run_info and queue.get_units() == units:
+        retried = queue.retry_failed()
+        print(f"继续工作队列中的任务: {queue.db_path}" + (f"（{retried} 个失败单元重新入队）" if retried else ""))
+    else:
+        queue.reset(run_info, units, args.lease or WORK_LEASE_SECONDS, args.max_attempts or WORK_MAX_ATTEMPTS)
+        print(f"已将 {len(topic_info)} 个专题的 {len(units)} 个会议/期刊写入工作队列: {queue.db_path}")
+    
+    last_progress = None
+    while not queue.is_finished():
+        progress = queue.progress()
+        if progress != last_progress:
+            print(f"等待工作节点: 待处理 {progress['pending']}，处理中 {progress['leased']}，"
+                  f"已完成 {progress['done']}，失败 {progress['failed']}")
+            last_progress = progress
+        time.sleep(WORK_POLL_INTERVAL)
+    
+    results = queue.get_results()
+    queue.close()
+    assign_file_numbers(topic_info.keys())
+    seen_pages = set()
+    for topic_name, (journal_links, conference_links) in topic_info.items():
+        print(f"\n\n生成专题结果: {topic_name}")
+        current_results = {True: new_profile_results(), False: new_profile_results()}
+        current_papers = {True: new_profile_results(), False: new_profile_results()}
+        for index, link in enumerate(list(journal_links) + list(conference_links)):
+            is_journal_section = index < len(journal_links)
+            status, rows, error = results[(topic_name, link)]
+            if status != STATUS_DONE:
+                print(f"警告：{link} 处理失败（{error}），结果{'不完整' if rows else '缺失'}")
+            venue_name, venue_full_name = get_venue_names(link, venue_info)
+            for year, papers, volume_link, contents_link, is_journal in rows or []:
+                page = canonicalize_url(contents_link or volume_link)
+                if page in seen_pages:
+                    print(f"链接已在前面的专题中处理过，跳过: {page}")
+                    continue
+                seen_pages.add(page)
+                record_venue_papers(venue_name, venue_full_name, year, papers_from_json(papers), link,
+                                    current_results[is_journal_section], current_papers[is_journal_section],
+                                    topic_name, is_journal=is_journal, volume_link=volume_link,
+                                    contents_link=contents_link)
+        for profile in get_keyword_profiles():
+            for is_journal in (True, False):
+                save_topic_results(current_results[is_journal][profile.name], current_papers[is_journal][profile.name],
+                                   topic_name, is_journal=is_journal, profile=profile)
+
+def run_worker(args):
+    """
+    分布式爬取的工作节点：从工作队列领取会议/期刊，按 process_venue_link 的逻辑处理后写回论文结果
+    队列中没有可领取的单元、其他节点也都处理完后退出
+    """
+    queue = WorkQueue(args.queue or WORK_QUEUE_FILE)
+    if queue.get_run_info() is None:
+        print(f"错误: 工作队列为空，请先启动协调节点: {queue.db_path}")
+        return
+    if queue.get_run_info() != get_match_info():
+        print("错误: 本节点的目标年份或关键词配置与协调节点不同，无法处理该队列")
+        return
+    
+    worker_id = args.worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    print(f"工作节点 {worker_id} 开始处理队列: {queue.db_path}")
+    index_store = None
+    if not args.no_index:
+        index_store = set_entry_store(PaperStore(args.corpus or CORPUS_FILE))
+    
+    processed = 0
+    while True:
+        unit = queue.lease(worker_id)
+        if unit is None:
+            if queue.is_finished():
+                break
+            # 其他节点的租约过期后单元会被重新领取
+            time.sleep(WORK_POLL_INTERVAL)
+            continue
+        
+        unit_id, topic_name, link, attempt = unit
+        print(f"\n领取单元 #{unit_id}（第 {attempt} 次）: {topic_name} - {link}")
+        # 每个单元独立处理，重复页面由协调节点按原始顺序去重
+        get_frontier().clear()
+        rows = []
+        
+        def record(venue_name, venue_full_name, year, profile_papers, link, current_results, current_papers,
+                   current_topic="", is_journal=True, volume_link=None, contents_link=None, journal_unit=True):
+            rows.append([year, papers_to_json(profile_papers), volume_link, contents_link, is_journal])
+            queue.renew(unit_id, worker_id)
+            return bool(profile_papers)
+        
+        try:
+            if args.async_crawl:
+                for year, papers, volume_link, contents_link, is_journal in asyncio.run(crawl_topic_async([link], topic_name))[0]:
+                    record(None, None, year, papers, link, None, None, topic_name, is_journal, volume_link, contents_link)
+                complete = all(row[1] for row in rows)
+            else:
+                complete = process_venue_link(link, {}, None, None, topic_name, record=record)
+        except Exception as e:
+            retry = queue.fail(unit_id, worker_id, e)
+            print(f"处理单元 #{unit_id} 时出错: {e}，{'稍后重试' if retry else '已达到最多尝试次数'}")
+            continue
+        
+        if complete:
+            if not queue.complete(unit_id, worker_id, rows):
+                print(f"单元 #{unit_id} 的租约已过期并被其他节点领取，丢弃本次结果")
+        else:
+            retry = queue.fail(unit_id, worker_id, "部分页面处理失败", rows)
+            print(f"单元 #{unit_id} 有页面处理失败，{'稍后重试' if retry else '已达到最多尝试次数，保留部分结果'}")
+        processed += 1
+    
+    print(f"\n工作队列已全部处理完，本节点处理了 {processed} 个单元")
+    if index_store is not None:
+        set_entry_store(None)
+        index_store.close()
+    queue.close()
+
 def main():
     """主函数"""
     # 重置文件计数器，确保每次运行时文件编号从1开始
@@ -295,17 +969,16 @@ def main():
         import data_extractor
         data_extractor.INPUT_DIR = args.input_dir
     
-    # 设置输出目录
-    if args.output_dir:
-        set_output_directory(args.output_dir)
-    
-    # 设置输出文件名格式
-    set_output_formats(args.journal_format, args.conference_format)
+    # 设置输出、关键词配置、爬取后端、限速和缓存等运行选项
+    apply_runtime_options(args)
     
-    # 设置输出文件格式（txt或xlsx）
-    if args.output_format:
-        from utils.file_handler import set_output_format
-        set_output_format(args.output_format)
+    # 工作节点只需要工作队列，不读取输入文件
+    if args.command == 'worker':
+        run_worker(args)
+        shutdown_parse_pool()
+        print_failed_pages()
+        print_stats_summary()
+        return
     
     # 检查模板文件是否存在
     # 先尝试在input_dir中找文件
@@ -329,32 +1002,80 @@ def main():
         print("错误: 无法提取专题信息")
         return
         
-    for topic_name, (journal_links, conference_links) in topic_info.items():
-        print(f"\n\n处理专题: {topic_name}")
+    # 导入dblp全量数据到本地论文库
+    if args.ingest:
+        venue_keys = set()
+        for journal_links, conference_links in topic_info.values():
+            for link in list(journal_links) + list(conference_links):
+                venue_key = get_venue_key(link)
+                if venue_key:
+                    venue_keys.add(venue_key)
+                else:
+                    print(f"警告: 无法从链接中识别dblp会议/期刊，导入时跳过: {link}")
+        store = PaperStore(args.corpus or CORPUS_FILE)
+        try:
+            ingest_dump(args.ingest, venue_keys, TARGET_YEARS, store)
+        finally:
+            store.close()
+        if not args.offline and args.command != 'query':
+            return
+    
+    if args.command == 'coordinator':
+        run_coordinator(args, topic_info, venue_info)
+        return
+    
+    # 离线模式和 query 子命令从本地论文库读取条目，先用全文索引筛选候选条目
+    offline = args.offline or args.command == 'query'
+    store = PaperStore(args.corpus or CORPUS_FILE) if offline else None
+    fts_query = None
+    if store is not None:
+        print(f"离线模式: 使用本地论文库 {store.db_path}（共 {store.count()} 条记录）")
+        fts_query = build_fts_query(get_keyword_profiles())
+    
+    # 在线爬取时记录进度日志，中断后可通过 --resume 继续
+    journal = None
+    if not offline:
+        try:
+            journal = start_journal(args.output_dir or OUTPUT_DIR, template_file, args.resume, args.incremental)
+        except ValueError as e:
+            print(f"错误: {e}（{os.path.join(args.output_dir or OUTPUT_DIR, JOURNAL_FILENAME)}）")
+            return
+    
+    # 按专题顺序预先分配文件编号，并行处理时文件名与顺序处理相同
+    assign_file_numbers(topic_info.keys())
+    if journal is not None:
+        journal.record_file_numbers(get_file_counters())
+    
+    # 已完成的专题也按顺序交给 crawl_topic，只在URL前沿中登记其页面，不再处理
+    topics = list(topic_info.items())
+    pending_topics = [topic for topic in topics if journal is None or not journal.is_topic_done(topic[0])]
+    workers = min(max(1, args.topic_workers), len(pending_topics))
+    
+    if workers > 1:
+        crawl_topics_parallel(topics, venue_info, args, workers, fts_query)
+    else:
+        # 在线爬取时将每个页面的全部条目写入本地论文库，供之后离线检索
+        index_store = None
+        if not offline and not args.no_index:
+            index_store = set_entry_store(PaperStore(args.corpus or CORPUS_FILE))
         
-        # 跟踪当前专题的所有结果
-        current_journal_results = []
-        current_journal_papers = []
-        current_conference_results = []
-        current_conference_papers = []
+        for topic_name, (journal_links, conference_links) in topics:
+            crawl_topic(topic_name, journal_links, conference_links, venue_info, args, store, fts_query)
         
-        # 处理期刊链接
-        print(f"\n处理专题 '{topic_name}' 的期刊链接:")
-        for link in journal_links:
-            process_venue_link(link, venue_info, current_journal_results, current_journal_papers, topic_name, is_current_journal=True)
-            # 避免请求过快
-            time.sleep(1)
-            
-        # 处理会议链接
-        print(f"\n处理专题 '{topic_name}' 的会议链接:")
-        for link in conference_links:
-            process_venue_link(link, venue_info, current_conference_results, current_conference_papers, topic_name, is_current_journal=False)
-            # 避免请求过快
-            time.sleep(1)
-            
-        # 保存当前专题的期刊和会议结果
-        save_topic_results(current_journal_results, current_journal_papers, topic_name, is_journal=True)
-        save_topic_results(current_conference_results, current_conference_papers, topic_name, is_journal=False)
+        if index_store is not None:
+            set_entry_store(None)
+            index_store.close()
+    
+    if store is not None:
+        store.close()
+    if journal is not None:
+        set_journal(None)
+    
+    shutdown_parse_pool()
+    
+    # 输出网络请求统计，便于衡量优化效果
+    print_failed_pages()
+    print_stats_summary()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+爬取进度日志模块
+以JSONL格式追加记录已完成的爬取单元（会议/期刊的卷期或目录页）及其找到的论文、
+已完成的会议/期刊和专题，以及文件编号。每条记录写入后立即落盘，
+中断后使用 --resume 重新运行时跳过已完成的部分，并根据日志重新生成未完成专题的结果文件。
+页面记录同时保存页面指纹（内容哈希和条目数），--incremental 模式据此只处理新增或变化的页面
+"""
+import json
+import os
+from contextlib import nullcontext
+
+from utils.paper import papers_to_json, papers_from_json
+
+# 当前使用的进度日志，未设置时不记录进度
+_journal = None
+
+
+class CrawlJournal:
+    """
+    爬取进度日志
+
+    记录类型：
+        run: 本次爬取的配置摘要，配置变化后不能续爬
+        unit: 一个卷期/目录页的处理结果及页面指纹
+        venue_done: 一个会议/期刊的全部卷期已处理完，附带索引页指纹
+        topic_done: 一个专题的结果文件已全部生成
+        file_numbers: 当前的文件编号
+    """
+
+    def __init__(self, path, lock=None):
+        self.path = path
+        # 多个进程向同一日志追加记录时共用的锁（multiprocessing.Lock），保证每行记录完整写入
+        self._lock = lock
+        self.run_info = None
+        self.file_numbers = {}
+        self._units = {}
+        self._venues_done = set()
+        self._topics_done = set()
+        self._venue_index = {}
+        self._file = None
+        # 上次运行的日志，增量模式下用于沿用未变化页面的结果
+        self.previous = None
+
+    def load(self):
+        """读取已有的日志，最后一行不完整（写入时中断）时忽略该行"""
+        if not os.path.exists(self.path):
+            return self
+        with open(self.path, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                self._apply(record)
+        return self
+
+    def _apply(self, record):
+        """将一条记录合并到内存中的进度状态"""
+        record_type = record.get("type")
+        if record_type == "run":
+            self.run_info = record.get("info")
+        elif record_type == "unit":
+            record["papers"] = papers_from_json(record["papers"])
+            key = (record["topic"], record["link"])
+            self._units.setdefault(key, {})[record["url"]] = record
+        elif record_type == "venue_done":
+            self._venues_done.add((record["topic"], record["link"]))
+            self._venue_index[(record["topic"], record["link"])] = record.get("index")
+        elif record_type == "topic_done":
+            self._topics_done.add(record["topic"])
+        elif record_type == "file_numbers":
+            self.file_numbers = record.get("counters", {})
+
+    def _append(self, record):
+        """追加一条记录并立即写入磁盘"""
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        with self._lock or nullcontext():
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._apply(record)
+
+    def start(self, run_info):
+        """清空日志，开始新的一次爬取"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.run_info = None
+        self.file_numbers = {}
+        self._units = {}
+        self._venues_done = set()
+        self._topics_done = set()
+        self._venue_index = {}
+        self._append({"type": "run", "info": run_info})
+
+    def record_unit(self, topic, link, url, year, is_journal, papers, volume_link=None, contents_link=None,
+                    fingerprint=None):
+        """
+        记录一个已处理完的卷期/目录页
+
+        Args:
+            url: 页面地址，与 topic、link 一起唯一确定一个爬取单元
+            papers: {配置名称: Paper 列表}，以字段列表的形式写入日志
+            fingerprint: 页面指纹 {"hash": 内容哈希, "entries": 条目数}
+        """
+        existing = self._units.get((topic, link), {}).get(url)
+        if existing is not None and existing["papers"] == papers:
+            return
+        self._append({
+            "type": "unit", "topic": topic, "link": link, "url": url, "year": year,
+            "is_journal": is_journal, "volume_link": volume_link, "contents_link": contents_link,
+            "papers": papers_to_json(papers), "fingerprint": fingerprint,
+        })
+
+    def record_venue_done(self, topic, link, index_fingerprint=None):
+        """记录一个会议/期刊已处理完，index_fingerprint 为其索引页指纹"""
+        self._append({"type": "venue_done", "topic": topic, "link": link, "index": index_fingerprint})
+
+    def record_topic_done(self, topic):
+        """记录一个专题的结果文件已全部生成"""
+        self._append({"type": "topic_done", "topic": topic})
+
+    def record_file_numbers(self, counters):
+        """记录当前的文件编号，编号有变化时才写入"""
+        if counters != self.file_numbers:
+            self._append({"type": "file_numbers", "counters": dict(counters)})
+
+    def get_unit_papers(self, topic, link, url):
+        """获取已处理页面的论文结果，未处理时返回None"""
+        record = self._units.get((topic, link), {}).get(url)
+        return record["papers"] if record else None
+
+    def get_unit(self, topic, link, url):
+        """获取已处理页面的完整记录，未处理时返回None"""
+        return self._units.get((topic, link), {}).get(url)
+
+    def get_previous_unit(self, topic, link, url):
+        """获取上次运行中该页面的记录，没有上次的日志或页面未处理过时返回None"""
+        if self.previous is None:
+            return None
+        return self.previous.get_unit(topic, link, url)
+
+    def get_previous_venue_index(self, topic, link):
+        """获取上次运行时会议/期刊索引页的指纹"""
+        if self.previous is None:
+            return None
+        return self.previous._venue_index.get((topic, link))
+
+    def get_venue_units(self, topic, link):
+        """按处理顺序返回一个会议/期刊已记录的全部页面"""
+        return list(self._units.get((topic, link), {}).values())
+
+    def is_venue_done(self, topic, link):
+        """会议/期刊是否已处理完"""
+        return (topic, link) in self._venues_done
+
+    def is_topic_done(self, topic):
+        """专题是否已完成"""
+        return topic in self._topics_done
+
+    def close(self):
+        """关闭日志文件"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def get_journal():
+    """获取当前的进度日志，未启用时返回None"""
+    return _journal
+
+def set_journal(journal):
+    """设置当前的进度日志，传入None时停止记录"""
+    global _journal
+    if _journal is not None and _journal is not journal:
+        _journal.close()
+    _journal = journal
+    return _journal
@@ -4,6 +4,8 @@
 import os
 import re
 from core.config import INPUT_FILE, INPUT_DIR
+from crawlers.redirect_map import resolve_url
+from crawlers.url_frontier import canonicalize_url
 
 def get_full_input_path(file_path=None):
     """获取完整的输入文件路径"""
@@ -27,11 +29,18 @@ def get_full_input_path(file_path=None):
     # 最后返回默认路径
     return os.path.join(INPUT_DIR, file_path)
 
+def get_canonical_url(url):
+    """
+    链接的规范形式：先按已记录的重定向改写为最终地址，再统一dblp镜像主机、去掉片段和末尾的index.html，
+    例如 http://dblp.uni-trier.de/db/journals/tocs/ 规范化为 https://dblp.org/db/journals/tocs/
+    """
+    return canonicalize_url(resolve_url(url))
+
 def extract_venue_info(file_path=None):
-    """提取会议/期刊的简称、全称和网址信息"""
+    """提取会议/期刊的简称、全称和网址信息，同时给出网址的规范形式"""
     full_path = get_full_input_path(file_path)
     
-    venue_info = {}  # {简称: (全称, 网址)}
+    venue_info = {}  # {简称: (全称, 网址, 规范网址)}
     
     try:
         with open(full_path, 'r', encoding='utf-8') as file:
@@ -66,7 +75,7 @@ def extract_venue_info(file_path=None):
                             abbr = parts[1]  # 通常简称在第二列
                             full_name = ' '.join(parts[2:url_index])  # 全称可能有多个单词
                             url = parts[url_index]
-                            venue_info[abbr] = (full_name, url)
+                            venue_info[abbr] = (full_name, url, get_canonical_url(url))
                             print(f"提取到会议/期刊: {abbr} - {full_name}")
         
         print(f"共提取到 {len(venue_info)} 个会议/期刊信息")
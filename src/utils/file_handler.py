@@ -8,8 +8,10 @@ from core.config import OUTPUT_DIR, JOURNAL_OUTPUT_FORMAT, CONFERENCE_OUTPUT_FOR
 from core.config import TARGET_KEYWORDS, TARGET_KEYWORDS_MODE
 
 
-def _build_keyword_desc():
-    """构建关键词描述字符串，用于日志输出"""
+def _build_keyword_desc(profile=None):
+    """构建关键词描述字符串，用于日志输出；指定关键词配置时使用该配置的描述"""
+    if profile is not None:
+        return profile.describe()
     try:
         if isinstance(TARGET_KEYWORDS, (list, tuple)):
             kws = [str(k).strip() for k in TARGET_KEYWORDS if k]
@@ -36,7 +38,7 @@ except ImportError:
 try:
     from .excel_handler import save_topic_results as save_topic_results_to_excel
     from .excel_handler import save_venue_result as save_venue_result_to_excel
-    from .excel_handler import check_excel_support
+    from .excel_handler import check_excel_support, discard_workbook
     EXCEL_SUPPORTED = check_excel_support()
 except ImportError:
     EXCEL_SUPPORTED = False
@@ -67,6 +69,9 @@ elif not output_formats:
 # 用于跟踪文件编号的字典
 file_counters = {}
 
+# 当前使用的关键词配置名称，命名配置的结果写入输出目录下的同名子目录
+output_profiles = []
+
 def set_output_directory(directory):
     """设置输出目录"""
     global output_directory
@@ -111,11 +116,62 @@ def set_output_format(format_type):
             
     return output_formats
 
+def set_output_profiles(profile_names):
+    """设置关键词配置名称列表，用于确定文件编号时一并检查各配置的子目录"""
+    global output_profiles
+    output_profiles = [name for name in profile_names if name]
+    return output_profiles
+
+def get_profile_directory(profile=None):
+    """获取关键词配置对应的输出目录，默认配置（无名称）直接使用输出目录"""
+    if profile is None or not profile.name:
+        return output_directory
+    return os.path.join(output_directory, format_topic_name(profile.name))
+
 def reset_file_counters():
     """重置文件编号计数器"""
     global file_counters
     file_counters = {}
 
+def get_file_counters():
+    """获取当前已分配的文件编号，{类型_专题: 编号}"""
+    return dict(file_counters)
+
+def set_file_counters(counters):
+    """恢复已分配的文件编号，续爬时保证同一专题使用与中断前相同的文件"""
+    global file_counters
+    file_counters = dict(counters)
+    return file_counters
+
+def get_topic_key(topic_name, is_journal=True):
+    """文件编号计数器中专题的键，例如 journal_区块链"""
+    type_key = "journal" if is_journal else "conference"
+    return f"{type_key}_{format_topic_name(topic_name)}"
+
+def assign_file_numbers(topic_names):
+    """
+    按专题顺序预先为每个专题的期刊和会议结果文件分配编号，已分配的保持不变
+    编号与处理顺序和是否找到论文无关，多进程并行处理专题时文件名与顺序处理相同
+    """
+    for topic_name in topic_names:
+        for is_journal in (True, False):
+            topic_key = get_topic_key(topic_name, is_journal)
+            if topic_key not in file_counters:
+                file_counters[topic_key] = get_next_file_number()
+    return dict(file_counters)
+
+def remove_topic_files(topic_name, is_journal=True, profile=None):
+    """删除专题已生成的结果文件，只处理已分配编号的专题，续爬时在重新生成前调用"""
+    if get_topic_key(topic_name, is_journal) not in file_counters:
+        return
+    for fmt in output_formats:
+        output_file = get_output_file_path(topic_name, is_journal, fmt, profile)
+        if fmt == "xlsx" and EXCEL_SUPPORTED:
+            discard_workbook(output_file)
+        if os.path.exists(output_file):
+            os.remove(output_file)
+            print(f"已删除未完成的结果文件，将根据进度日志重新生成: {output_file}")
+
 def get_next_file_number():
     """获取下一个可用的文件序号"""
     # 首先检查输出目录中的文件
@@ -131,9 +187,16 @@ def get_next_file_number():
             os.makedirs(result_dir)
             return 1  # 如果目录是新创建的，从1开始
         
-        # 查找目录中的所有文件
+        # 查找目录中的所有文件，包括各关键词配置的子目录，同一专题在各配置下使用相同的序号
+        profile_dirs = [format_topic_name(name) for name in output_profiles]
+        filenames = [name for name in os.listdir(result_dir) if name not in profile_dirs]
+        for profile_dir in profile_dirs:
+            profile_dir = os.path.join(result_dir, profile_dir)
+            if os.path.isdir(profile_dir):
+                filenames.extend(os.listdir(profile_dir))
+        
         max_number = 0
-        for filename in os.listdir(result_dir):
+        for filename in filenames:
             # 尝试从文件名中提取序号
             match = re.match(r'^(\d+)', filename)
             if match:
@@ -169,16 +232,15 @@ def format_topic_name(topic_name):
         
     return formatted
 
-def get_output_file_path(topic_name, is_journal=True, file_format="txt"):
-    """根据专题名称、类型和文件格式获取输出文件路径"""
+def get_output_file_path(topic_name, is_journal=True, file_format="txt", profile=None):
+    """根据专题名称、类型、文件格式和关键词配置获取输出文件路径"""
     global output_directory, journal_output_format, conference_output_format, file_counters
     
     # 格式化专题名称
     formatted_topic = format_topic_name(topic_name)
     
     # 生成文件类型键
-    type_key = "journal" if is_journal else "conference"
-    topic_key = f"{type_key}_{formatted_topic}"
+    topic_key = get_topic_key(topic_name, is_journal)
     
     # 如果这个主题和类型的文件还没有编号，分配一个
     if topic_key not in file_counters:
@@ -208,21 +270,23 @@ def get_output_file_path(topic_name, is_journal=True, file_format="txt"):
     filename += f".{file_format}"
     
     # 确保目录存在
-    if not os.path.exists(output_directory):
-        os.makedirs(output_directory)
+    directory = get_profile_directory(profile)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
     
-    return os.path.join(output_directory, filename)
+    return os.path.join(directory, filename)
 
-def save_topic_results(results, all_papers, topic_name, is_journal=True):
+def save_topic_results(results, all_papers, topic_name, is_journal=True, profile=None):
     """
     保存特定专题的结果到对应文件
     根据配置的输出格式保存一个或多个版本的文件
     
     Args:
         results: 详细结果列表
-        all_papers: 所有论文列表
+        all_papers: 所有论文（Paper 列表）
         topic_name: 专题名称
         is_journal: 是否为期刊（True为期刊，False为会议）
+        profile: 关键词配置（可选），命名配置的结果写入对应子目录
     """
     if not topic_name:
         topic_name = "未知专题"
@@ -232,11 +296,13 @@ def save_topic_results(results, all_papers, topic_name, is_journal=True):
     # 遍历所有配置的输出格式
     for fmt in output_formats:
         # 获取此格式的输出文件路径
-        output_file = get_output_file_path(topic_name, is_journal, fmt)
+        output_file = get_output_file_path(topic_name, is_journal, fmt, profile)
     
         # 根据格式选择不同的保存方式
         if fmt == "txt" and TXT_SUPPORTED:
-            if save_topic_results_to_txt(results, all_papers, topic_name, output_file, is_journal):
+            keywords = profile.keywords if profile is not None else None
+            mode = profile.mode if profile is not None else None
+            if save_topic_results_to_txt(results, all_papers, topic_name, output_file, is_journal, keywords, mode):
                 success_formats.append(fmt)
         elif fmt == "xlsx" and EXCEL_SUPPORTED:
             if save_topic_results_to_excel(results, all_papers, topic_name, output_file, is_journal):
@@ -248,7 +314,7 @@ def save_topic_results(results, all_papers, topic_name, is_journal=True):
         print(f"错误：专题 '{topic_name}' 的结果保存失败")
 
 def save_venue_result(venue_name, venue_full_name, year, papers, source_link, 
-                     volume_link=None, contents_link=None, topic_name="", is_journal=True):
+                     volume_link=None, contents_link=None, topic_name="", is_journal=True, profile=None):
     """
     立即保存单个会议/期刊的结果到专题文件
     根据配置的输出格式保存一个或多个版本的文件
@@ -257,15 +323,16 @@ def save_venue_result(venue_name, venue_full_name, year, papers, source_link,
         venue_name: 会议/期刊名称
         venue_full_name: 会议/期刊全称
         year: 年份
-        papers: 找到的论文列表
+        papers: 找到的论文（Paper 列表）
         source_link: 来源链接
         volume_link: 卷期链接（可选）
         contents_link: 目录链接（可选）
         topic_name: 专题名称
         is_journal: 是否为期刊
+        profile: 关键词配置（可选），命名配置的结果写入对应子目录
     """
     if not papers:
-        kw_desc = _build_keyword_desc()
+        kw_desc = _build_keyword_desc(profile)
         print(f"未在 {venue_name} {year}年 找到{kw_desc}的论文，跳过保存")
         return
     
@@ -277,7 +344,7 @@ def save_venue_result(venue_name, venue_full_name, year, papers, source_link,
     # 遍历所有配置的输出格式
     for fmt in output_formats:
         # 获取此格式的输出文件路径
-        output_file = get_output_file_path(topic_name, is_journal, fmt)
+        output_file = get_output_file_path(topic_name, is_journal, fmt, profile)
     
         # 根据格式选择不同的保存方式
         if fmt == "txt" and TXT_SUPPORTED:
@@ -0,0 +1,103 @@
+"""
+论文记录模块
+论文在匹配时生成一次结构化记录，之后的累计、进度日志和各格式的结果文件都直接使用记录中的字段，
+不再把论文拼成 "标题 [DOI: 链接]" 字符串后反复用正则拆分
+"""
+# 论文链接的类型
+LINK_DOI = 'doi'  # doi.org 链接
+LINK_CONFERENCE = 'conference'  # 会议/出版方的论文页面
+LINK_FALLBACK = 'fallback'  # 条目中找到的其他链接
+
+_CONFERENCE_LINK_HINTS = ('conference', 'conf', 'proceedings', 'paper', 'presentation')
+
+
+def classify_link(link):
+    """根据链接地址判断链接类型，无链接时返回None"""
+    if not link:
+        return None
+    if 'doi.org' in link:
+        return LINK_DOI
+    if link.startswith('https://') and any(hint in link for hint in _CONFERENCE_LINK_HINTS):
+        return LINK_CONFERENCE
+    return LINK_FALLBACK
+
+
+class Paper:
+    """
+    一篇匹配到的论文
+
+    Args:
+        title: 论文标题（已合并空白字符）
+        link: 论文链接（通常为DOI），没有时为None
+        link_kind: 链接类型，默认根据链接地址判断
+        venue: 会议/期刊简称，记录结果时填写
+        year: 年份，记录结果时填写
+        volume_link, contents_link: 论文所在的卷期页和目录页
+    """
+
+    __slots__ = ('title', 'link', 'link_kind', 'venue', 'year', 'volume_link', 'contents_link')
+
+    def __init__(self, title, link=None, link_kind=None, venue=None, year=None, volume_link=None,
+                 contents_link=None):
+        self.title = title
+        self.link = link or None
+        self.link_kind = link_kind or classify_link(self.link)
+        self.venue = venue
+        self.year = year
+        self.volume_link = volume_link
+        self.contents_link = contents_link
+
+    @property
+    def key(self):
+        """同一页面中用于去重的键"""
+        return self.title, self.link
+
+    def set_source(self, venue, year, volume_link=None, contents_link=None):
+        """填写论文所在的会议/期刊、年份和页面"""
+        self.venue = venue
+        self.year = year
+        self.volume_link = volume_link
+        self.contents_link = contents_link
+        return self
+
+    def label(self):
+        """总览中的 "会议/期刊 年份"，未填写会议/期刊时为空字符串"""
+        return f"{self.venue} {self.year}" if self.venue else ""
+
+    def display(self):
+        """文本结果中的显示形式：标题 DOI: 链接"""
+        return f"{self.title} DOI: {self.link}" if self.link else self.title
+
+    def __str__(self):
+        """详细信息和日志中的形式：标题 [DOI: 链接]"""
+        return f"{self.title} [DOI: {self.link}]" if self.link else self.title
+
+    def __repr__(self):
+        return f"Paper({self.title!r}, {self.link!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Paper):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def to_list(self):
+        """转换为可写入JSON的列表，字段顺序与 __slots__ 相同"""
+        return [getattr(self, name) for name in self.__slots__]
+
+    @classmethod
+    def from_list(cls, values):
+        """从 to_list 的结果恢复记录"""
+        return cls(*values)
+
+
+def papers_to_json(profile_papers):
+    """将 {配置名称: 论文列表} 转换为可写入JSON的形式"""
+    return {name: [paper.to_list() for paper in papers] for name, papers in profile_papers.items()}
+
+def papers_from_json(data):
+    """从 papers_to_json 的结果恢复 {配置名称: 论文列表}；论文记录为字符串的旧格式进度日志不再支持"""
+    if any(isinstance(item, str) for papers in data.values() for item in papers):
+        raise ValueError("进度日志中的论文记录为旧格式，请删除进度日志后重新运行")
+    return {name: [Paper.from_list(item) for item in papers] for name, papers in data.items()}
@@ -0,0 +1,198 @@
+"""
+本地论文库模块，使用SQLite保存dblp论文条目，供离线匹配关键词使用
+条目同时写入FTS5全文索引（trigram分词，支持子串匹配），离线检索时先用索引筛选候选条目
+"""
+import os
+import re
+import sqlite3
+import threading
+from urllib.parse import urlsplit
+
+from core.config import CORPUS_FILE
+from utils.paper import classify_link
+
+# dblp页面路径中的会议/期刊标识，例如 /db/journals/tocs/ 或 /db/conf/fast/index.html
+_VENUE_PATH_PATTERN = re.compile(r'/db/(journals|conf)/([^/]+)')
+
+
+def _fts_phrase(word):
+    """将单词转为FTS5查询中的短语，双引号需要转义"""
+    return '"' + word.replace('"', '""') + '"'
+
+def build_fts_query(profiles):
+    """
+    根据关键词配置构建FTS5查询，用于从全文索引中筛选候选条目
+
+    查询结果是精确匹配结果的超集：短语按空白拆分为多个单词，词边界不在索引中判断，
+    最终仍由关键词匹配器逐条确认。trigram分词无法匹配少于3个字符的单词，
+    存在这类关键词时返回None，表示需要扫描全部条目
+
+    Args:
+        profiles: 关键词配置列表，每项需包含 keywords 和 mode 属性
+
+    Returns:
+        FTS5查询字符串，无法用索引筛选时返回None
+    """
+    clauses = []
+    for profile in profiles:
+        keyword_clauses = []
+        for keyword in profile.keywords:
+            words = keyword.split()
+            if not words or any(len(word) < 3 for word in words):
+                return None
+            keyword_clauses.append("(" + " AND ".join(_fts_phrase(word) for word in words) + ")")
+        if not keyword_clauses:
+            continue
+        joiner = " AND " if profile.mode and profile.mode.upper() == 'AND' else " OR "
+        clauses.append("(" + joiner.join(keyword_clauses) + ")")
+    if not clauses:
+        return None
+    return " OR ".join(clauses)
+
+def get_venue_key(url):
+    """
+    从dblp链接中提取会议/期刊标识，与dblp记录key的前两段一致
+
+    例如 http://dblp.uni-trier.de/db/journals/tocs/ -> journals/tocs
+
+    Returns:
+        标识字符串，非dblp链接返回None
+    """
+    match = _VENUE_PATH_PATTERN.search(urlsplit(url).path)
+    if not match:
+        return None
+    return f"{match.group(1)}/{match.group(2)}"
+
+
+class PaperStore:
+    """论文条目库，每条记录包含会议/期刊标识、年份、标题、链接、条目全文和所在目录页，可在多线程间共享"""
+
+    def __init__(self, db_path=CORPUS_FILE):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " venue_key TEXT NOT NULL, year TEXT NOT NULL, title TEXT NOT NULL,"
+            " link TEXT, entry_text TEXT, source_url TEXT)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_venue_year ON entries(venue_key, year)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_source_url ON entries(source_url)")
+        self.fts_enabled = self._create_fts_index()
+        self.conn.commit()
+
+    def _create_fts_index(self):
+        """创建与条目表同步的FTS5全文索引，当前SQLite不支持FTS5或trigram分词时返回False"""
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entries_fts'").fetchone()
+        if exists:
+            return True
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE entries_fts USING fts5("
+                " title, entry_text, content='entries', content_rowid='rowid', tokenize='trigram')"
+            )
+        except sqlite3.OperationalError as e:
+            print(f"警告：当前SQLite不支持FTS5全文索引，离线检索将扫描全部条目: {e}")
+            return False
+        self.conn.execute(
+            "CREATE TRIGGER entries_fts_insert AFTER INSERT ON entries BEGIN"
+            " INSERT INTO entries_fts(rowid, title, entry_text) VALUES (new.rowid, new.title, new.entry_text);"
+            " END"
+        )
+        self.conn.execute(
+            "CREATE TRIGGER entries_fts_delete AFTER DELETE ON entries BEGIN"
+            " INSERT INTO entries_fts(entries_fts, rowid, title, entry_text)"
+            " VALUES ('delete', old.rowid, old.title, old.entry_text);"
+            " END"
+        )
+        # 为创建索引之前已有的条目建立索引
+        self.conn.execute("INSERT INTO entries_fts(entries_fts) VALUES ('rebuild')")
+        return True
+
+    def clear_venues(self, venue_keys):
+        """删除指定会议/期刊的全部条目，重新导入前调用"""
+        with self._lock:
+            self.conn.executemany("DELETE FROM entries WHERE venue_key = ?", [(key,) for key in venue_keys])
+            self.conn.commit()
+
+    def add_entries(self, rows):
+        """
+        批量添加条目
+
+        Args:
+            rows: [(venue_key, year, title, link, entry_text, source_url)]
+        """
+        with self._lock:
+            self.conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.conn.commit()
+
+    def replace_page(self, venue_key, year, source_url, entries):
+        """
+        用一个卷期/目录页的最新条目替换库中该页面的旧条目，爬取时调用
+
+        Args:
+            entries: [(title, link, link_kind, year, entry_text)]，条目中的年份不使用，以 year 参数为准
+        """
+        with self._lock:
+            self.conn.execute("DELETE FROM entries WHERE source_url = ?", (source_url,))
+            self.conn.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                [(venue_key, year, title, link, entry_text, source_url) for title, link, _, _, entry_text in entries]
+            )
+            self.conn.commit()
+
+    def delete_page(self, source_url):
+        """删除库中某个卷期/目录页的全部条目，流式解析的页面分批写入新条目前调用"""
+        with self._lock:
+            self.conn.execute("DELETE FROM entries WHERE source_url = ?", (source_url,))
+            self.conn.commit()
+
+    def get_venue_entries(self, venue_key, years, fts_query=None):
+        """
+        按目录页分组返回某个会议/期刊在指定年份的条目，年份从新到旧
+
+        Args:
+            fts_query: FTS5查询（可选），指定时只返回全文索引中匹配的候选条目
+
+        Returns:
+            [(year, source_url, [(title, link, link_kind, year, entry_text)])]
+        """
+        if not years:
+            return []
+        placeholders = ", ".join("?" for _ in years)
+        with self._lock:
+            if fts_query and self.fts_enabled:
+                rows = self.conn.execute(
+                    f"SELECT e.year, e.source_url, e.title, e.link, e.entry_text"
+                    f" FROM entries_fts JOIN entries e ON e.rowid = entries_fts.rowid"
+                    f" WHERE entries_fts MATCH ? AND e.venue_key = ? AND e.year IN ({placeholders})"
+                    f" ORDER BY e.year DESC, e.source_url, e.rowid",
+                    [fts_query, venue_key, *years]
+                ).fetchall()
+            else:
+                rows = self.conn.execute(
+                    f"SELECT year, source_url, title, link, entry_text FROM entries"
+                    f" WHERE venue_key = ? AND year IN ({placeholders})"
+                    f" ORDER BY year DESC, source_url, rowid",
+                    [venue_key, *years]
+                ).fetchall()
+        groups = []
+        for year, source_url, title, link, entry_text in rows:
+            if not groups or groups[-1][0] != year or groups[-1][1] != source_url:
+                groups.append((year, source_url, []))
+            groups[-1][2].append((title, link, classify_link(link), year, entry_text))
+        return groups
+
+    def count(self):
+        """条目总数"""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self.conn.close()
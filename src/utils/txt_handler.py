@@ -2,79 +2,26 @@
 文本文件输出处理模块，专门用于生成文本格式的结果文件
 """
 import os
-import re
 from core.config import TARGET_KEYWORDS, TARGET_KEYWORDS_MODE
 
-# 从excel_handler模块导入DOI提取函数，保持一致性
-# 如果excel_handler不可用，则在本模块中实现该函数
-try:
-    from .excel_handler import extract_doi_link
-except ImportError:
-    def extract_doi_link(paper):
-        """
-        从论文条目中提取DOI链接
-        
-        Args:
-            paper: 原始论文条目文本
-            
-        Returns:
-            (paper_title, doi_link): 论文标题和DOI链接（无链接则返回空字符串）
-        """
-        # 检查是否包含标准DOI链接
-        doi_match = re.search(r'\[DOI: (https?://doi\.org/[^\]]+)\]', paper)
-        if doi_match:
-            doi_link = doi_match.group(1)
-            # 移除原始DOI标记
-            paper_title = paper.replace(f" [DOI: {doi_link}]", "")
-            return paper_title, doi_link
-        
-        # 检查是否包含会议链接作为DOI（新增支持）
-        conf_match = re.search(r'\[DOI: (https?://[^\]]+)\]', paper)
-        if conf_match:
-            doi_link = conf_match.group(1)
-            # 移除原始DOI标记
-            paper_title = paper.replace(f" [DOI: {doi_link}]", "")
-            return paper_title, doi_link
-        
-        # 如果使用其他格式，也尝试提取
-        doi_match = re.search(r'DOI: (https?://doi\.org/\S+)', paper)
-        if doi_match:
-            doi_link = doi_match.group(1)
-            # 移除原始DOI标记
-            paper_title = paper.replace(f" DOI: {doi_link}", "")
-            return paper_title, doi_link
-        
-        # 尝试提取其他格式的会议链接（新增支持）
-        conf_match = re.search(r'DOI: (https?://\S+)', paper)
-        if conf_match:
-            doi_link = conf_match.group(1)
-            # 移除原始DOI标记
-            paper_title = paper.replace(f" DOI: {doi_link}", "")
-            return paper_title, doi_link
-        
-        return paper, ""
-
-def format_paper_with_doi(paper):
+def format_paper(paper, with_venue=False):
     """
-    格式化论文条目，提取DOI链接并以更美观的方式显示
+    格式化论文条目：标题 DOI: 链接
     
     Args:
-        paper: 原始论文条目文本
-        
-    Returns:
-        格式化后的论文条目
+        paper: Paper 记录
+        with_venue: 是否在开头加上 [会议/期刊 年份]，用于专题的论文总览
     """
-    # 提取DOI链接
-    paper_title, doi_link = extract_doi_link(paper)
-    
-    # 如果有DOI链接，则以更美观的方式显示
-    if doi_link:
-        return f"{paper_title} DOI: {doi_link}"
-    
-    return paper
+    if with_venue and paper.venue:
+        return f"[{paper.label()}] {paper.display()}"
+    return paper.display()
 
-def save_topic_results(results, all_papers, topic_name, output_file, is_journal=True):
-    """保存结果到文本文件"""
+def save_topic_results(results, all_papers, topic_name, output_file, is_journal=True, keywords=None, mode=None):
+    """保存结果到文本文件，keywords 和 mode 用于生成标题，默认使用配置中的关键词"""
+    if keywords is None:
+        keywords = TARGET_KEYWORDS
+    if mode is None:
+        mode = TARGET_KEYWORDS_MODE
     try:
         with open(output_file, 'w', encoding='utf-8') as file:
             file.write("# 包含关键词的论文\n")
@@ -84,23 +31,22 @@ def save_topic_results(results, all_papers, topic_name, output_file, is_journal=
             if all_papers:
                 # 构建动态标题，基于配置中的关键词和匹配模式
                 try:
-                    if isinstance(TARGET_KEYWORDS, (list, tuple)):
-                        kws = [str(k).strip() for k in TARGET_KEYWORDS if k]
+                    if isinstance(keywords, (list, tuple)):
+                        kws = [str(k).strip() for k in keywords if k]
                     else:
-                        kws = [str(TARGET_KEYWORDS)] if TARGET_KEYWORDS else []
+                        kws = [str(keywords)] if keywords else []
                 except Exception:
-                    kws = [str(TARGET_KEYWORDS)]
+                    kws = [str(keywords)]
 
                 joined = ', '.join(kws) if kws else '指定'
-                if TARGET_KEYWORDS_MODE and TARGET_KEYWORDS_MODE.upper() == 'AND':
+                if mode and mode.upper() == 'AND':
                     title_line = f"## 所有同时包含 {joined} 关键词的论文一览\n\n"
                 else:
                     title_line = f"## 所有包含任一关键词 ({joined}) 的论文一览\n\n"
 
                 file.write(title_line)
                 for i, paper in enumerate(all_papers, 1):
-                    formatted_paper = format_paper_with_doi(paper)
-                    file.write(f"{i}. {formatted_paper}\n")
+                    file.write(f"{i}. {format_paper(paper, with_venue=True)}\n")
                 file.write("\n" + "="*50 + "\n\n")
             
             # 然后添加详细结果
@@ -110,15 +56,15 @@ def save_topic_results(results, all_papers, topic_name, output_file, is_journal=
             else:
                 # 根据配置动态生成提示信息
                 try:
-                    if isinstance(TARGET_KEYWORDS, (list, tuple)):
-                        kws = [str(k).strip() for k in TARGET_KEYWORDS if k]
+                    if isinstance(keywords, (list, tuple)):
+                        kws = [str(k).strip() for k in keywords if k]
                     else:
-                        kws = [str(TARGET_KEYWORDS)] if TARGET_KEYWORDS else []
+                        kws = [str(keywords)] if keywords else []
                 except Exception:
-                    kws = [str(TARGET_KEYWORDS)]
+                    kws = [str(keywords)]
 
                 joined = ', '.join(kws) if kws else '指定'
-                if TARGET_KEYWORDS_MODE and TARGET_KEYWORDS_MODE.upper() == 'AND':
+                if mode and mode.upper() == 'AND':
                     file.write(f"未找到同时包含 {joined} 关键词的论文。")
                 else:
                     file.write(f"未找到包含任一关键词 ({joined}) 的论文。")
@@ -138,7 +84,7 @@ def save_venue_result(venue_name, venue_full_name, year, papers, source_link,
         venue_name: 会议/期刊名称
         venue_full_name: 会议/期刊全称
         year: 年份
-        papers: 找到的论文列表
+        papers: 找到的论文（Paper 列表）
         source_link: 来源链接
         volume_link: 卷期链接（可选）
         contents_link: 目录链接（可选）
@@ -168,8 +114,7 @@ def save_venue_result(venue_name, venue_full_name, year, papers, source_link,
         result_entry += f"- 找到的论文:\n"
         
         for paper in papers:
-            formatted_paper = format_paper_with_doi(paper)
-            result_entry += f"  * {formatted_paper}\n"
+            result_entry += f"  * {format_paper(paper)}\n"
         
         # 如果文件不存在，创建新文件并写入头部
         if not os.path.exists(output_file):
@@ -0,0 +1,188 @@
+"""
+分布式爬取的工作队列模块
+协调节点把每个专题下的会议/期刊作为一个工作单元写入SQLite队列，各工作节点以租约方式领取单元，
+处理完成后写回结构化的论文结果；租约过期未完成的单元会被重新领取，失败的单元按次数重试
+"""
+import json
+import os
+import sqlite3
+import time
+
+from core.config import WORK_LEASE_SECONDS, WORK_MAX_ATTEMPTS
+
+# 工作单元状态
+STATUS_PENDING = 'pending'
+STATUS_LEASED = 'leased'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+class WorkQueue:
+    """
+    基于SQLite的工作队列，可由多个进程或共享文件系统上的多个节点同时访问
+
+    每个单元为 (专题, 会议/期刊链接)，单元编号即入队顺序，协调节点按此顺序生成结果文件
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.conn = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS units ("
+            " id INTEGER PRIMARY KEY, topic TEXT NOT NULL, link TEXT NOT NULL,"
+            " status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0,"
+            " worker TEXT, lease_expires REAL, result TEXT, error TEXT)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_units_status ON units(status)")
+
+    def _get_meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def get_run_info(self):
+        """获取协调节点写入的匹配配置摘要，工作节点据此确认配置一致"""
+        return self._get_meta("run_info")
+
+    def get_units(self):
+        """按入队顺序返回全部单元的 (专题, 链接)"""
+        return [tuple(row) for row in self.conn.execute("SELECT topic, link FROM units ORDER BY id")]
+
+    def reset(self, run_info, units, lease_seconds=WORK_LEASE_SECONDS, max_attempts=WORK_MAX_ATTEMPTS):
+        """
+        清空队列并写入新的工作单元
+
+        Args:
+            run_info: 匹配配置摘要
+            units: [(专题, 会议/期刊链接)]，顺序即结果文件中的顺序
+            lease_seconds: 租约时长（秒），工作节点每处理完一个页面会续约
+            max_attempts: 每个单元最多领取的次数
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute("DELETE FROM units")
+            self.conn.execute("DELETE FROM meta")
+            self.conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+                ("run_info", json.dumps(run_info, ensure_ascii=False)),
+                ("lease_seconds", json.dumps(lease_seconds)),
+                ("max_attempts", json.dumps(max_attempts)),
+            ])
+            self.conn.executemany("INSERT INTO units (topic, link) VALUES (?, ?)", units)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def retry_failed(self):
+        """将失败的单元重新放回队列并清零领取次数，返回重新入队的数量"""
+        cursor = self.conn.execute(
+            "UPDATE units SET status = ?, attempts = 0, worker = NULL, error = NULL WHERE status = ?",
+            (STATUS_PENDING, STATUS_FAILED))
+        return cursor.rowcount
+
+    def lease(self, worker_id):
+        """
+        领取一个待处理或租约已过期的单元
+
+        Returns:
+            (单元编号, 专题, 链接, 第几次领取)，没有可领取的单元时返回None
+        """
+        now = time.time()
+        max_attempts = self._get_meta("max_attempts", WORK_MAX_ATTEMPTS)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 租约过期且已达到最多领取次数的单元不再重试
+            self.conn.execute(
+                "UPDATE units SET status = ?, error = ? WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (STATUS_FAILED, "租约过期次数过多", STATUS_LEASED, now, max_attempts))
+            row = self.conn.execute(
+                "SELECT id, topic, link, attempts FROM units"
+                " WHERE status = ? OR (status = ? AND lease_expires < ?) ORDER BY id LIMIT 1",
+                (STATUS_PENDING, STATUS_LEASED, now)).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            unit_id, topic, link, attempts = row
+            self.conn.execute(
+                "UPDATE units SET status = ?, worker = ?, lease_expires = ?, attempts = ? WHERE id = ?",
+                (STATUS_LEASED, worker_id, now + self._get_meta("lease_seconds", WORK_LEASE_SECONDS),
+                 attempts + 1, unit_id))
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return unit_id, topic, link, attempts + 1
+
+    def renew(self, unit_id, worker_id):
+        """续约，返回租约是否仍属于该工作节点"""
+        cursor = self.conn.execute(
+            "UPDATE units SET lease_expires = ? WHERE id = ? AND worker = ? AND status = ?",
+            (time.time() + self._get_meta("lease_seconds", WORK_LEASE_SECONDS), unit_id, worker_id, STATUS_LEASED))
+        return cursor.rowcount == 1
+
+    def complete(self, unit_id, worker_id, result):
+        """
+        写回单元的处理结果
+
+        Args:
+            result: [[年份, {配置名称: 论文字段列表}, 卷期链接, 目录链接, 是否期刊]]，论文由 papers_to_json 转换
+
+        Returns:
+            是否写入成功；租约已被其他工作节点领取时返回False
+        """
+        cursor = self.conn.execute(
+            "UPDATE units SET status = ?, result = ?, error = NULL WHERE id = ? AND worker = ? AND status = ?",
+            (STATUS_DONE, json.dumps(result, ensure_ascii=False), unit_id, worker_id, STATUS_LEASED))
+        return cursor.rowcount == 1
+
+    def fail(self, unit_id, worker_id, error, result=None):
+        """
+        记录单元处理失败：未达到最多领取次数时放回队列重试，否则标记为失败并保留部分结果
+
+        Returns:
+            单元是否会被重试
+        """
+        max_attempts = self._get_meta("max_attempts", WORK_MAX_ATTEMPTS)
+        row = self.conn.execute("SELECT attempts FROM units WHERE id = ? AND worker = ? AND status = ?",
+                                (unit_id, worker_id, STATUS_LEASED)).fetchone()
+        if row is None:
+            return False
+        retry = row[0] < max_attempts
+        self.conn.execute(
+            "UPDATE units SET status = ?, error = ?, result = ?, lease_expires = NULL WHERE id = ?",
+            (STATUS_PENDING if retry else STATUS_FAILED, str(error),
+             json.dumps(result, ensure_ascii=False) if result is not None else None, unit_id))
+        return retry
+
+    def progress(self):
+        """各状态的单元数量 {状态: 数量}"""
+        counts = {STATUS_PENDING: 0, STATUS_LEASED: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+        for status, count in self.conn.execute("SELECT status, COUNT(*) FROM units GROUP BY status"):
+            counts[status] = count
+        return counts
+
+    def is_finished(self):
+        """是否所有单元都已完成或失败"""
+        counts = self.progress()
+        return counts[STATUS_PENDING] == 0 and counts[STATUS_LEASED] == 0
+
+    def get_results(self):
+        """
+        获取全部单元的结果
+
+        Returns:
+            {(专题, 链接): (状态, 结果列表或None, 错误信息)}
+        """
+        results = {}
+        for topic, link, status, result, error in self.conn.execute(
+                "SELECT topic, link, status, result, error FROM units ORDER BY id"):
+            results[(topic, link)] = (status, json.loads(result) if result else None, error)
+        return results
+
+    def close(self):
+        """关闭数据库连接"""
+        self.conn.close()
@@ -0,0 +1,7 @@
+"""
+测试公共设置：将src目录加入Python路径，与 run.py 的做法相同
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
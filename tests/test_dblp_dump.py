@@ -0,0 +1,96 @@
+"""
+dblp全量数据导入测试
+使用 tests/fixtures/dblp_sample.xml.gz：一个很小的合成数据文件，包含外部DTD声明、内部DTD实体和HTML命名实体，
+以及两个会议/期刊（conf/fast、journals/tocs）不同年份的记录，另有非目标年份、非目标会议和非论文类型的记录
+"""
+import glob
+import os
+import subprocess
+import sys
+
+from crawlers.dblp_dump import ingest_dump
+from utils.paper_store import PaperStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DUMP_FILE = os.path.join(ROOT, "tests", "fixtures", "dblp_sample.xml.gz")
+
+EXPECTED_ROWS = [
+    ("conf/fast", "2024", "Fibonacci Heaps for Blockchain Storage.", "https://doi.org/10.1000/fast24.1",
+     "Jürgen Müller Alice Author Fibonacci Heaps for Blockchain Storage. 1-14 2024 FAST conf/fast/2024",
+     "https://dblp.org/db/conf/fast/fast2024.html"),
+    ("conf/fast", "2024", "Log-Structured Merge Trees Revisited.", None,
+     "Bob Writer Log-Structured Merge Trees Revisited. 2024 FAST",
+     "https://dblp.org/db/conf/fast/fast2024.html"),
+    ("journals/tocs", "2024", "Distributed Snapshots at Scale.", "https://doi.org/10.1000/tocs42.7",
+     "Dana Lee Distributed Snapshots at Scale. 2024 42 ACM Trans. Comput. Syst.",
+     "https://dblp.org/db/journals/tocs/tocs42.html"),
+    ("journals/tocs", "2025", "A Fibonacci Sequencer for Blockchain Consensus.", "https://doi.org/10.1000/tocs43.1",
+     "María García A Fibonacci Sequencer for Blockchain Consensus. 1:1-1:30 2025 43 ACM Trans. Comput. Syst.",
+     "https://dblp.org/db/journals/tocs/tocs43.html"),
+]
+
+CATALOG = """中国计算机学会推荐国际学术期刊
+（测试专题）
+一、A 类
+序号\t刊物简称\t刊物全称\t出版社\t网址
+1\tTOCS\tACM Transactions on Computer Systems\tACM\thttps://dblp.org/db/journals/tocs/
+
+中国计算机学会推荐国际学术会议
+（测试专题）
+一、A 类
+序号\t会议简称\t会议全称\t出版社\t网址
+1\tFAST\tUSENIX Conference on File and Storage Technologies\tUSENIX\thttps://dblp.org/db/conf/fast/
+"""
+
+
+def read_rows(store):
+    return sorted(store.conn.execute("SELECT * FROM entries").fetchall(), key=lambda row: (row[0], row[1], row[2]))
+
+def test_ingest_filters_venues_and_years(tmp_path):
+    store = PaperStore(str(tmp_path / "corpus.db"))
+    try:
+        assert ingest_dump(DUMP_FILE, {"conf/fast", "journals/tocs"}, ["2024", "2025"], store) == 4
+        assert read_rows(store) == EXPECTED_ROWS
+        # 重新导入时先清空这些会议/期刊的旧条目，不会重复
+        assert ingest_dump(DUMP_FILE, {"conf/fast", "journals/tocs"}, ["2024", "2025"], store) == 4
+        assert read_rows(store) == EXPECTED_ROWS
+    finally:
+        store.close()
+
+def test_ingest_single_year(tmp_path):
+    store = PaperStore(str(tmp_path / "corpus.db"))
+    try:
+        assert ingest_dump(DUMP_FILE, {"journals/tocs"}, ["2025"], store) == 1
+        assert [row[2] for row in read_rows(store)] == ["A Fibonacci Sequencer for Blockchain Consensus."]
+    finally:
+        store.close()
+
+def test_offline_output_after_ingest(tmp_path):
+    catalog = tmp_path / "catalog.txt"
+    catalog.write_text(CATALOG, encoding="utf-8")
+    output_dir = tmp_path / "output"
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "run.py"), "--input-file", str(catalog), "--output-dir", str(output_dir),
+         "--ingest", DUMP_FILE, "--offline", "--corpus", str(tmp_path / "corpus.db")],
+        cwd=str(tmp_path), capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    outputs = {}
+    for path in glob.glob(str(output_dir / "*.txt")):
+        with open(path, encoding="utf-8") as f:
+            outputs[os.path.basename(path)] = f.read()
+    journal_output = next(text for name, text in outputs.items() if "期刊" in name)
+    conference_output = next(text for name, text in outputs.items() if "会议" in name)
+
+    # 默认关键词为同时包含 Fibonacci 和 blockchain 的标题
+    assert "A Fibonacci Sequencer for Blockchain Consensus." in journal_output
+    assert "https://doi.org/10.1000/tocs43.1" in journal_output
+    assert "Distributed Snapshots at Scale." not in journal_output
+    assert "Fibonacci Heaps for Blockchain Storage." in conference_output
+    assert "https://doi.org/10.1000/fast24.1" in conference_output
+    # 非目标年份、非目标会议和论文集记录不导入
+    for text in outputs.values():
+        assert "Fibonacci Hashing on a Blockchain Ledger." not in text
+        assert "Fibonacci Blockchain Kernels." not in text
+        assert "Proceedings of FAST 2024" not in text
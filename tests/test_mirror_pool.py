@@ -0,0 +1,145 @@
+"""
+dblp镜像调度测试
+使用 benchmarks/fixtures.serve_site 在本地启动替身镜像：始终返回503的故障镜像、响应时间可在测试中切换的慢镜像，
+以及只在某个页面的第一次请求时卡住的镜像，检查故障转移、熔断（打开、冷却后试探、恢复）和按P95延迟发送的对冲请求
+"""
+import os
+import sys
+import threading
+import time
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from fixtures import serve_site
+from crawlers.mirror_pool import MirrorPool
+from crawlers.rate_limiter import RateLimiter
+
+SITE = {"/db/page.html": b"<html>page</html>", "/db/stall.html": b"<html>stall</html>"}
+PAGE_URL = "https://dblp.org/db/page.html"
+STALL_URL = "https://dblp.org/db/stall.html"
+
+
+def site_factory(base_url):
+    return SITE
+
+def send(url):
+    return requests.get(url, timeout=10)
+
+def test_failover_to_next_mirror():
+    with serve_site(site_factory, status=503) as failing, serve_site(site_factory) as healthy:
+        pool = MirrorPool([failing, healthy], hedge=False)
+        try:
+            response = pool.fetch(PAGE_URL, send)
+            assert response.status_code == 200
+            assert response.url == healthy + "/db/page.html"
+            bad, good = pool.mirrors
+            assert (bad.failures, bad.requests) == (1, 1)
+            assert (good.failures, good.requests) == (0, 1)
+        finally:
+            pool.close()
+
+def test_all_mirrors_failing_returns_last_response():
+    with serve_site(site_factory, status=503) as first, serve_site(site_factory, status=503) as second:
+        pool = MirrorPool([first, second], hedge=False)
+        try:
+            assert pool.fetch(PAGE_URL, send).status_code == 503
+            assert [mirror.requests for mirror in pool.mirrors] == [1, 1]
+        finally:
+            pool.close()
+
+def test_breaker_opens_probes_and_recovers():
+    delay = [0.3]
+    with serve_site(site_factory, latency=lambda path: delay[0]) as flaky:
+        pool = MirrorPool([flaky], failure_threshold=2, cooldown=0.5, slow_seconds=0.1)
+        mirror = pool.mirrors[0]
+        try:
+            # 连续两次慢响应后熔断
+            pool.fetch(PAGE_URL, send)
+            assert mirror.failures == 1 and pool.breaker_opens == 0
+            pool.fetch(PAGE_URL, send)
+            assert mirror.failures == 2 and pool.breaker_opens == 1
+            assert mirror.is_open(time.monotonic())
+
+            # 冷却后放行一个试探请求，试探返回前镜像仍视为熔断中；试探失败时立即重新熔断
+            time.sleep(pool.cooldown)
+            assert not mirror.is_open(time.monotonic())
+            probe = threading.Thread(target=pool.fetch, args=(PAGE_URL, send))
+            probe.start()
+            time.sleep(0.1)
+            assert mirror.probing and mirror.is_open(time.monotonic())
+            probe.join()
+            assert not mirror.probing and pool.breaker_opens == 2
+            assert mirror.is_open(time.monotonic())
+
+            # 镜像恢复正常后，下一次试探成功即关闭熔断
+            delay[0] = 0.0
+            time.sleep(pool.cooldown)
+            assert pool.fetch(PAGE_URL, send).status_code == 200
+            assert mirror.failures == 0 and mirror.open_until == 0.0
+            assert not mirror.is_open(time.monotonic())
+        finally:
+            pool.close()
+
+def test_open_mirror_is_skipped_until_cooldown():
+    with serve_site(site_factory, status=503) as failing, serve_site(site_factory) as healthy:
+        pool = MirrorPool([failing, healthy], failure_threshold=1, cooldown=60, hedge=False)
+        try:
+            pool.fetch(PAGE_URL, send)
+            assert pool.breaker_opens == 1
+            for _ in range(3):
+                assert pool.fetch(PAGE_URL, send).status_code == 200
+            assert [mirror.requests for mirror in pool.mirrors] == [1, 4]
+        finally:
+            pool.close()
+
+def test_hedge_sent_after_p95_delay():
+    arrivals = []
+    lock = threading.Lock()
+
+    def latency(path):
+        # 卡住的页面只在第一次请求时卡住，对冲请求无论发往哪个镜像都会很快返回
+        with lock:
+            if path == "/db/stall.html":
+                arrivals.append(time.perf_counter())
+                return 2.0 if len(arrivals) == 1 else 0.02
+        return 0.02
+
+    with serve_site(site_factory, latency=latency) as first, serve_site(site_factory, latency=latency) as second:
+        pool = MirrorPool([first, second], hedge=True, hedge_min_samples=10, hedge_default_delay=5.0,
+                          hedge_min_delay=0.01)
+        try:
+            for _ in range(10):
+                pool.fetch(PAGE_URL, send)
+            assert pool.hedged == 0
+            delay = pool.hedge_delay()
+            assert 0.02 <= delay < 0.5
+
+            start = time.perf_counter()
+            response = pool.fetch(STALL_URL, send)
+            elapsed = time.perf_counter() - start
+            assert response.status_code == 200 and response.content == SITE["/db/stall.html"]
+            assert (pool.hedged, pool.hedge_wins) == (1, 1)
+            assert len(arrivals) == 2
+            # 对冲请求在主请求发出后经过P95延迟才发送，且无需等待卡住的请求
+            assert arrivals[1] - arrivals[0] >= delay * 0.9
+            assert elapsed < 1.0
+            assert {mirror.requests for mirror in pool.mirrors} == {6}
+        finally:
+            pool.close()
+
+def test_rate_limit_wait_chooses_idle_mirror_and_is_not_latency():
+    with serve_site(site_factory) as first, serve_site(site_factory) as second:
+        limiter = RateLimiter(rate=2, burst=1)
+        pool = MirrorPool([first, second], hedge=False)
+        try:
+            for _ in range(4):
+                assert pool.fetch(PAGE_URL, send, limiter).status_code == 200
+            # 令牌用完的镜像需要等待，下一个请求选择可立即发送的镜像
+            assert [mirror.requests for mirror in pool.mirrors] == [2, 2]
+            assert limiter.total_wait > 0
+            # 本地等待令牌的时间不计入延迟样本
+            assert max(pool._latencies) < 0.2
+        finally:
+            pool.close()
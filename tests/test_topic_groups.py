@@ -0,0 +1,22 @@
+"""
+专题分组测试：多进程并行时，包含同一页面的专题必须分到同一组，在一个子进程中按顺序处理
+"""
+from main import group_topics
+
+
+def test_group_topics_by_canonical_link():
+    topics = [
+        ("体系结构", (["https://dblp.org/db/journals/tocs/", "https://dblp.org/db/journals/tos/"], [])),
+        ("存储", ([], ["https://dblp.org/db/conf/fast/"])),
+        # 同一期刊的不同写法：镜像主机、http协议、末尾的index.html
+        ("网络", (["http://dblp.uni-trier.de/db/journals/tos/index.html"], [])),
+    ]
+    assert group_topics(topics) == [[topics[0], topics[2]], [topics[1]]]
+
+def test_group_topics_merges_transitively():
+    topics = [
+        ("甲", (["https://dblp.org/db/journals/tocs/"], [])),
+        ("乙", ([], ["https://dblp.org/db/conf/fast/"])),
+        ("丙", (["https://dblp.org/db/journals/tocs/index.html"], ["https://dblp.org/db/conf/fast/#top"])),
+    ]
+    assert group_topics(topics) == [topics]